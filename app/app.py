@@ -14,15 +14,28 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 import streamlit as st
 from streamlit_js_eval import streamlit_js_eval
-from streamlit_autorefresh import st_autorefresh
 from dotenv import load_dotenv
 
-from src.scoring import load_player_positions, score_team_position_totals, score_events
-from src.domain.teams import canonicalize_team_column
-from src.app_io import read_csv_safe, load_playoff_game_ids, normalize_scoring_df
+from src.scoring import build_scoring_result, load_player_positions
+from src.scoring.incremental import state_paths
+from src.app_io import (
+    file_version,
+    load_eliminated_teams,
+    load_incremental_scoring,
+    load_playoff_game_ids,
+    load_scoreboard_snapshot,
+    load_scoring_plays,
+    read_csv_safe,
+    scoring_plays_version,
+)
 from src.scoreboard import build_scoreboard_dataset
-from src.refresh import refresh_playoff_games, RefreshInProgress
-from src.playoffs import compute_eliminated_teams
+from src.snapshot import SnapshotSources
+from src.refresh import (
+    RefreshInProgress,
+    read_refresher_heartbeat,
+    refresh_playoff_games,
+    refresher_heartbeat_path,
+)
 from src.ui_sections import (
     section_event_feed,
     section_scoreboard_round_grid
@@ -47,7 +60,7 @@ CONFIG = ROOT / "data" / "config"
 PROCESSED = ROOT / "data" / "processed"
 
 SCORING = PROCESSED / "scoring_plays.csv"
-LATEST = PROCESSED / "scoring_plays_latest.csv"
+SCORING_STORE = PROCESSED / "scoring_plays_store"
 STATUS = PROCESSED / "refresh_status.csv"
 LOG = PROCESSED / "refresh_log.csv"
 
@@ -58,10 +71,14 @@ POS_CACHE = PROCESSED / f"player_positions_{BBB_SEASON}.csv"
 REFRESH_LOCK = PROCESSED / ".refresh.lock"
 REFRESH_METRICS = PROCESSED / f"pbp_metrics_latest_{BBB_SEASON}.csv"
 REFRESH_STATE = PROCESSED / f"game_refresh_state_{BBB_SEASON}.csv"
+ELIMINATED = PROCESSED / f"eliminated_teams_{BBB_SEASON}.csv"
+REFRESHER_HEARTBEAT = refresher_heartbeat_path(PROCESSED)
+SNAPSHOT_SOURCES = SnapshotSources.default(season=BBB_SEASON, processed_dir=PROCESSED, config_dir=CONFIG)
 
 SCORING_PLAYS_PATH = PROCESSED / "scoring_plays.csv"
 
 DEFAULT_TZ = "America/Chicago"  # fallback if detection fails
+MOBILE_BREAKPOINT_PX = 768
 
 # -------------------------
 # Small helpers (cached)
@@ -70,6 +87,12 @@ DEFAULT_TZ = "America/Chicago"  # fallback if detection fails
 def load_positions(cache_path: Path) -> pd.DataFrame:
     return load_player_positions(cache_path)
 
+
+@st.fragment
+def event_feed_fragment(events: pd.DataFrame, draft_df: pd.DataFrame, version: str | None = None) -> None:
+    # Filter changes rerun only this fragment, not the scoreboard above it.
+    section_event_feed(events, draft_df=draft_df, team_filter=True, version=version)
+
 # --- Toast + layout CSS (inject once) ---
 st.markdown(
     """
@@ -159,31 +182,39 @@ def _get_user_timezone() -> str:
 
 
 
-def _get_viewport_width() -> int | None:
+# Client-side breakpoint switch: the JS reports the current layout class once, then
+# a resize listener on the parent page pushes a new value only when the viewport
+# crosses MOBILE_BREAKPOINT_PX. Each push triggers one rerun; no polling.
+_LAYOUT_PROBE_JS = f"""
+(function () {{
+  const bp = {MOBILE_BREAKPOINT_PX};
+  let host = window;
+  try {{ host = window.parent; void host.innerWidth; }} catch (e) {{ host = window; }}
+  const cls = () => (host.innerWidth < bp ? "mobile" : "desktop");
+  let last = cls();
+  host.addEventListener("resize", function () {{
+    const now = cls();
+    if (now !== last) {{
+      last = now;
+      sendDataToPython({{ value: now, dataType: "json" }});
+    }}
+  }});
+  return last;
+}})()
+"""
+
+
+def _get_is_mobile() -> bool:
     """
-    Re-check viewport width on each run.
-    Streamlit doesn't rerun automatically on resize, but this prevents stale caching.
+    True when the browser viewport is below MOBILE_BREAKPOINT_PX.
+    Falls back to the last known value (then desktop) until the probe reports.
     """
-    vw = streamlit_js_eval(
-        js_expressions="window.innerWidth",
-        key="detect_viewport_width",
-    )
+    layout = streamlit_js_eval(js_expressions=_LAYOUT_PROBE_JS, key="detect_layout_class")
 
-    try:
-        vw_int = int(vw) if vw is not None else None
-    except Exception:
-        vw_int = None
-
-    # Cache latest good value for fallbacks
-    if vw_int is not None and vw_int > 0:
-        st.session_state["viewport_width"] = vw_int
-        return vw_int
-
-    cached = st.session_state.get("viewport_width")
-    if isinstance(cached, int) and cached > 0:
-        return cached
+    if layout in ("mobile", "desktop"):
+        st.session_state["layout_class"] = layout
 
-    return None
+    return st.session_state.get("layout_class", "desktop") == "mobile"
 
 
 def _format_utc_iso_to_tz(ts_utc: str | None, tz_name: str) -> str | None:
@@ -251,37 +282,15 @@ def _get_last_refresh_at(refresh_state_path: Path) -> str | None:
         return None
 
 # --- Top bar: simple refresh control (stable) ---
+# While the background refresher (python -m src.refresh --daemon) is alive it
+# owns refreshes and the app stays read-only.
+REFRESHER = read_refresher_heartbeat(REFRESHER_HEARTBEAT)
+
 raw_refresh_at = _get_last_refresh_at(REFRESH_STATE)
+if raw_refresh_at is None and REFRESHER is not None:
+    raw_refresh_at = (REFRESHER.get("last_refresh") or {}).get("at")
 user_tz = _get_user_timezone()
-def _get_viewport_width() -> int | None:
-    """
-    Re-check viewport width each run. Cache last known value only as a fallback.
-    """
-    vw = streamlit_js_eval(
-        js_expressions="window.innerWidth",
-        key="detect_viewport_width",
-    )
-
-    try:
-        vw_int = int(vw) if vw is not None else None
-    except Exception:
-        vw_int = None
-
-    if vw_int is not None and vw_int > 0:
-        st.session_state["viewport_width"] = vw_int
-        return vw_int
-
-    cached = st.session_state.get("viewport_width")
-    if isinstance(cached, int) and cached > 0:
-        return cached
-
-    return None
-
-VIEWPORT_WIDTH = _get_viewport_width()
-# Lightweight periodic rerun so viewport changes are detected automatically.
-# 2000ms is a good balance; increase if you want less frequent.
-st_autorefresh(interval=2000, key="viewport_autorefresh")
-IS_MOBILE = (VIEWPORT_WIDTH or 9999) < 768
+IS_MOBILE = _get_is_mobile()
 
 formatted_refresh_at = _format_utc_iso_to_tz(raw_refresh_at, user_tz)
 
@@ -295,6 +304,12 @@ sub_text = (
     if formatted_refresh_at
     else "Press button to populate scores"
 )
+if REFRESHER is not None:
+    sub_text = (
+        f"Auto-refreshing · last refreshed at {formatted_refresh_at}"
+        if formatted_refresh_at
+        else "Auto-refreshing"
+    )
 
 topbar = st.container()
 with topbar:
@@ -339,7 +354,7 @@ with topbar:
         spacer, btn_col = st.columns([3, 2])
 
         with btn_col:
-            if st.button("Refresh Scores", type="primary", key="refresh_scores"):
+            if REFRESHER is None and st.button("Refresh Scores", type="primary", key="refresh_scores"):
                 result = None
 
                 with st.spinner("Refreshing scores…"):
@@ -352,6 +367,8 @@ with topbar:
                             state_path=REFRESH_STATE,
                             lock_path=REFRESH_LOCK,
                             inactive_seconds=60 * 60,
+                            eliminated_out_path=ELIMINATED,
+                            snapshot_sources=SNAPSHOT_SOURCES,
                         )
                     except RefreshInProgress:
                         bbb_toast(
@@ -397,6 +414,26 @@ with topbar:
 )
 
 
+# -------------------------
+# Fast path: render the snapshot written at refresh time when it is current
+# -------------------------
+snapshot = load_scoreboard_snapshot(
+    SNAPSHOT_SOURCES.snapshot_path,
+    version=file_version(SNAPSHOT_SOURCES.snapshot_path),
+)
+if snapshot is not None and snapshot.is_current(SNAPSHOT_SOURCES):
+    section_scoreboard_round_grid(
+        snapshot.scoreboard,
+        is_mobile=IS_MOBILE,
+        eliminated_teams=set(snapshot.eliminated),
+        version=snapshot.version,
+    )
+    st.markdown("<div style='height: 24px;'></div>", unsafe_allow_html=True)
+    if not IS_MOBILE:
+        # Owners are already joined into the snapshot feed.
+        event_feed_fragment(snapshot.feed, pd.DataFrame(), snapshot.version)
+    st.stop()
+
 # -------------------------
 # Load draft (scoreboard must render even if no scoring yet)
 # -------------------------
@@ -409,7 +446,12 @@ if "__read_error__" in draft_df.columns:
 totals = pd.DataFrame(columns=["team", "position", "pts"])
 events = pd.DataFrame()
 
-eliminated = compute_eliminated_teams(season=BBB_SEASON, playoff_game_ids=playoff_game_ids)
+eliminated = load_eliminated_teams(
+    ELIMINATED,
+    season=BBB_SEASON,
+    playoff_game_ids=frozenset(playoff_game_ids),
+    version=file_version(ELIMINATED),
+)
 
 if draft_df.empty:
     st.warning(
@@ -423,11 +465,16 @@ else:
 # -------------------------
 # Read + normalize scoring plays
 # -------------------------
-df_scoring = read_csv_safe(SCORING)
+SCORING_VERSION = scoring_plays_version(SCORING_STORE, SCORING)
+df_scoring = load_scoring_plays(
+    SCORING,
+    version=SCORING_VERSION,
+    store_dir=SCORING_STORE,
+    game_ids=frozenset(playoff_game_ids) or None,
+)
 if "__read_error__" in df_scoring.columns:
     st.warning(df_scoring.loc[0, "__read_error__"])
     df_scoring = pd.DataFrame()
-df_scoring = normalize_scoring_df(df_scoring)
 
 # If no scoring plays yet: show scoreboard (0s) + empty event feed, then stop
 if df_scoring.empty:
@@ -444,7 +491,7 @@ if df_scoring.empty:
 
     # The play feed is desktop-only.
     if not IS_MOBILE:
-        section_event_feed(events, draft_df=draft_df, team_filter=True)
+        event_feed_fragment(events, draft_df)
 
     st.stop()
 # -------------------------
@@ -459,7 +506,7 @@ if not playoff_game_ids:
         scoreboard = build_scoreboard_dataset(draft_df, totals, season=BBB_SEASON, validate=True)
     section_scoreboard_round_grid(scoreboard, is_mobile=IS_MOBILE, eliminated_teams=eliminated)
     if not IS_MOBILE:
-        section_event_feed(events, draft_df=draft_df, team_filter=True)
+        event_feed_fragment(events, draft_df)
     st.stop()
 
 if not POS_CACHE.exists():
@@ -468,7 +515,7 @@ if not POS_CACHE.exists():
         scoreboard = build_scoreboard_dataset(draft_df, totals, season=BBB_SEASON, validate=True)
     section_scoreboard_round_grid(scoreboard, is_mobile=IS_MOBILE, eliminated_teams=eliminated)
     if not IS_MOBILE:
-        section_event_feed(events, draft_df=draft_df, team_filter=True)
+        event_feed_fragment(events, draft_df)
     st.stop()
 
 positions = load_positions(POS_CACHE)
@@ -477,24 +524,28 @@ positions = load_positions(POS_CACHE)
 # -------------------------
 # Compute totals + events
 # -------------------------
-totals = score_team_position_totals(
-    df_scoring,
-    positions,
+# Prefer the incrementally maintained state written at refresh; otherwise one
+# engine pass, memoized on (data versions, rules, scope)
+scoring_result = load_incremental_scoring(
+    PROCESSED,
     season=BBB_SEASON,
-    week_max=None,
-    game_ids=playoff_game_ids,
+    game_ids=frozenset(playoff_game_ids),
+    plays_version=SCORING_VERSION,
+    positions_version=file_version(POS_CACHE),
+    state_version=file_version(state_paths(PROCESSED, BBB_SEASON)[2]),
 )
-
-events = score_events(
-    df_scoring,
-    positions,
-    season=BBB_SEASON,
-    week_max=None,
-    game_ids=playoff_game_ids,
-)
-
-# Canonicalize team abbreviations for consistent joins/display
-events = canonicalize_team_column(events, "team")
+if scoring_result is None:
+    scoring_result = build_scoring_result(
+        df_scoring,
+        positions,
+        season=BBB_SEASON,
+        week_max=None,
+        game_ids=playoff_game_ids,
+        scoring_version=SCORING_VERSION,
+        positions_version=file_version(POS_CACHE),
+    )
+totals = scoring_result.totals
+events = scoring_result.feed
 
 # -------------------------
 # Build + render scoreboard ONCE (now with points)
@@ -511,4 +562,4 @@ if not draft_df.empty:
 st.markdown("<div style='height: 24px;'></div>", unsafe_allow_html=True)
 
 if not IS_MOBILE:
-    section_event_feed(events, draft_df=draft_df, team_filter=True)
\ No newline at end of file
+    event_feed_fragment(events, draft_df, f"{scoring_result.fingerprint}:{file_version(DRAFT_PICKS)}")
\ No newline at end of file
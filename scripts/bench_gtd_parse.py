@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GTD play-by-play parsing, legacy row-dict parser vs. the columnar
+src.pbp.live_pbp.gtd_game_to_pbp_df.
+
+- legacy:   one ~35-key dict per play (mostly pd.NA), pd.DataFrame(rows), then
+            to_numeric/astype passes; no player ids (compared without them)
+- columnar: typed column buffers filled in one walk over the drives, with
+            constant columns broadcast
+- poll:     columnar with a DriveCache warmed on the same document minus its
+            last play, i.e. a live re-poll where only the last drive changed
+
+Reports the median time and the peak traced allocation (tracemalloc) per parse.
+By default it parses a synthetic GTD-shaped document (--plays plays in drives of
+about 7); pass a recorded document with --gtd.
+
+    python scripts/bench_gtd_parse.py
+    python scripts/bench_gtd_parse.py --gtd 2025011200_gtd.json --event_id 2025011200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from src.pbp.live_pbp import (  # noqa: E402
+    _PARTICIPANT_COLUMNS,
+    _SCORING_FIELDS,
+    DriveCache,
+    _extract_game_blob,
+    _safe_int,
+    _safe_str,
+    _scoring_fields,
+    gtd_game_to_pbp_df,
+)
+
+GAME_ID = "2024_19_DEN_BUF"
+EVENT_ID = "2025011200"
+REFRESHED_AT = "2025-01-12T20:00:00Z"
+
+
+def synthetic_gtd(n_plays: int, *, event_id: str = EVENT_ID, seed: int = 0) -> dict:
+    """
+    GTD-shaped document: drives keyed by number, plays keyed by play id, each
+    play with the fields the parser reads plus a players block like the feed's.
+    """
+    rng = random.Random(seed)
+    drives: Dict[str, Any] = {}
+    play_id, dnum, left = 40, 0, n_plays
+    while left > 0:
+        dnum += 1
+        pos, dfn = ("BUF", "DEN") if dnum % 2 else ("DEN", "BUF")
+        plays: Dict[str, Any] = {}
+        for _ in range(min(left, rng.randint(3, 11))):
+            left -= 1
+            play_id += rng.randint(15, 35)
+            kind = rng.choice(["pass", "pass", "run", "run", "punt", "td", "fg", "xp"])
+            desc, stats = {
+                "pass": ("(12:04) J.Allen pass short right to K.Shakir to DEN 41 for 7 yards (P.Surtain).", (15, 21)),
+                "run": ("(11:20) J.Cook up the middle to DEN 38 for 3 yards (Z.Allen).", (10,)),
+                "punt": ("(4:02) R.Araiza punts 48 yards to DEN 12, Center-R.Ferguson.", (2,)),
+                "td": ("(2:11) J.Allen pass short left to D.Kincaid for 9 yards, TOUCHDOWN.", (16, 22)),
+                "fg": ("(0:03) T.Bass 41 yard field goal is GOOD, Center-R.Ferguson.", (70,)),
+                "xp": ("T.Bass extra point is GOOD, Center-R.Ferguson.", (72,)),
+            }[kind]
+            plays[str(play_id)] = {
+                "playId": play_id,
+                "qtr": min(4, 1 + play_id // (10 * n_plays)),
+                "time": f"{rng.randint(0, 14):02d}:{rng.randint(0, 59):02d}",
+                "possessionTeam": pos,
+                "defensiveTeam": dfn,
+                "playType": "pass" if kind in ("pass", "td") else kind,
+                "down": rng.randint(1, 4),
+                "ydstogo": rng.randint(1, 10),
+                "yrdln": f"{dfn} {rng.randint(1, 49)}",
+                "desc": desc,
+                "scoringPlayType": {"td": "TD", "fg": "FG", "xp": "XP"}.get(kind, ""),
+                "players": {
+                    f"00-00{pos}{stat:03d}": [
+                        {"sequence": i + 1, "clubcode": pos, "playerName": f"{pos}.P{stat}", "statId": stat, "yards": 9}
+                    ]
+                    for i, stat in enumerate(stats)
+                },
+            }
+        drives[str(dnum)] = {"driveNum": dnum, "posteam": pos, "qtr": 1, "plays": plays}
+    game = {"gameDate": "2025-01-12", "drives": drives, "home": {"abbr": "BUF"}, "away": {"abbr": "DEN"}, "qtr": "Final"}
+    return {event_id: game}
+
+
+def without_last_play(gtd: dict, event_id: str) -> dict:
+    """
+    Copy of the document as it looked one poll earlier.
+    """
+    game = dict(_extract_game_blob(gtd, event_id))
+    drives = dict(game.get("drives") or {})
+    key = [k for k, v in drives.items() if isinstance(v, dict) and v.get("plays")][-1]
+    plays = dict(drives[key]["plays"])
+    plays.pop(list(plays)[-1])
+    drives[key] = {**drives[key], "plays": plays}
+    game["drives"] = drives
+    return {event_id: game}
+
+
+def legacy_gtd_game_to_pbp_df(game_id: str, event_id: str, gtd: Dict[str, Any], refreshed_at: str) -> pd.DataFrame:
+    game = _extract_game_blob(gtd, event_id)
+    if not game:
+        return pd.DataFrame()
+
+    rows: List[Dict[str, Any]] = []
+    for drive in (v for v in (game.get("drives") or {}).values() if isinstance(v, dict) and "plays" in v):
+        plays = drive.get("plays")
+        if not isinstance(plays, dict):
+            continue
+        for play in plays.values():
+            if not isinstance(play, dict):
+                continue
+            base = {
+                "refreshed_at": refreshed_at,
+                "season": pd.NA,
+                "week": pd.NA,
+                "game_id": game_id,
+                "game_date": _safe_str(game.get("gameDate")) or _safe_str(game.get("startTime")),
+                "posteam": _safe_str(play.get("possessionTeam")) or _safe_str(play.get("posteam")),
+                "defteam": _safe_str(play.get("defensiveTeam")) or _safe_str(play.get("defteam")),
+                "qtr": _safe_int(play.get("qtr")),
+                "time": _safe_str(play.get("time")) or _safe_str(play.get("clock")),
+                "drive": _safe_int(drive.get("driveNum") or drive.get("drive_num") or drive.get("drive")),
+                "play_id": _safe_int(play.get("playId") or play.get("play_id")),
+                "desc": _safe_str(play.get("desc")),
+                "play_type": _safe_str(play.get("playType")) or _safe_str(play.get("play_type")),
+                "pass": pd.NA,
+                "rush": pd.NA,
+                "qb_dropback": pd.NA,
+                "sack": pd.NA,
+                "interception": pd.NA,
+                "fumble_lost": pd.NA,
+                "return_team": pd.NA,
+                "passer_player_id": pd.NA,
+                "passer_player_name": pd.NA,
+                "receiver_player_id": pd.NA,
+                "receiver_player_name": pd.NA,
+                "rusher_player_id": pd.NA,
+                "rusher_player_name": pd.NA,
+                "kicker_player_id": pd.NA,
+                "kicker_player_name": pd.NA,
+            }
+            base.update(dict(zip(_SCORING_FIELDS, _scoring_fields(play))))
+            rows.append(base)
+
+    if not rows:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(rows)
+    df["game_id"] = df["game_id"].astype("string")
+    for c in ("play_id", "qtr", "drive"):
+        df[c] = pd.to_numeric(df[c], errors="coerce").astype("Int64")
+    for c in ("touchdown", "safety", "defensive_two_point_conv"):
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype("Int64")
+    for c in ("field_goal_result", "extra_point_result", "two_point_conv_result"):
+        df[c] = df[c].astype("string")
+    for c in ("pass_touchdown", "rush_touchdown"):
+        df[c] = df[c].fillna(False).astype(bool)
+    return df
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def _peak_alloc_kb(fn) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--gtd", type=str, default="", help="recorded GTD JSON document")
+    p.add_argument("--event_id", type=str, default=EVENT_ID)
+    p.add_argument("--plays", type=int, default=180)
+    p.add_argument("--repeat", type=int, default=50)
+    args = p.parse_args()
+
+    gtd = json.loads(Path(args.gtd).read_text(encoding="utf-8")) if args.gtd else synthetic_gtd(args.plays, event_id=args.event_id)
+
+    warm = DriveCache()
+    gtd_game_to_pbp_df(GAME_ID, args.event_id, without_last_play(gtd, args.event_id), REFRESHED_AT, drive_cache=warm)
+    warm_drives = warm.get(args.event_id)
+
+    def poll(game_id: str, event_id: str, doc: dict, refreshed_at: str) -> pd.DataFrame:
+        cache = DriveCache()
+        cache.put(event_id, dict(warm_drives))
+        return gtd_game_to_pbp_df(game_id, event_id, doc, refreshed_at, drive_cache=cache)
+
+    parsers = {"legacy": legacy_gtd_game_to_pbp_df, "columnar": gtd_game_to_pbp_df, "poll": poll}
+
+    expected = legacy_gtd_game_to_pbp_df(GAME_ID, args.event_id, gtd, REFRESHED_AT)
+    for name, parse in parsers.items():
+        df = parse(GAME_ID, args.event_id, gtd, REFRESHED_AT)
+        same = [c for c in expected.columns if c not in _PARTICIPANT_COLUMNS]
+        pd.testing.assert_frame_equal(df[same], expected[same])
+
+        def run(parse=parse) -> None:
+            parse(GAME_ID, args.event_id, gtd, REFRESHED_AT)
+
+        run()  # warm up
+        print(
+            json.dumps(
+                {
+                    "variant": name,
+                    "plays": int(len(df)),
+                    "seconds": round(_time(run, args.repeat), 6),
+                    "peak_alloc_kb": _peak_alloc_kb(run),
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full-season pandas conversion vs. column-projected, game-filtered load.
+
+Each mode runs in a fresh subprocess so peak RSS is measured independently.
+
+    python scripts/bench_nflreadpy_pbp.py                 # synthetic season (~50k x 370)
+    python scripts/bench_nflreadpy_pbp.py --season 2024   # real nflverse release (network)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.pbp.scoring_plays import PBP_SOURCE_COLUMNS  # noqa: E402
+
+N_ROWS = 50_000
+N_EXTRA_COLS = 370 - len(PBP_SOURCE_COLUMNS)
+PLAYOFF_GAMES = 6
+
+
+def _game_ids(season: int) -> list[str]:
+    return [f"{season}_{wk:02d}_A{g:02d}_H{g:02d}" for wk in range(1, 20) for g in range(16)]
+
+
+def build_synthetic_season(path: Path, season: int) -> list[str]:
+    import numpy as np
+    import polars as pl
+
+    rng = np.random.default_rng(0)
+    gids = _game_ids(season)
+    game_col = np.array(gids)[rng.integers(0, len(gids), N_ROWS)]
+
+    cols: dict[str, object] = {}
+    for c in PBP_SOURCE_COLUMNS:
+        if c.endswith(("_id", "_name", "_result")) or c in {"desc", "posteam", "defteam", "time", "play_type", "game_date", "return_team"}:
+            cols[c] = rng.choice(["alpha", "bravo", "charlie", ""], N_ROWS)
+        else:
+            cols[c] = rng.integers(0, 2, N_ROWS).astype("float64")
+    for i in range(N_EXTRA_COLS):
+        cols[f"extra_{i}"] = (
+            rng.choice(["x" * 12, "y" * 20, ""], N_ROWS) if i % 4 == 0 else rng.random(N_ROWS)
+        )
+    cols["game_id"] = game_col
+    cols["play_id"] = np.arange(N_ROWS, dtype="float64")
+    cols["season"] = np.full(N_ROWS, season)
+
+    pl.DataFrame(cols).write_parquet(path)
+    return [g for g in gids if g.split("_")[1] == "19"][:PLAYOFF_GAMES]
+
+
+def _rss_mb() -> float | None:
+    """Current resident set size (Linux only)."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def _child(mode: str, parquet: str | None, season: int, game_ids: list[str]) -> None:
+    import polars as pl
+
+    from src.pbp.nflreadpy_pbp import scan_season_pbp, select_pbp_for_game_ids
+
+    t0 = time.perf_counter()
+    if parquet:
+        eager = pl.read_parquet(parquet)
+        lf = eager.lazy()
+    else:
+        lf, _ = scan_season_pbp(season)
+        eager = None
+    rss_loaded = _rss_mb()
+
+    if mode == "full":
+        frame = eager if eager is not None else lf.collect()
+        pbp = frame.to_pandas()
+        pbp = pbp.loc[pbp["game_id"].isin(game_ids)].copy()
+    else:
+        pbp = select_pbp_for_game_ids(lf, game_ids)
+
+    elapsed = time.perf_counter() - t0
+    print(
+        json.dumps(
+            {
+                "mode": mode,
+                "seconds": round(elapsed, 3),
+                "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+                "rss_added_mb": None if rss_loaded is None else round((_rss_mb() or 0) - rss_loaded, 1),
+                "rows": int(len(pbp)),
+                "cols": int(pbp.shape[1]),
+            }
+        )
+    )
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--season", type=int, default=None, help="Use the real nflverse release for this season")
+    p.add_argument("--game_ids", type=str, default="", help="Comma-separated game_ids (real-season mode)")
+    p.add_argument("--_child", dest="child", type=str, default=None, help=argparse.SUPPRESS)
+    p.add_argument("--_parquet", dest="parquet", type=str, default=None, help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    game_ids = [g.strip() for g in args.game_ids.split(",") if g.strip()]
+
+    if args.child:
+        _child(args.child, args.parquet, args.season or 0, game_ids)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        parquet = None
+        season = args.season
+        if season is None:
+            season = 2024
+            parquet = str(Path(tmp) / "season.parquet")
+            game_ids = build_synthetic_season(Path(parquet), season)
+        elif not game_ids:
+            raise SystemExit("--game_ids is required with --season")
+
+        for mode in ("full", "projected"):
+            cmd = [sys.executable, __file__, "--_child", mode, "--season", str(season), "--game_ids", ",".join(game_ids)]
+            if parquet:
+                cmd += ["--_parquet", parquet]
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            print(out.stdout.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: whole-archive upsert vs. game-scoped upsert of one refresh batch.
+
+Builds a synthetic multi-season scoring-plays archive, then applies a batch for
+one live game (a few updated plays plus new ones) with each variant:
+
+- global_csv:    legacy refresh path (read cumulative CSV, upsert_latest_wins, write CSV x2)
+- global_memory: upsert_latest_wins over the in-memory archive
+- scoped_memory: upsert_games over the in-memory archive
+- scoped_store:  read the batch's partitions from the store, upsert_game_snapshots, write them back
+- csv_export:    the compatibility CSV export refresh_pbp still writes afterwards
+
+    python scripts/bench_upsert.py                       # 10 seasons x 285 games x 12 plays
+    python scripts/bench_upsert.py --seasons 20 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from src.pbp.scoring_plays import SCORING_PLAYS_DTYPES  # noqa: E402
+from src.pbp.store import ScoringPlayStore  # noqa: E402
+from src.pbp.upsert import upsert_game_snapshots, upsert_games, upsert_latest_wins  # noqa: E402
+
+GAMES_PER_SEASON = 285
+
+
+def build_archive(seasons: int, plays_per_game: int, *, first_season: int = 2024) -> pd.DataFrame:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    gids, season_col, week_col = [], [], []
+    for s in range(first_season - seasons + 1, first_season + 1):
+        for g in range(GAMES_PER_SEASON):
+            wk = g // 15 + 1
+            gids.append(f"{s}_{wk:02d}_A{g:03d}_H{g:03d}")
+            season_col.append(s)
+            week_col.append(wk)
+    n_games = len(gids)
+    n = n_games * plays_per_game
+
+    cols: dict[str, object] = {}
+    for c, dtype in SCORING_PLAYS_DTYPES.items():
+        if dtype == "bool":
+            cols[c] = rng.integers(0, 2, n).astype(bool)
+        elif dtype == "Int64":
+            cols[c] = rng.integers(0, 5, n)
+        else:
+            cols[c] = rng.choice(["alpha", "bravo", "charlie delta echo"], n)
+    cols["game_id"] = np.repeat(gids, plays_per_game)
+    cols["season"] = np.repeat(season_col, plays_per_game)
+    cols["week"] = np.repeat(week_col, plays_per_game)
+    cols["play_id"] = np.tile(np.arange(plays_per_game) * 40 + 50, n_games)
+    cols["refreshed_at"] = np.full(n, "2025-01-01T00:00:00")
+    return pd.DataFrame(cols).astype(SCORING_PLAYS_DTYPES)
+
+
+def build_batch(archive: pd.DataFrame, game_id: str) -> pd.DataFrame:
+    """
+    Every play of `game_id` re-sent (two of them changed) plus two new plays.
+    """
+    g = archive.loc[archive["game_id"] == game_id].copy()
+    g["refreshed_at"] = "2025-01-12T20:00:00"
+    g.loc[g.index[:2], "desc"] = "changed"
+    new = g.iloc[:2].copy()
+    new["play_id"] = new["play_id"] + 10_000
+    return pd.concat([g, new], ignore_index=True)
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--seasons", type=int, default=10)
+    p.add_argument("--plays_per_game", type=int, default=12)
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    archive = build_archive(args.seasons, args.plays_per_game)
+    live_game = archive["game_id"].iloc[-1]
+    batch = build_batch(archive, live_game)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        csv_path, latest_path = tmp / "scoring_plays.csv", tmp / "scoring_plays_latest.csv"
+        archive.to_csv(csv_path, index=False)
+        store = ScoringPlayStore(tmp / "store")
+        store.write_games(archive)
+
+        def global_csv() -> None:
+            combined = upsert_latest_wins(pd.read_csv(csv_path), batch)
+            combined.to_csv(csv_path, index=False)
+            combined.to_csv(latest_path, index=False)
+
+        def scoped_store() -> None:
+            merged, _, _ = upsert_game_snapshots(store.read([live_game]), batch, snapshot_game_ids=[live_game])
+            store.write_games(merged, game_ids=[live_game])
+
+        variants = {
+            "global_csv": global_csv,
+            "global_memory": lambda: upsert_latest_wins(archive, batch),
+            "scoped_memory": lambda: upsert_games(archive, batch),
+            "scoped_store": scoped_store,
+            "csv_export": lambda: store.export_csv(tmp / "export.csv"),
+        }
+        for name, fn in variants.items():
+            print(
+                json.dumps(
+                    {
+                        "variant": name,
+                        "seconds": round(_time(fn, args.repeat), 4),
+                        "archive_rows": int(len(archive)),
+                        "batch_rows": int(len(batch)),
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: legacy per-row view building vs. the vectorized view models.
+
+Builds a synthetic league (14 owners x 6 rounds at scale 1, with
+--events_per_owner scoring credits each) and times, per scale:
+
+- grid_legacy:      iterrows() + row.to_dict() (owner_id, round) lookup and totals
+- grid_vectorized:  src.view_models.build_grid_view
+- feed_legacy:      owner merge, per-row .map/.apply display fields, lambda-list groupby
+- feed_vectorized:  build_feed_view + filter_feed (unfiltered)
+- feed_filter:      filter_feed on a prepared FeedView for one drafter (every matching play)
+- page_all:         feed_page (first page) on a prepared FeedView, no filter
+- page_drafter:     feed_page for one drafter (single index lookup)
+- page_drafter_pos: feed_page for one drafter + position (index intersection)
+
+    python scripts/bench_view_models.py                  # scales 1 and 10
+    python scripts/bench_view_models.py --scales 1,10,50 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from src.view_models import build_feed_view, build_grid_view, feed_page, filter_feed  # noqa: E402
+
+OWNERS = 14
+ROUNDS = 6
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "OTH"]
+
+
+def build_league(scale: int, events_per_owner: int) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    (draft, scoreboard, events). Every pick is a distinct (team, position) unit,
+    so larger scales need synthetic team codes.
+    """
+    rng = np.random.default_rng(0)
+    n_owners = OWNERS * scale
+    owner_id = np.repeat(np.arange(1, n_owners + 1), ROUNDS)
+    rnd = np.tile(np.arange(1, ROUNDS + 1), n_owners)
+    team = np.array([f"T{i // len(POSITIONS):03d}" for i in range(len(owner_id))])
+    position = np.array([POSITIONS[i % len(POSITIONS)] for i in range(len(owner_id))])
+    draft = pd.DataFrame(
+        {
+            "owner_id": owner_id,
+            "owner": [f"Owner {i:03d}" for i in owner_id],
+            "round": rnd,
+            "slot": rnd,
+            "team": team,
+            "position": position,
+        }
+    )
+    scoreboard = draft.assign(pts=rng.integers(0, 40, len(draft)), unit=draft["team"] + " " + draft["position"])
+
+    n = n_owners * events_per_owner
+    pick = rng.integers(0, len(draft), n)
+    game = rng.integers(0, 13, n)
+    events = pd.DataFrame(
+        {
+            "game_id": [f"2024_19_A{g:02d}_H{g:02d}" for g in game],
+            # Pairs of credits share a play, like a passing TD (QB + receiver)
+            "play_id": pd.array(np.arange(n) // 2 + 1, dtype="Int64"),
+            "game_date": "2025-01-12",
+            "qtr": pd.array(rng.integers(1, 5, n), dtype="Int64"),
+            "time": "07:30",
+            "team": team[pick],
+            "position": position[pick],
+            "pts": rng.integers(1, 7, n),
+            "reason": "td",
+            "desc": "synthetic play",
+        }
+    )
+    return draft, scoreboard, events
+
+
+def grid_legacy(scoreboard: pd.DataFrame) -> None:
+    lookup: dict[tuple[int, int], dict] = {}
+    for _, row in scoreboard.iterrows():
+        lookup[(int(row["owner_id"]), int(row["round"]))] = row.to_dict()
+    scoreboard.groupby("owner_id", as_index=False)["pts"].sum().set_index("owner_id")["pts"].to_dict()
+
+
+def feed_legacy(events: pd.DataFrame, draft_df: pd.DataFrame) -> pd.DataFrame:
+    view = events.copy()
+    owners = draft_df[["team", "position", "owner"]].drop_duplicates()
+    view = view.merge(owners, on=["team", "position"], how="left")
+    view["Play Description"] = view.get("desc", "")
+    view["Game Date"] = view.get("game_date", "")
+
+    def _game_from_gid(gid: str) -> str:
+        parts = str(gid or "").split("_")
+        return f"{parts[-2]} vs {parts[-1]}" if len(parts) >= 4 else ""
+
+    view["Game"] = view["game_id"].map(_game_from_gid)
+    view["Time"] = "Q" + view["qtr"].astype(str) + " " + view["time"].astype(str)
+    pts_display = pd.to_numeric(view.get("pts"), errors="coerce").map(lambda x: "" if pd.isna(x) else str(int(x)))
+    view["UnitScore"] = (
+        view["team"].astype(str) + " " + view["position"].astype(str) + ": " + pts_display.astype(str)
+        + " (" + view["owner"].fillna("").astype(str) + ")"
+    )
+    view["_play_key"] = view["game_id"].astype(str) + "|" + view["play_id"].astype(str)
+    view = view.sort_values(["team", "position", "owner"])
+    agg = view.groupby("_play_key", as_index=False).agg(
+        {
+            "Game Date": "first",
+            "Game": "first",
+            "Time": "first",
+            "Play Description": "first",
+            "UnitScore": lambda s: list(s),
+            "game_id": "first",
+            "play_id": "first",
+            "game_date": "first",
+        }
+    )
+    scores = agg["UnitScore"].apply(lambda vals: ([v for v in vals if v] + ["", ""])[:2])
+    agg["Score 1"] = scores.map(lambda x: x[0])
+    agg["Score 2"] = scores.map(lambda x: x[1])
+    agg = agg.sort_values(["game_date", "game_id", "play_id"], ascending=False)
+    return agg[["Game Date", "Game", "Time", "Play Description", "Score 1", "Score 2"]]
+
+
+def _time(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--scales", type=str, default="1,10")
+    p.add_argument("--events_per_owner", type=int, default=50)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    for scale in [int(s) for s in args.scales.split(",") if s.strip()]:
+        draft, scoreboard, events = build_league(scale, args.events_per_owner)
+
+        legacy = feed_legacy(events, draft).reset_index(drop=True)
+        vectorized = filter_feed(build_feed_view(events, draft)).reset_index(drop=True)
+        pd.testing.assert_frame_equal(legacy, vectorized, check_dtype=False)
+
+        prepared = build_feed_view(events, draft)
+        drafter = prepared.drafters[0]
+        variants = {
+            "grid_legacy": lambda: grid_legacy(scoreboard),
+            "grid_vectorized": lambda: build_grid_view(scoreboard),
+            "feed_legacy": lambda: feed_legacy(events, draft),
+            "feed_vectorized": lambda: filter_feed(build_feed_view(events, draft)),
+            "feed_filter": lambda: filter_feed(prepared, drafter=drafter),
+            "page_all": lambda: feed_page(prepared),
+            "page_drafter": lambda: feed_page(prepared, drafter=drafter),
+            "page_drafter_pos": lambda: feed_page(prepared, drafter=drafter, position="WR"),
+        }
+        for name, fn in variants.items():
+            print(
+                json.dumps(
+                    {
+                        "variant": name,
+                        "scale": scale,
+                        "seconds": round(_time(fn, args.repeat), 5),
+                        "owners": OWNERS * scale,
+                        "events": int(len(events)),
+                    }
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,22 @@ from pathlib import Path
 import pandas as pd
 import streamlit as st
 
+from src.pbp.store import ScoringPlayStore
+from src.playoffs import compute_eliminated_teams, read_eliminated_teams
+from src.scoring import ScoreRules, ScoringResult
+from src.scoring.incremental import load_scoring_state
+from src.snapshot import ScoreboardSnapshot, read_snapshot
+
+
+def file_version(path: Path) -> int:
+    """
+    Cheap data-version token for cache keys: mtime in ns, or 0 if missing.
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
 
 @st.cache_data(show_spinner=False)
 def read_csv_safe(path: Path) -> pd.DataFrame:
@@ -11,6 +27,10 @@ def read_csv_safe(path: Path) -> pd.DataFrame:
     Read a CSV safely for Streamlit (cached). Returns an empty DF if missing/empty,
     or a DF with __read_error__ column if parsing fails.
     """
+    return _read_csv_safe_uncached(path)
+
+
+def _read_csv_safe_uncached(path: Path) -> pd.DataFrame:
     if not path.exists():
         return pd.DataFrame()
     try:
@@ -47,6 +67,32 @@ def load_playoff_game_ids(path: Path) -> set[str]:
     return set(gids)
 
 
+@st.cache_data(show_spinner=False, ttl=15 * 60)
+def load_eliminated_teams(
+    path: Path,
+    *,
+    season: int,
+    playoff_game_ids: frozenset[str],
+    version: int,
+) -> set[str]:
+    """
+    Eliminated teams for the scoreboard (cached).
+
+    Normally this just reads the artifact written at refresh time; `version`
+    (see file_version) keys the cache so a new refresh is picked up. Until the
+    first refresh writes it, fall back to computing from the schedule; the TTL
+    keeps that to one schedule lookup per game-id set every 15 minutes.
+    """
+    teams = read_eliminated_teams(path)
+    if teams is not None:
+        return teams
+    try:
+        return compute_eliminated_teams(season=season, playoff_game_ids=playoff_game_ids)
+    except Exception:
+        # Schedule unavailable (e.g. offline): render without elimination shading.
+        return set()
+
+
 def _clean_player_id(s: pd.Series) -> pd.Series:
     return (
         s.fillna("")
@@ -57,6 +103,74 @@ def _clean_player_id(s: pd.Series) -> pd.Series:
     )
 
 
+def scoring_plays_version(store_dir: Path, csv_path: Path) -> int:
+    """
+    Data version of the scoring plays: the store's manifest version, or the
+    legacy CSV's mtime when no store exists yet.
+    """
+    return ScoringPlayStore(store_dir).version() or file_version(csv_path)
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_scoring_plays(
+    path: Path,
+    *,
+    version: int,
+    store_dir: Path | None = None,
+    game_ids: frozenset[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read + normalize scoring plays (cached per data version, see
+    scoring_plays_version). With a store, only the partitions for `game_ids`
+    (all when None) are loaded; otherwise the legacy CSV at `path` is read and
+    errors come back as the read_csv_safe sentinel frame.
+    """
+    store = ScoringPlayStore(store_dir) if store_dir is not None else None
+    if store is not None and store.exists():
+        return normalize_scoring_df(store.read(game_ids))
+
+    df = _read_csv_safe_uncached(path)
+    if "__read_error__" in df.columns:
+        return df
+    return normalize_scoring_df(df)
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_incremental_scoring(
+    processed_dir: Path,
+    *,
+    season: int,
+    game_ids: frozenset[str],
+    plays_version: int,
+    positions_version: int,
+    state_version: int,
+) -> ScoringResult | None:
+    """
+    ScoringResult from the state refresh maintains incrementally
+    (src/scoring/incremental.py), cached per state version. None when the state
+    is missing or does not reflect the current scoring plays / positions files;
+    callers then fall back to build_scoring_result.
+    """
+    state = load_scoring_state(processed_dir, season)
+    if state is None or not state.matches(
+        season=season,
+        rules=ScoreRules(),
+        positions_version=str(positions_version),
+        plays_version=plays_version,
+    ):
+        return None
+    return state.to_result(game_ids=game_ids)
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_scoreboard_snapshot(path: Path, *, version: int) -> ScoreboardSnapshot | None:
+    """
+    Scoreboard snapshot written at refresh time (src/snapshot.py), cached per
+    file version. Callers still check it against its inputs (is_current).
+    """
+    return read_snapshot(path)
+
+
 def normalize_scoring_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normalize IDs once for stable merges/filtering.
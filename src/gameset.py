@@ -6,6 +6,8 @@ from typing import Iterable, Literal
 
 import pandas as pd
 
+from src.pbp.store import ScoringPlayStore
+
 Mode = Literal["regular_season_dev", "playoffs"]
 
 
@@ -22,9 +24,12 @@ class GameSet:
         return f"Regular season dev: season={self.season}, weeks=1..{self.week_max}"
 
 
-def load_game_ids(scoring_plays: pd.DataFrame, gs: GameSet) -> set[str]:
+def load_game_ids(scoring_plays: pd.DataFrame | ScoringPlayStore, gs: GameSet) -> set[str]:
     """
     Returns the set of game_ids included in the scoring scope.
+
+    `scoring_plays` may be the scoring-plays store, in which case regular season
+    dev mode is answered from its manifest without reading any partition.
     """
     if gs.mode == "playoffs":
         if not gs.playoff_game_ids_path:
@@ -41,6 +46,12 @@ def load_game_ids(scoring_plays: pd.DataFrame, gs: GameSet) -> set[str]:
     # regular season dev: derive from scoring_plays filtered by season/week
     if gs.week_max is None:
         raise ValueError("week_max is required for regular_season_dev.")
+    if isinstance(scoring_plays, ScoringPlayStore):
+        return {
+            gid
+            for gid, part in scoring_plays.manifest().items()
+            if part.season == int(gs.season) and part.week is not None and 1 <= part.week <= int(gs.week_max)
+        }
     if "game_id" not in scoring_plays.columns:
         raise ValueError("scoring_plays is missing required column 'game_id'.")
     if "season" not in scoring_plays.columns or "week" not in scoring_plays.columns:
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import random
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
 
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
-from .schedule import gsis_for_game_id
+from .schedule import game_id_to_event_id_map
 
 
 REQUEST_HEADERS = {
@@ -26,6 +34,29 @@ REQUEST_HEADERS = {
 # Use www.nfl.com because static.nfl.com does not resolve in your environment.
 _GTD_URL = "https://www.nfl.com/liveupdate/game-center/{eid}/{eid}_gtd.json"
 
+# A full playoff slate is at most 6 games; one keep-alive connection each.
+DEFAULT_MAX_WORKERS = 6
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session(pool_size: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """
+    Shared keep-alive session for GTD requests (one TLS handshake per pooled
+    connection instead of one per game per refresh).
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            s = requests.Session()
+            s.headers.update(REQUEST_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _SESSION = s
+        return _SESSION
+
 
 @dataclass(frozen=True)
 class LiveGameMetrics:
@@ -35,8 +66,9 @@ class LiveGameMetrics:
     max_play_id: Optional[int]
     is_final: bool
     refreshed_at: str
-    status: str  # "ok" or "not_loaded_yet" or "error"
+    status: str  # "ok", "unchanged", "not_loaded_yet" or "error"
     detail: str = ""
+    fetch_ms: Optional[float] = None
 
 
 def _now_utc_iso() -> str:
@@ -78,24 +110,280 @@ def _to_bool(x: Any) -> bool:
         return False
 
 
-def fetch_gtd_json(event_id: str) -> dict:
-    url = f"https://www.nfl.com/liveupdate/game-center/{event_id}/{event_id}_gtd.json"
-    try:
-        r = requests.get(url, headers=REQUEST_HEADERS, timeout=15)
-    except Exception as e:
-        raise RuntimeError(f"Request failed for {url}: {e}") from e
+@dataclass(frozen=True)
+class GtdResponse:
+    payload: Dict[str, Any]
+    unchanged: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_hash: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class GtdCacheEntry:
+    """
+    What we remember about a game's last successfully parsed GTD document:
+    HTTP validators for conditional requests, a body hash for servers that
+    ignore them, and the metrics summary to report when nothing changed.
+    """
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    pbp_rows: int
+    max_play_id: Optional[int]
+    is_final: bool
+
+
+class GtdCache:
+    """
+    Thread-safe per-event cache of GtdCacheEntry. Lives for the process, so
+    repeated refreshes from the app (or a long-running refresher) reuse it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, GtdCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, event_id: str) -> Optional[GtdCacheEntry]:
+        with self._lock:
+            return self._entries.get(event_id)
+
+    def put(self, event_id: str, entry: GtdCacheEntry) -> None:
+        with self._lock:
+            self._entries[event_id] = entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_GTD_CACHE = GtdCache()
+
+
+@dataclass(frozen=True)
+class FetchPolicy:
+    """
+    How GTD requests are made and retried.
+
+    - connect / read timeouts are separate, so an unreachable host fails fast
+      while a slow response still gets `read_timeout_s`
+    - timeouts, connection errors, 429 and 5xx are retried up to `retries`
+      times, sleeping a full-jitter exponential backoff between attempts
+    - `breaker_threshold` consecutive failures against a host open its
+      circuit for `breaker_cooldown_s`; requests fail immediately meanwhile,
+      then a single trial request decides whether it closes again
+    """
+
+    connect_timeout_s: float = 3.05
+    read_timeout_s: float = 10.0
+    retries: int = 2
+    backoff_base_s: float = 0.25
+    backoff_max_s: float = 2.0
+    breaker_threshold: int = 3
+    breaker_cooldown_s: float = 30.0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.connect_timeout_s, self.read_timeout_s)
+
+    def backoff_s(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """
+        Sleep before retry number `attempt` (1-based): uniform in
+        [0, min(backoff_max_s, backoff_base_s * 2 ** (attempt - 1))].
+        """
+        return rand() * min(self.backoff_max_s, self.backoff_base_s * (2 ** max(0, attempt - 1)))
+
+    def with_overrides(self, *, timeout_s: float | None = None, retries: int | None = None) -> "FetchPolicy":
+        """
+        The policy with the older `timeout_s` / `retries` arguments applied
+        (`timeout_s` bounds both the connect and the read timeout).
+        """
+        p = self
+        if timeout_s is not None:
+            p = replace(p, connect_timeout_s=min(p.connect_timeout_s, timeout_s), read_timeout_s=timeout_s)
+        if retries is not None:
+            p = replace(p, retries=max(0, int(retries)))
+        return p
+
+
+DEFAULT_FETCH_POLICY = FetchPolicy()
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Thread-safe per-host circuit breaker (closed -> open -> half-open).
+    Lives for the process, like GtdCache, so a host that keeps failing is
+    skipped across refreshes until its cooldown has passed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+        self._trial: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """
+        False while the host's circuit is open. After the cooldown, lets one
+        trial request through (half-open) until it is recorded.
+        """
+        with self._lock:
+            until = self._open_until.get(host)
+            if until is None:
+                return True
+            if self._clock() < until or self._trial.get(host):
+                return False
+            self._trial[host] = True
+            return True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._open_until.pop(host, None)
+            self._trial.pop(host, None)
+
+    def record_failure(self, host: str, policy: FetchPolicy) -> None:
+        with self._lock:
+            n = self._failures.get(host, 0) + 1
+            self._failures[host] = n
+            if self._trial.pop(host, False) or n >= policy.breaker_threshold:
+                self._open_until[host] = self._clock() + policy.breaker_cooldown_s
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            return host in self._open_until
+
+    def clear(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._open_until.clear()
+            self._trial.clear()
+
+
+_BREAKER = CircuitBreaker()
+
+
+def _retryable_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def fetch_gtd_response(
+    event_id: str,
+    *,
+    timeout_s: float | None = None,
+    retries: int | None = None,
+    policy: FetchPolicy | None = None,
+    session: requests.Session | None = None,
+    cache: GtdCache | None = None,
+    breaker: CircuitBreaker | None = _BREAKER,
+) -> GtdResponse:
+    """
+    Fetch a GTD document. With `cache`, sends If-None-Match / If-Modified-Since
+    from the last parsed copy and returns `unchanged=True` (without decoding the
+    body) on a 304 or when the body hash matches.
+
+    Requests follow `policy` (DEFAULT_FETCH_POLICY, with `timeout_s` / `retries`
+    applied on top). Every attempt is recorded in `breaker`; while the host's
+    circuit is open this raises CircuitOpenError without sending a request.
+
+    The cache is not written here; callers store an entry only after the
+    document has been parsed successfully.
+    """
+    url = _GTD_URL.format(eid=event_id)
+    host = urlsplit(url).netloc
+    http = session or get_session()
+    pol = (policy or DEFAULT_FETCH_POLICY).with_overrides(timeout_s=timeout_s, retries=retries)
+
+    prev = cache.get(event_id) if cache is not None else None
+    headers = dict(REQUEST_HEADERS)
+    if prev is not None:
+        if prev.etag:
+            headers["If-None-Match"] = prev.etag
+        if prev.last_modified:
+            headers["If-Modified-Since"] = prev.last_modified
+
+    attempt = 0
+    while True:
+        if breaker is not None and not breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}; skipped {url}")
+        try:
+            r = http.get(url, headers=headers, timeout=pol.timeout)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(host, pol)
+            if attempt < pol.retries and isinstance(e, (requests.Timeout, requests.ConnectionError)):
+                attempt += 1
+                time.sleep(pol.backoff_s(attempt))
+                continue
+            raise RuntimeError(f"Request failed for {url}: {e}") from e
+        if _retryable_status(r.status_code):
+            if breaker is not None:
+                breaker.record_failure(host, pol)
+            if attempt < pol.retries:
+                attempt += 1
+                time.sleep(pol.backoff_s(attempt))
+                continue
+        elif breaker is not None:
+            breaker.record_success(host)
+        break
+
+    if r.status_code == 304 and prev is not None:
+        return GtdResponse(
+            payload={},
+            unchanged=True,
+            etag=prev.etag,
+            last_modified=prev.last_modified,
+            body_hash=prev.body_hash,
+        )
 
     if r.status_code == 404:
-        return {}
+        return GtdResponse(payload={})
 
     if r.status_code != 200:
         raise RuntimeError(f"GTD HTTP {r.status_code} for {url}: {r.text[:200]}")
 
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    body_hash = hashlib.sha256(r.content).hexdigest()
+
+    if prev is not None and body_hash == prev.body_hash:
+        return GtdResponse(
+            payload={},
+            unchanged=True,
+            etag=etag or prev.etag,
+            last_modified=last_modified or prev.last_modified,
+            body_hash=body_hash,
+        )
+
     try:
-        return r.json() or {}
+        payload = json.loads(r.content) or {}
     except Exception as e:
         raise RuntimeError(f"Invalid JSON from {url}: {e}. Body head: {r.text[:200]}") from e
 
+    return GtdResponse(payload=payload, etag=etag, last_modified=last_modified, body_hash=body_hash)
+
+
+def fetch_gtd_json(
+    event_id: str,
+    *,
+    timeout_s: float | None = None,
+    retries: int | None = None,
+    policy: FetchPolicy | None = None,
+    session: requests.Session | None = None,
+) -> dict:
+    """
+    Unconditional fetch of a GTD document ({} when not available yet).
+    """
+    return fetch_gtd_response(
+        event_id, timeout_s=timeout_s, retries=retries, policy=policy, session=session
+    ).payload
+
 
 def _extract_game_blob(gtd: Dict[str, Any], event_id: str) -> Dict[str, Any]:
     """
@@ -129,8 +417,24 @@ def _infer_is_final(game: Dict[str, Any]) -> bool:
     return False
 
 
-def _normalize_scoring_fields_from_play(play: Dict[str, Any]) -> Dict[str, Any]:
-    desc = _safe_str(play.get("desc")) or ""
+# Order of the values returned by _scoring_fields (and of the columns they become).
+_SCORING_FIELDS = (
+    "touchdown",
+    "safety",
+    "field_goal_result",
+    "extra_point_result",
+    "two_point_conv_result",
+    "pass_touchdown",
+    "rush_touchdown",
+    "defensive_two_point_conv",
+)
+
+
+def _scoring_fields(play: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Scoring fields of one play, in _SCORING_FIELDS order.
+    """
+    d = (_safe_str(play.get("desc")) or "").lower()
 
     spt = (play.get("scoringPlayType") or play.get("scoring_play_type") or "")
     spt_s = str(spt).strip().lower()
@@ -143,21 +447,21 @@ def _normalize_scoring_fields_from_play(play: Dict[str, Any]) -> Dict[str, Any]:
     two_point_conv_result = None
 
     if "field goal" in spt_s or spt_s in {"fg", "fieldgoal"}:
-        if "no good" in desc.lower() or "missed" in desc.lower() or "blocked" in desc.lower():
+        if "no good" in d or "missed" in d or "blocked" in d:
             field_goal_result = "missed"
         else:
             field_goal_result = "made"
 
     if "extra point" in spt_s or spt_s in {"xp", "pat"}:
-        if "no good" in desc.lower() or "missed" in desc.lower() or "blocked" in desc.lower():
+        if "no good" in d or "missed" in d or "blocked" in d:
             extra_point_result = "no good"
         else:
             extra_point_result = "good"
 
     if "two-point" in spt_s or "two point" in spt_s or spt_s in {"2pt", "two_point"}:
-        if "conversion succeeds" in desc.lower() or "is good" in desc.lower() or "successful" in desc.lower():
+        if "conversion succeeds" in d or "is good" in d or "successful" in d:
             two_point_conv_result = "success"
-        elif "fails" in desc.lower() or "no good" in desc.lower() or "unsuccessful" in desc.lower():
+        elif "fails" in d or "no good" in d or "unsuccessful" in d:
             two_point_conv_result = "fail"
         else:
             two_point_conv_result = None
@@ -165,7 +469,6 @@ def _normalize_scoring_fields_from_play(play: Dict[str, Any]) -> Dict[str, Any]:
     pass_td = False
     rush_td = False
     if touchdown == 1:
-        d = desc.lower()
         if "pass" in d and ("to " in d or "complete" in d or "incomplete" in d):
             pass_td = True
         if "left end" in d or "right end" in d or "up the middle" in d or "run" in d or "rush" in d:
@@ -173,139 +476,457 @@ def _normalize_scoring_fields_from_play(play: Dict[str, Any]) -> Dict[str, Any]:
 
     defensive_two_point_conv = 1 if ("defensive two-point" in spt_s or "defensive 2pt" in spt_s) else 0
 
-    return {
-        "touchdown": touchdown,
-        "safety": safety,
-        "field_goal_result": field_goal_result,
-        "extra_point_result": extra_point_result,
-        "two_point_conv_result": two_point_conv_result,
-        "pass_touchdown": pass_td,
-        "rush_touchdown": rush_td,
-        "defensive_two_point_conv": defensive_two_point_conv,
-    }
+    return (
+        touchdown,
+        safety,
+        field_goal_result,
+        extra_point_result,
+        two_point_conv_result,
+        pass_td,
+        rush_td,
+        defensive_two_point_conv,
+    )
 
 
-def gtd_game_to_pbp_df(game_id: str, event_id: str, gtd: Dict[str, Any], refreshed_at: str) -> pd.DataFrame:
-    game = _extract_game_blob(gtd, event_id)
-    if not game:
-        return pd.DataFrame()
+# Columns GTD does not provide: broadcast as all-NA instead of stored per play.
+_GTD_NA_COLUMNS = (
+    "pass",
+    "rush",
+    "qb_dropback",
+    "sack",
+    "interception",
+    "fumble_lost",
+    "return_team",
+)
+
+# Order of the values returned by _participants (and of the columns they become).
+_PARTICIPANT_COLUMNS = (
+    "passer_player_id",
+    "passer_player_name",
+    "receiver_player_id",
+    "receiver_player_name",
+    "rusher_player_id",
+    "rusher_player_name",
+    "kicker_player_id",
+    "kicker_player_name",
+)
+
+# GSIS stat ids in a play's `players` block -> participant role
+# (0 passer, 1 receiver, 2 rusher, 3 kicker), as nflverse assigns them.
+_STAT_ROLE = {
+    # pass incomplete / complete / complete TD, interception thrown, sacked, 2pt pass good / failed
+    **dict.fromkeys((14, 15, 16, 19, 20, 77, 78), 0),
+    # reception / reception TD, 2pt reception good / failed, pass target
+    **dict.fromkeys((21, 22, 104, 105, 115), 1),
+    # rush / rush TD, 2pt rush good / failed
+    **dict.fromkeys((10, 11, 75, 76), 2),
+    # field goal made / missed / blocked, extra point good / failed / blocked
+    **dict.fromkeys((69, 70, 71, 72, 73, 74), 3),
+}
 
-    drives = game.get("drives") or {}
-    rows: List[Dict[str, Any]] = []
+_NO_PARTICIPANTS: Tuple[Optional[str], ...] = (None,) * len(_PARTICIPANT_COLUMNS)
 
-    def iter_drive_objs(dr: Any) -> Iterable[Dict[str, Any]]:
-        if isinstance(dr, dict):
-            for _, v in dr.items():
-                if isinstance(v, dict) and "plays" in v:
-                    yield v
 
-    for drive in iter_drive_objs(drives):
-        plays = drive.get("plays")
-        if not isinstance(plays, dict):
-            continue
+def _participants(players: Any) -> Tuple[Optional[str], ...]:
+    """
+    Passer, receiver, rusher and kicker (id, name) of one play, in
+    _PARTICIPANT_COLUMNS order, from its GTD `players` block:
+    {gsis_id: [{"statId", "playerName", "sequence", ...}, ...]}.
 
-        for _, play in plays.items():
-            if not isinstance(play, dict):
+    A role goes to the player with the lowest-sequence stat for it; the name
+    is the first playerName among that player's stats. Team stats (id "0")
+    are skipped.
+    """
+    if not isinstance(players, dict) or not players:
+        return _NO_PARTICIPANTS
+
+    found: List[Optional[Tuple[float, str, Optional[str]]]] = [None, None, None, None]
+    for pid, stats in players.items():
+        if not pid or pid == "0" or not isinstance(stats, list):
+            continue
+        stats = [st for st in stats if isinstance(st, dict)]
+        name = next((_safe_str(st["playerName"]) for st in stats if st.get("playerName")), None)
+        for stat in stats:
+            role = _STAT_ROLE.get(_safe_int(stat.get("statId")))
+            if role is None:
                 continue
+            seq = _safe_int(stat.get("sequence"))
+            seq_key = float("inf") if seq is None else float(seq)
+            if found[role] is None or seq_key < found[role][0]:
+                found[role] = (seq_key, str(pid), name)
+
+    out: List[Optional[str]] = []
+    for hit in found:
+        out.extend((None, None) if hit is None else hit[1:])
+    return tuple(out)
+
+
+def _iter_drive_objs(drives: Any) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    if isinstance(drives, dict):
+        for k, v in drives.items():
+            if isinstance(v, dict) and "plays" in v:
+                yield str(k), v
+
+
+# Per-play buffers filled by _parse_drive, in column order.
+_DRIVE_BUFFERS = (
+    "posteam",
+    "defteam",
+    "qtr",
+    "time",
+    "drive",
+    "play_id",
+    "desc",
+    "play_type",
+    "participants",
+    "scoring",
+)
+
+DriveRows = Dict[str, List[Any]]
+
+
+def _parse_drive(drive: Dict[str, Any]) -> DriveRows:
+    """
+    The plays of one drive as one list per _DRIVE_BUFFERS entry
+    ("participants" and "scoring" hold _participants / _scoring_fields tuples).
+    """
+    rows: DriveRows = {k: [] for k in _DRIVE_BUFFERS}
+    plays = drive.get("plays")
+    if not isinstance(plays, dict):
+        return rows
+    dnum = _safe_int(drive.get("driveNum") or drive.get("drive_num") or drive.get("drive"))
+
+    posteam, defteam, qtr, clock, drive_num, play_id, desc, play_type, participants, scoring = (
+        rows[k] for k in _DRIVE_BUFFERS
+    )
+    for _, play in plays.items():
+        if not isinstance(play, dict):
+            continue
+        get = play.get
+        play_id.append(_safe_int(get("playId") or get("play_id")))
+        desc.append(_safe_str(get("desc")))
+        qtr.append(_safe_int(get("qtr")))
+        clock.append(_safe_str(get("time")) or _safe_str(get("clock")))
+        posteam.append(_safe_str(get("possessionTeam")) or _safe_str(get("posteam")))
+        defteam.append(_safe_str(get("defensiveTeam")) or _safe_str(get("defteam")))
+        play_type.append(_safe_str(get("playType")) or _safe_str(get("play_type")))
+        drive_num.append(dnum)
+        participants.append(_participants(get("players")))
+        scoring.append(_scoring_fields(play))
+    return rows
+
+
+class DriveCache:
+    """
+    Thread-safe per-event cache of parsed drives: drive key -> (the drive's
+    decoded JSON, DriveRows). During a live game only the last drive or two
+    change between polls, so re-parsing is limited to those.
 
-            play_id = _safe_int(play.get("playId") or play.get("play_id"))
-            desc = _safe_str(play.get("desc"))
-
-            qtr = _safe_int(play.get("qtr"))
-            clock = _safe_str(play.get("time")) or _safe_str(play.get("clock"))
-
-            posteam = _safe_str(play.get("possessionTeam")) or _safe_str(play.get("posteam"))
-            defteam = _safe_str(play.get("defensiveTeam")) or _safe_str(play.get("defteam"))
-
-            play_type = _safe_str(play.get("playType")) or _safe_str(play.get("play_type"))
-            drive_num = _safe_int(drive.get("driveNum") or drive.get("drive_num") or drive.get("drive"))
-
-            base = {
-                "refreshed_at": refreshed_at,
-                "season": pd.NA,
-                "week": pd.NA,
-                "game_id": game_id,
-                "game_date": _safe_str(game.get("gameDate")) or _safe_str(game.get("startTime")),
-
-                "posteam": posteam,
-                "defteam": defteam,
-
-                "qtr": qtr,
-                "time": clock,
-                "drive": drive_num,
-
-                "play_id": play_id,
-                "desc": desc,
-
-                "play_type": play_type,
-                "pass": pd.NA,
-                "rush": pd.NA,
-                "qb_dropback": pd.NA,
-                "sack": pd.NA,
-                "interception": pd.NA,
-                "fumble_lost": pd.NA,
-
-                "return_team": pd.NA,
-
-                "passer_player_id": pd.NA,
-                "passer_player_name": pd.NA,
-                "receiver_player_id": pd.NA,
-                "receiver_player_name": pd.NA,
-                "rusher_player_id": pd.NA,
-                "rusher_player_name": pd.NA,
-                "kicker_player_id": pd.NA,
-                "kicker_player_name": pd.NA,
-            }
+    Drives are matched by comparing the decoded JSON with the previous poll's
+    copy. That comparison runs in C and stops at the first difference, so it is
+    cheaper than hashing a serialization of every drive.
+    """
+
+    def __init__(self) -> None:
+        self._games: Dict[str, Dict[str, Tuple[Dict[str, Any], DriveRows]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, event_id: str) -> Dict[str, Tuple[Dict[str, Any], DriveRows]]:
+        with self._lock:
+            return self._games.get(event_id, {})
+
+    def put(self, event_id: str, drives: Dict[str, Tuple[Dict[str, Any], DriveRows]]) -> None:
+        with self._lock:
+            self._games[event_id] = drives
 
-            base.update(_normalize_scoring_fields_from_play(play))
-            rows.append(base)
+    def clear(self) -> None:
+        with self._lock:
+            self._games.clear()
 
-    if not rows:
+
+_DRIVE_CACHE = DriveCache()
+
+
+class PendingGtdCache:
+    """
+    GtdCache / DriveCache writes held back until the rows they describe have
+    been persisted. fetch_live_pbp_for_game_ids stages one update per parsed
+    game; commit() applies them. Until then the next poll still treats those
+    documents as new, so rows lost to a failed write are fetched and parsed
+    again instead of being reported unchanged.
+    """
+
+    def __init__(self, cache: GtdCache | None = None, drive_cache: DriveCache | None = None) -> None:
+        self._cache = cache if cache is not None else _GTD_CACHE
+        self._drive_cache = drive_cache if drive_cache is not None else _DRIVE_CACHE
+        self._updates: Dict[str, Tuple[GtdCacheEntry, Optional[Dict[str, Tuple[Dict[str, Any], DriveRows]]]]] = {}
+        self._lock = threading.Lock()
+
+    def stage(
+        self,
+        event_id: str,
+        entry: GtdCacheEntry,
+        drives: Optional[Dict[str, Tuple[Dict[str, Any], DriveRows]]] = None,
+    ) -> None:
+        with self._lock:
+            self._updates[event_id] = (entry, drives)
+
+    def commit(self) -> None:
+        with self._lock:
+            updates, self._updates = self._updates, {}
+        for event_id, (entry, drives) in updates.items():
+            self._cache.put(event_id, entry)
+            if drives is not None:
+                self._drive_cache.put(event_id, drives)
+
+    def discard(self) -> None:
+        with self._lock:
+            self._updates.clear()
+
+
+def gtd_game_to_pbp_df(
+    game_id: str,
+    event_id: str,
+    gtd: Dict[str, Any],
+    refreshed_at: str,
+    *,
+    drive_cache: DriveCache | None = None,
+) -> pd.DataFrame:
+    """
+    One row per GTD play. Each drive is parsed into one buffer per varying
+    column; per-game constants and the columns GTD does not carry are
+    broadcast when the frame is built. Passer / receiver / rusher / kicker
+    ids and names come from each play's `players` stat block (_participants).
+
+    With `drive_cache`, drives equal to the previous call's copy for this
+    event reuse their parsed buffers, so only new or changed drives are
+    parsed. The cache entry is replaced by the drives of this document (which
+    must not be mutated afterwards).
+    """
+    game = _extract_game_blob(gtd, event_id)
+    if not game:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
+    prev = drive_cache.get(event_id) if drive_cache is not None else {}
+    parsed: Dict[str, Tuple[Dict[str, Any], DriveRows]] = {}
+    cols: DriveRows = {k: [] for k in _DRIVE_BUFFERS}
 
-    if "game_id" in df.columns:
-        df["game_id"] = df["game_id"].astype("string")
-    if "play_id" in df.columns:
-        df["play_id"] = pd.to_numeric(df["play_id"], errors="coerce").astype("Int64")
-    if "qtr" in df.columns:
-        df["qtr"] = pd.to_numeric(df["qtr"], errors="coerce").astype("Int64")
-    if "drive" in df.columns:
-        df["drive"] = pd.to_numeric(df["drive"], errors="coerce").astype("Int64")
+    for key, drive in _iter_drive_objs(game.get("drives") or {}):
+        if drive_cache is not None:
+            hit = prev.get(key)
+            rows = hit[1] if hit is not None and hit[0] == drive else _parse_drive(drive)
+            parsed[key] = (drive, rows)
+        else:
+            rows = _parse_drive(drive)
+        for k in _DRIVE_BUFFERS:
+            cols[k].extend(rows[k])
 
-    for c in ("touchdown", "safety", "defensive_two_point_conv"):
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype("Int64")
+    if drive_cache is not None:
+        drive_cache.put(event_id, parsed)
 
-    for c in ("field_goal_result", "extra_point_result", "two_point_conv_result"):
-        if c in df.columns:
-            df[c] = df[c].astype("string")
+    n = len(cols["play_id"])
+    if n == 0:
+        return pd.DataFrame()
 
-    for c in ("pass_touchdown", "rush_touchdown"):
-        if c in df.columns:
-            df[c] = df[c].fillna(False).astype(bool)
+    score_cols = dict(zip(_SCORING_FIELDS, zip(*cols["scoring"])))
+    participant_cols = dict(zip(_PARTICIPANT_COLUMNS, zip(*cols["participants"])))
+    index = pd.RangeIndex(n)
+    na = pd.Series(pd.NA, index=index, dtype=object)
+
+    def int_col(values: Iterable[Any]) -> pd.arrays.IntegerArray:
+        return pd.array(list(values), dtype="Int64")
+
+    return pd.DataFrame(
+        {
+            "refreshed_at": pd.Series(refreshed_at, index=index, dtype=object),
+            "season": na,
+            "week": na,
+            "game_id": pd.Series(game_id, index=index, dtype="string"),
+            "game_date": pd.Series(
+                _safe_str(game.get("gameDate")) or _safe_str(game.get("startTime")), index=index, dtype=object
+            ),
+            "posteam": cols["posteam"],
+            "defteam": cols["defteam"],
+            "qtr": int_col(cols["qtr"]),
+            "time": cols["time"],
+            "drive": int_col(cols["drive"]),
+            "play_id": int_col(cols["play_id"]),
+            "desc": cols["desc"],
+            "play_type": cols["play_type"],
+            **{c: na for c in _GTD_NA_COLUMNS},
+            **{c: pd.array(v, dtype="string") for c, v in participant_cols.items()},
+            "touchdown": int_col(score_cols["touchdown"]),
+            "safety": int_col(score_cols["safety"]),
+            "field_goal_result": pd.array(score_cols["field_goal_result"], dtype="string"),
+            "extra_point_result": pd.array(score_cols["extra_point_result"], dtype="string"),
+            "two_point_conv_result": pd.array(score_cols["two_point_conv_result"], dtype="string"),
+            "pass_touchdown": np.fromiter(score_cols["pass_touchdown"], dtype=bool, count=n),
+            "rush_touchdown": np.fromiter(score_cols["rush_touchdown"], dtype=bool, count=n),
+            "defensive_two_point_conv": int_col(score_cols["defensive_two_point_conv"]),
+        },
+        index=index,
+    )
 
-    return df
+
+def _fetch_one_game(
+    *,
+    game_id: str,
+    event_id: str,
+    refreshed_at: str,
+    timeout_s: float | None,
+    retries: int | None,
+    policy: FetchPolicy | None,
+    session: requests.Session,
+    cache: GtdCache | None,
+    drive_cache: DriveCache | None = None,
+) -> Tuple[pd.DataFrame, LiveGameMetrics, Optional[Tuple[GtdCacheEntry, Any]]]:
+    """
+    Fetch and parse one game. The caches are only read here; the entry (and
+    parsed drives) describing this document come back as the third element
+    for the caller to stage, so a game abandoned at the deadline, or whose rows
+    are never persisted, leaves them untouched.
+    """
+    t0 = time.perf_counter()
+
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - t0) * 1000.0, 1)
+
+    try:
+        resp = fetch_gtd_response(
+            event_id, timeout_s=timeout_s, retries=retries, policy=policy, session=session, cache=cache
+        )
+        fetch_ms = elapsed_ms()
+
+        prev = cache.get(event_id) if cache is not None else None
+        if resp.unchanged and prev is not None:
+            # Nothing new since the last poll: skip parsing, report last known state.
+            return pd.DataFrame(), LiveGameMetrics(
+                game_id=game_id,
+                event_id=event_id,
+                pbp_rows=prev.pbp_rows,
+                max_play_id=prev.max_play_id,
+                is_final=prev.is_final,
+                refreshed_at=refreshed_at,
+                status="unchanged",
+                detail="GTD unchanged since last fetch",
+                fetch_ms=fetch_ms,
+            ), None
+
+        gtd = resp.payload
+        if not gtd:
+            return pd.DataFrame(), LiveGameMetrics(
+                game_id=game_id,
+                event_id=event_id,
+                pbp_rows=0,
+                max_play_id=None,
+                is_final=False,
+                refreshed_at=refreshed_at,
+                status="not_loaded_yet",
+                detail="GTD not available yet",
+                fetch_ms=fetch_ms,
+            ), None
+
+        game_blob = _extract_game_blob(gtd, event_id)
+        is_final = _infer_is_final(game_blob)
+
+        # Parse against a private copy of the game's drives; the shared cache is
+        # only updated once the caller commits.
+        drives: DriveCache | None = None
+        if drive_cache is not None:
+            drives = DriveCache()
+            drives.put(event_id, drive_cache.get(event_id))
+        df = gtd_game_to_pbp_df(game_id, event_id, gtd, refreshed_at, drive_cache=drives)
+        pbp_rows = int(len(df))
+
+        max_play_id: Optional[int] = None
+        if pbp_rows > 0 and "play_id" in df.columns:
+            mx = pd.to_numeric(df["play_id"], errors="coerce").max(skipna=True)
+            if pd.notna(mx):
+                max_play_id = int(mx)
+
+        update = None
+        if cache is not None and resp.body_hash:
+            entry = GtdCacheEntry(
+                etag=resp.etag,
+                last_modified=resp.last_modified,
+                body_hash=resp.body_hash,
+                pbp_rows=pbp_rows,
+                max_play_id=max_play_id,
+                is_final=is_final,
+            )
+            update = (entry, drives.get(event_id) if drives is not None else None)
+
+        return df, LiveGameMetrics(
+            game_id=game_id,
+            event_id=event_id,
+            pbp_rows=pbp_rows,
+            max_play_id=max_play_id,
+            is_final=is_final,
+            refreshed_at=refreshed_at,
+            status="ok",
+            detail="",
+            fetch_ms=fetch_ms,
+        ), update
+
+    except Exception as e:
+        return pd.DataFrame(), LiveGameMetrics(
+            game_id=game_id,
+            event_id=event_id,
+            pbp_rows=0,
+            max_play_id=None,
+            is_final=False,
+            refreshed_at=refreshed_at,
+            status="error",
+            detail=str(e),
+            fetch_ms=elapsed_ms(),
+        ), None
 
 
 def fetch_live_pbp_for_game_ids(
     *,
     season: int,
     game_ids: List[str],
-    timeout_s: float = 12.0,
-    retries: int = 2,
+    timeout_s: float | None = None,
+    retries: int | None = None,
+    policy: FetchPolicy | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    deadline_s: float | None = None,
+    session: requests.Session | None = None,
+    conditional: bool = True,
+    pending: PendingGtdCache | None = None,
 ) -> Tuple[pd.DataFrame, List[LiveGameMetrics]]:
+    """
+    Fetch GTD play-by-play for several games concurrently over one pooled session.
+
+    - `max_workers` bounds parallel requests (1 gives the old serial behavior).
+    - Requests follow `policy` (connect/read timeouts, jittered retries, per-host
+      circuit breaker; see FetchPolicy). `timeout_s` / `retries` override its
+      timeouts and retry count. `deadline_s` bounds the whole call; games still
+      in flight at the deadline are reported as status="error", as are games
+      skipped while the host's circuit is open.
+    - Metrics come back in `game_ids` order, one per game (repeated ids are
+      fetched and returned once), with `fetch_ms` set.
+    - With `conditional`, games whose GTD document has not changed since the last
+      call in this process are reported as status="unchanged" and contribute no
+      rows; callers can skip the upsert when every game is unchanged. Changed
+      documents only re-parse the drives that changed (DriveCache).
+    - Cache updates come only from games that finished within the deadline.
+      Without `pending` they are committed before returning; with it they are
+      staged there, and the caller commits once the rows are persisted.
+    """
     refreshed_at = _now_utc_iso()
-    all_rows: List[pd.DataFrame] = []
-    metrics: List[LiveGameMetrics] = []
-
-    for gid in game_ids:
-        gid_s = str(gid).strip()
-        event_id = gsis_for_game_id(season, gid_s)
-
-        if not event_id:
-            metrics.append(
+    started = time.perf_counter()
+    gids = list(dict.fromkeys(str(g).strip() for g in game_ids))
+
+    event_ids = game_id_to_event_id_map(season)
+    http = session or get_session(max_workers)
+
+    results: Dict[str, Tuple[pd.DataFrame, LiveGameMetrics]] = {}
+    staged = pending if pending is not None else PendingGtdCache(_GTD_CACHE, _DRIVE_CACHE)
+    for gid_s in gids:
+        if not event_ids.get(gid_s):
+            results[gid_s] = (
+                pd.DataFrame(),
                 LiveGameMetrics(
                     game_id=gid_s,
                     event_id="",
@@ -315,68 +936,68 @@ def fetch_live_pbp_for_game_ids(
                     refreshed_at=refreshed_at,
                     status="error",
                     detail="Could not map game_id to old_game_id via schedules",
-                )
+                ),
             )
-            continue
 
+    to_fetch = [g for g in gids if g not in results]
+    if to_fetch:
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch))))
         try:
-            gtd = fetch_gtd_json(event_id, timeout_s=timeout_s, retries=retries)
-            if not gtd:
-                metrics.append(
+            futures = {
+                pool.submit(
+                    _fetch_one_game,
+                    game_id=gid_s,
+                    event_id=event_ids[gid_s],
+                    refreshed_at=refreshed_at,
+                    timeout_s=timeout_s,
+                    retries=retries,
+                    policy=policy,
+                    session=http,
+                    cache=_GTD_CACHE if conditional else None,
+                    drive_cache=_DRIVE_CACHE if conditional else None,
+                ): gid_s
+                for gid_s in to_fetch
+            }
+            done, not_done = wait(futures, timeout=deadline_s)
+
+            for fut in done:
+                gid_s = futures[fut]
+                df, m, update = fut.result()
+                results[gid_s] = (df, m)
+                if update is not None:
+                    staged.stage(event_ids[gid_s], *update)
+
+            for fut in not_done:
+                fut.cancel()
+                gid_s = futures[fut]
+                results[gid_s] = (
+                    pd.DataFrame(),
                     LiveGameMetrics(
                         game_id=gid_s,
-                        event_id=event_id,
+                        event_id=event_ids[gid_s],
                         pbp_rows=0,
                         max_play_id=None,
                         is_final=False,
                         refreshed_at=refreshed_at,
-                        status="not_loaded_yet",
-                        detail="GTD not available yet",
-                    )
+                        status="error",
+                        detail=f"Deadline of {deadline_s}s exceeded",
+                        fetch_ms=round((time.perf_counter() - started) * 1000.0, 1),
+                    ),
                 )
-                continue
-
-            game_blob = _extract_game_blob(gtd, event_id)
-            is_final = _infer_is_final(game_blob)
-
-            df = gtd_game_to_pbp_df(gid_s, event_id, gtd, refreshed_at)
-            pbp_rows = int(len(df))
+        finally:
+            # Do not block on stragglers past the deadline.
+            pool.shutdown(wait=False, cancel_futures=True)
 
-            max_play_id: Optional[int] = None
-            if pbp_rows > 0 and "play_id" in df.columns:
-                mx = pd.to_numeric(df["play_id"], errors="coerce").max(skipna=True)
-                if pd.notna(mx):
-                    max_play_id = int(mx)
+    if pending is None:
+        staged.commit()
 
-            metrics.append(
-                LiveGameMetrics(
-                    game_id=gid_s,
-                    event_id=event_id,
-                    pbp_rows=pbp_rows,
-                    max_play_id=max_play_id,
-                    is_final=is_final,
-                    refreshed_at=refreshed_at,
-                    status="ok",
-                    detail="",
-                )
-            )
-
-            if not df.empty:
-                all_rows.append(df)
-
-        except Exception as e:
-            metrics.append(
-                LiveGameMetrics(
-                    game_id=gid_s,
-                    event_id=event_id,
-                    pbp_rows=0,
-                    max_play_id=None,
-                    is_final=False,
-                    refreshed_at=refreshed_at,
-                    status="error",
-                    detail=str(e),
-                )
-            )
+    all_rows: List[pd.DataFrame] = []
+    metrics: List[LiveGameMetrics] = []
+    for gid_s in gids:
+        df, m = results[gid_s]
+        metrics.append(m)
+        if not df.empty:
+            all_rows.append(df)
 
     pbp_all = pd.concat(all_rows, ignore_index=True) if all_rows else pd.DataFrame()
     return pbp_all, metrics
@@ -394,6 +1015,7 @@ def metrics_to_dataframe(metrics: List[LiveGameMetrics]) -> pd.DataFrame:
                 "refreshed_at",
                 "status",
                 "detail",
+                "fetch_ms",
             ]
         )
 
@@ -408,6 +1030,7 @@ def metrics_to_dataframe(metrics: List[LiveGameMetrics]) -> pd.DataFrame:
                 "refreshed_at": m.refreshed_at,
                 "status": m.status,
                 "detail": m.detail,
+                "fetch_ms": m.fetch_ms,
             }
             for m in metrics
         ]
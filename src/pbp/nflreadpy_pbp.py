@@ -1,12 +1,18 @@
-
 from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, Tuple, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Sequence, Tuple, List
 
 import pandas as pd
 
+from .release_cache import ensure_season_pbp_cached
+from .scoring_plays import PBP_SOURCE_COLUMNS
+
+if TYPE_CHECKING:
+    import polars as pl
+
 
 @dataclass(frozen=True)
 class NflreadpyMetrics:
@@ -18,32 +24,81 @@ class NflreadpyMetrics:
     detail: str = ""
 
 
+def scan_season_pbp(season: int, *, cache_dir: Path | None = None) -> Tuple["pl.LazyFrame", str]:
+    """
+    Season PBP as a lazy Polars frame, plus a short note on where it came from.
+
+    With `cache_dir`, the release parquet is kept on disk (see release_cache) and
+    scanned directly, so the game_id filter and column projection are pushed into
+    the parquet reader. Without it, nflreadpy's eager frame is wrapped lazily, which
+    still keeps the filter/projection ahead of the pandas conversion.
+    """
+    import polars as pl
+
+    if cache_dir is not None:
+        cached = ensure_season_pbp_cached(season, cache_dir=cache_dir)
+        note = f"release_cache={cached.status}"
+        if cached.detail:
+            note += f" ({cached.detail})"
+        return pl.scan_parquet(cached.path), note
+
+    import nflreadpy as nfl
+
+    return nfl.load_pbp([season]).lazy(), "nflreadpy"
+
+
+def select_pbp_for_game_ids(
+    lf: "pl.LazyFrame",
+    game_ids: Sequence[str],
+    *,
+    columns: Sequence[str] = PBP_SOURCE_COLUMNS,
+) -> pd.DataFrame:
+    """
+    Filter a lazy season frame to `game_ids`, project to `columns` (only those
+    present in the release), and convert just that slice to pandas.
+    """
+    import polars as pl
+
+    available = set(lf.collect_schema().names())
+    keep = [c for c in columns if c in available]
+    if "game_id" not in keep:
+        return pd.DataFrame()
+
+    return (
+        lf.filter(pl.col("game_id").is_in(list(game_ids)))
+        .select(keep)
+        .collect()
+        .to_pandas()
+    )
+
+
 def fetch_pbp_for_game_ids_via_nflreadpy(
     *,
     season: int,
     game_ids: Iterable[str],
+    cache_dir: Path | None = None,
 ) -> Tuple[pd.DataFrame, List[NflreadpyMetrics]]:
     """
-    Load nflfastR-style PBP from nflverse via nflreadpy, then filter to the requested game_ids.
-    Local-first: no caching controls here beyond whatever nflreadpy does by default.
-    """
-    import nflreadpy as nfl
+    Load nflfastR-style PBP from nflverse, then filter to the requested game_ids.
+    With `cache_dir`, the season release is served from a freshness-checked local
+    parquet copy; otherwise nflreadpy's own defaults apply.
 
+    Only the requested games and the columns derive_scoring_plays reads are
+    converted to pandas (see PBP_SOURCE_COLUMNS).
+    """
     refreshed_at = datetime.now().isoformat(timespec="seconds")
     gids = [str(g).strip() for g in game_ids if str(g).strip()]
     if not gids:
         return pd.DataFrame(), []
 
-    # nflreadpy returns Polars; convert to pandas for your existing pipeline.
-    pbp_pl = nfl.load_pbp([season])
-    pbp = pbp_pl.to_pandas()
+    lf, source_note = scan_season_pbp(season, cache_dir=cache_dir)
+    pbp = select_pbp_for_game_ids(lf, gids)
 
-    # Filter to requested games
-    pbp = pbp.loc[pbp["game_id"].isin(gids)].copy()
+    counts = pbp["game_id"].value_counts().to_dict() if not pbp.empty else {}
 
     metrics: list[NflreadpyMetrics] = []
     for gid in gids:
-        n = int((pbp["game_id"] == gid).sum())
+        n = int(counts.get(gid, 0))
         metrics.append(
             NflreadpyMetrics(
                 refreshed_at=refreshed_at,
@@ -51,7 +106,7 @@ def fetch_pbp_for_game_ids_via_nflreadpy(
                 game_id=gid,
                 pbp_rows=n,
                 status="loaded" if n > 0 else "not_found_in_release",
-                detail="",
+                detail=source_note,
             )
         )
 
@@ -9,10 +9,11 @@ from typing import Optional
 class Paths:
     out_path: Path
     processed_dir: Path
-    latest_path: Path
     log_path: Path
     status_path: Path
     positions_path: Optional[Path]
+    pbp_cache_dir: Path
+    store_dir: Path
 
 
 def get_paths(out_path: str | None = None, season: int | None = None) -> Paths:
@@ -32,8 +33,9 @@ def get_paths(out_path: str | None = None, season: int | None = None) -> Paths:
     return Paths(
         out_path=outp,
         processed_dir=processed_dir,
-        latest_path=processed_dir / "scoring_plays_latest.csv",
         log_path=processed_dir / "refresh_log.csv",
         status_path=processed_dir / "refresh_status.csv",
         positions_path=positions_path,
+        pbp_cache_dir=processed_dir / "pbp_cache",
+        store_dir=processed_dir / "scoring_plays_store",
     )
@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import argparse
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
 from dotenv import load_dotenv
 
-from .nflreadpy_pbp import fetch_pbp_for_game_ids_via_nflreadpy
+from src.scoring import load_player_positions
+from src.scoring.incremental import update_scoring_state
+
+from .live_pbp import PendingGtdCache
 from .logging import LogRow, write_log_and_status
-from .paths import get_paths
+from .paths import Paths, get_paths
 from .positions import ensure_player_positions
 from .scoring_plays import ScoringPlaysConfig, derive_scoring_plays
-from .upsert import upsert_latest_wins
+from .sources import SOURCE_MODES, GameSourceMetrics, fetch_pbp_by_source
+from .store import ScoringPlayStore, diff_manifests
+from .upsert import upsert_game_snapshots
 
 
 @dataclass(frozen=True)
@@ -23,12 +29,54 @@ class RefreshResult:
     rows_scoring: int
     rows_out: int
     any_loaded: bool
+    rows_retracted: int = 0
+    # From the store manifests before/after this run (see diff_manifests)
+    rows_before: int = 0
+    changed_games: tuple[str, ...] = ()
+    # Highest pbp play_id fetched per game (games with no pbp are absent)
+    max_play_ids: dict[str, int] = field(default_factory=dict)
+    # Per game: which source served it and how long the fetch took
+    game_sources: tuple[GameSourceMetrics, ...] = ()
+
+
+def _file_version(path: Path | None) -> int:
+    try:
+        return path.stat().st_mtime_ns if path is not None else 0
+    except OSError:
+        return 0
 
 
-def _read_csv_if_exists(path: Path) -> pd.DataFrame | None:
-    if path.exists():
-        return pd.read_csv(path)
-    return None
+def _update_scoring_state(
+    *,
+    paths: Paths,
+    season: int,
+    load_plays: Callable[[], pd.DataFrame],
+    changed: pd.DataFrame,
+    retracted: pd.DataFrame,
+    plays_version_before: int,
+    plays_version_after: int,
+) -> None:
+    """
+    Best effort: fold this upsert's changed plays into the persisted incremental
+    scoring state. A failure leaves the state behind the scoring-plays file,
+    which makes the next refresh rebuild it.
+    """
+    if paths.positions_path is None or not paths.positions_path.exists():
+        return
+    try:
+        update_scoring_state(
+            processed_dir=paths.processed_dir,
+            season=season,
+            load_plays=load_plays,
+            changed=changed,
+            retracted=retracted,
+            rosters=load_player_positions(paths.positions_path),
+            plays_version_before=plays_version_before,
+            plays_version_after=plays_version_after,
+            positions_version=str(_file_version(paths.positions_path)),
+        )
+    except Exception:
+        pass
 
 
 def refresh_pbp(
@@ -38,13 +86,18 @@ def refresh_pbp(
     game_ids: list[str] | None,
     out_path: Path,
     metrics_out_path: Path | None = None,
+    source: str = "hybrid",
 ) -> RefreshResult:
     """
     Python replacement for refresh_pbp.R.
 
-    This version fetches *live* play-by-play (GameCenter GTD JSON) for the requested
-    nflfastR-style game_ids, normalizes into a pbp-like DataFrame, derives scoring plays,
-    and upserts into the cumulative scoring_plays CSV.
+    This version fetches play-by-play for the requested nflfastR-style game_ids
+    from the source each game calls for (src/pbp/sources.py): in-progress games
+    from the live GameCenter GTD feed, finished ones from the nflverse release
+    (`source="release"` / `"gtd"` forces one). Both are normalized into one
+    pbp-like DataFrame, from which scoring plays are derived and upserted into
+    the scoring-plays store (src/pbp/store.py), which also exports the
+    cumulative scoring_plays CSV.
 
     Notes:
     - If GTD is not available yet (pre-game) or returns no plays, we do NOT overwrite
@@ -64,13 +117,26 @@ def refresh_pbp(
 
     refreshed_at = datetime.now().isoformat(timespec="seconds")
 
-    # Fetch live pbp + per-game metrics (used here only to decide whether anything loaded)
-    pbp, metrics = fetch_pbp_for_game_ids_via_nflreadpy(season=season, game_ids=game_ids)
+    # Fetch pbp + per-game source metrics. GTD cache updates are committed
+    # only after the store write below, so a failed write is refetched next poll.
+    gtd_pending = PendingGtdCache()
+    pbp, metrics = fetch_pbp_by_source(
+        season=season,
+        game_ids=game_ids,
+        cache_dir=paths.pbp_cache_dir,
+        mode=source,
+        gtd_pending=gtd_pending,
+    )
     rows_in = int(len(pbp))
 
     # Determine whether *any* requested game has any pbp rows loaded
     any_loaded = rows_in > 0
 
+    max_play_ids: dict[str, int] = {}
+    if any_loaded and {"game_id", "play_id"}.issubset(pbp.columns):
+        mx = pd.to_numeric(pbp["play_id"], errors="coerce").groupby(pbp["game_id"].astype(str)).max()
+        max_play_ids = {str(g): int(v) for g, v in mx.items() if pd.notna(v)}
+
     # Derive scoring plays (your logic)
     scoring = derive_scoring_plays(
         pbp,
@@ -79,11 +145,17 @@ def refresh_pbp(
 
     rows_scoring = int(len(scoring)) if not scoring.empty else 0
 
-    # Read existing cumulative output
-    old = _read_csv_if_exists(paths.out_path)
+    # Existing plays live in the partitioned store; a legacy cumulative CSV is
+    # imported into it once.
+    store = ScoringPlayStore(paths.store_dir)
+    if not store.exists() and paths.out_path.exists():
+        store.import_csv(paths.out_path)
+    plays_version_before = store.version()
+    manifest_before = store.manifest()
+    rows_stored = sum(p.rows for p in manifest_before.values())
 
     # If nothing loaded yet and we already have an output file, do nothing destructive.
-    if not any_loaded and old is not None and not old.empty:
+    if not any_loaded and rows_stored > 0:
         # Still write a log/status line indicating no-op
         write_log_and_status(
             LogRow(
@@ -93,31 +165,60 @@ def refresh_pbp(
                 game_ids=",".join(game_ids),
                 rows_in=rows_in,
                 rows_scoring=rows_scoring,
-                rows_out=len(old),
+                rows_out=rows_stored,
                 status="ok",
                 detail="no_live_pbp_available_yet",
             ),
             log_path=paths.log_path,
             status_path=paths.status_path,
         )
-        return RefreshResult(rows_in=rows_in, rows_scoring=rows_scoring, rows_out=len(old), any_loaded=False)
+        gtd_pending.commit()
+        return RefreshResult(
+            rows_in=rows_in,
+            rows_scoring=rows_scoring,
+            rows_out=rows_stored,
+            any_loaded=False,
+            rows_before=rows_stored,
+            game_sources=tuple(metrics),
+        )
 
-    # If no scoring rows but pbp exists, we still allow the upsert (it will be no-op),
-    # but we should not overwrite with empty if old exists. Upsert handles this safely.
-    if old is None or old.empty:
-        combined = scoring.copy() if not scoring.empty else pd.DataFrame()
+    # Game-scoped upsert: only the partitions of games in this batch are read,
+    # merged and rewritten. A game whose pbp loaded in this fetch is a complete
+    # snapshot, so its stored plays that are no longer scoring plays are
+    # retracted (tombstoned). With nothing to write this still creates an empty
+    # manifest/CSV on first run.
+    snapshot_games = sorted({str(m.game_id) for m in metrics if m.pbp_rows > 0 and m.status != "unchanged"})
+    touched = sorted(set(snapshot_games) | (set(scoring["game_id"].astype(str)) if not scoring.empty else set()))
+    if touched:
+        merged, changed, tombstones = upsert_game_snapshots(
+            store.read(touched),
+            scoring,
+            snapshot_game_ids=snapshot_games,
+            source_plays=pbp[["game_id", "play_id"]] if {"game_id", "play_id"}.issubset(pbp.columns) else None,
+            retracted_at=refreshed_at,
+        )
     else:
-        combined = upsert_latest_wins(old, scoring) if not scoring.empty else old.copy()
-
-    rows_out = int(len(combined)) if combined is not None and not combined.empty else 0
-
-    # Write cumulative + latest (only if we have a dataframe to write)
-    # If combined is empty and old is empty, it's fine to write empty CSV.
-    if combined is None:
-        combined = pd.DataFrame()
-
-    combined.to_csv(paths.out_path, index=False)
-    combined.to_csv(paths.latest_path, index=False)
+        merged, changed, tombstones = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    store.write_games(merged, game_ids=touched)
+    store.record_tombstones(tombstones)
+    # The compatibility CSV is a full export, so skip it when nothing changed.
+    if not changed.empty or not tombstones.empty or not paths.out_path.exists():
+        store.export_csv(paths.out_path)
+    diff = diff_manifests(manifest_before, store.manifest())
+    gtd_pending.commit()
+    rows_out = diff.rows_after
+    rows_retracted = int(len(tombstones))
+
+    # Scoring totals/events follow the upsert incrementally (src/scoring/incremental.py)
+    _update_scoring_state(
+        paths=paths,
+        season=season,
+        load_plays=lambda: store.read(season=season),
+        changed=changed,
+        retracted=tombstones,
+        plays_version_before=plays_version_before,
+        plays_version_after=store.version(),
+    )
 
     # Optional metrics output: keep it lightweight (run-level record).
     # Per-game state metrics remain owned by refresh.py.
@@ -133,6 +234,7 @@ def refresh_pbp(
                     "rows_in": rows_in,
                     "rows_scoring": rows_scoring,
                     "rows_out": rows_out,
+                    "rows_retracted": rows_retracted,
                 }
             ]
         ).to_csv(metrics_out_path, index=False)
@@ -148,13 +250,23 @@ def refresh_pbp(
             rows_scoring=rows_scoring,
             rows_out=rows_out,
             status="ok",
-            detail="",
+            detail=f"retracted={rows_retracted}" if rows_retracted else "",
         ),
         log_path=paths.log_path,
         status_path=paths.status_path,
     )
 
-    return RefreshResult(rows_in=rows_in, rows_scoring=rows_scoring, rows_out=rows_out, any_loaded=any_loaded)
+    return RefreshResult(
+        rows_in=rows_in,
+        rows_scoring=rows_scoring,
+        rows_out=rows_out,
+        any_loaded=any_loaded,
+        rows_retracted=rows_retracted,
+        rows_before=diff.rows_before,
+        changed_games=diff.changed_games,
+        max_play_ids=max_play_ids,
+        game_sources=tuple(metrics),
+    )
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -166,6 +278,7 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--game_ids", type=str, default="")
     p.add_argument("--out", type=str, default=os.getenv("BBB_OUT_PATH", "data/processed/scoring_plays.csv"))
     p.add_argument("--metrics_out", type=str, default=os.getenv("BBB_METRICS_OUT_PATH", ""))
+    p.add_argument("--source", choices=SOURCE_MODES, default=os.getenv("BBB_PBP_SOURCE", "hybrid"))
 
     args = p.parse_args(argv)
 
@@ -181,6 +294,7 @@ def main(argv: list[str] | None = None) -> int:
         game_ids=game_ids if game_ids else None,
         out_path=Path(args.out),
         metrics_out_path=metrics_path,
+        source=args.source,
     )
     return 0
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+
+PBP_RELEASE_URL = (
+    "https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
+)
+
+# Within this window a cached release is trusted without asking upstream.
+DEFAULT_MIN_CHECK_INTERVAL_S = 5 * 60
+
+
+@dataclass(frozen=True)
+class ReleaseMeta:
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    downloaded_at: str
+    checked_at: float
+    bytes: int
+
+
+@dataclass(frozen=True)
+class ReleaseCacheResult:
+    path: Path
+    status: str  # "fresh" | "not_modified" | "downloaded" | "stale_fallback"
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    detail: str = ""
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def release_paths(season: int, cache_dir: Path) -> tuple[Path, Path]:
+    """
+    (parquet_path, meta_path) for a cached season release.
+    """
+    return (
+        cache_dir / f"play_by_play_{season}.parquet",
+        cache_dir / f"play_by_play_{season}.meta.json",
+    )
+
+
+def _read_meta(meta_path: Path) -> ReleaseMeta | None:
+    if not meta_path.exists():
+        return None
+    try:
+        return ReleaseMeta(**json.loads(meta_path.read_text()))
+    except Exception:
+        return None
+
+
+def _write_meta(meta: ReleaseMeta, meta_path: Path) -> None:
+    tmp = meta_path.with_suffix(meta_path.suffix + ".tmp")
+    tmp.write_text(json.dumps(asdict(meta), indent=2))
+    tmp.replace(meta_path)
+
+
+def ensure_season_pbp_cached(
+    season: int,
+    *,
+    cache_dir: Path,
+    url_template: str | None = None,
+    min_check_interval_s: float = DEFAULT_MIN_CHECK_INTERVAL_S,
+    timeout_s: float = 60.0,
+    session: requests.Session | None = None,
+) -> ReleaseCacheResult:
+    """
+    Make sure `cache_dir` holds the season PBP release as parquet, re-pulling only
+    when upstream is newer.
+
+    - Cached copy checked within `min_check_interval_s`: used as-is (no network).
+    - Otherwise a conditional GET (If-None-Match / If-Modified-Since) is sent; a 304,
+      or a 200 carrying the ETag we already have, keeps the cached file.
+    - Network/HTTP failures fall back to the cached copy when one exists.
+
+    The release host can be overridden via BBB_PBP_RELEASE_URL (a template with
+    `{season}`), e.g. to point at a local mirror.
+    """
+    url = (url_template or os.getenv("BBB_PBP_RELEASE_URL") or PBP_RELEASE_URL).format(season=season)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    parquet_path, meta_path = release_paths(season, cache_dir)
+
+    meta = _read_meta(meta_path)
+    have_cached = parquet_path.exists() and meta is not None and meta.url == url
+
+    if have_cached and (time.time() - meta.checked_at) < min_check_interval_s:
+        return ReleaseCacheResult(
+            path=parquet_path, status="fresh", etag=meta.etag, last_modified=meta.last_modified
+        )
+
+    headers: dict[str, str] = {"Accept": "application/octet-stream, */*"}
+    if have_cached:
+        if meta.etag:
+            headers["If-None-Match"] = meta.etag
+        if meta.last_modified:
+            headers["If-Modified-Since"] = meta.last_modified
+
+    http = session or requests
+    try:
+        r = http.get(url, headers=headers, timeout=timeout_s, stream=True)
+    except Exception as e:
+        if have_cached:
+            return ReleaseCacheResult(
+                path=parquet_path,
+                status="stale_fallback",
+                etag=meta.etag,
+                last_modified=meta.last_modified,
+                detail=f"Request failed for {url}: {e}",
+            )
+        raise RuntimeError(f"Request failed for {url}: {e}") from e
+
+    with r:
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+
+        if have_cached and (r.status_code == 304 or (r.status_code == 200 and etag and etag == meta.etag)):
+            _write_meta(ReleaseMeta(**{**asdict(meta), "checked_at": time.time()}), meta_path)
+            return ReleaseCacheResult(
+                path=parquet_path, status="not_modified", etag=meta.etag, last_modified=meta.last_modified
+            )
+
+        if r.status_code != 200:
+            detail = f"Release HTTP {r.status_code} for {url}"
+            if have_cached:
+                return ReleaseCacheResult(
+                    path=parquet_path,
+                    status="stale_fallback",
+                    etag=meta.etag,
+                    last_modified=meta.last_modified,
+                    detail=detail,
+                )
+            raise RuntimeError(detail)
+
+        tmp = parquet_path.with_suffix(parquet_path.suffix + ".tmp")
+        n_bytes = 0
+        try:
+            with tmp.open("wb") as fh:
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    if chunk:
+                        fh.write(chunk)
+                        n_bytes += len(chunk)
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            if have_cached:
+                return ReleaseCacheResult(
+                    path=parquet_path,
+                    status="stale_fallback",
+                    etag=meta.etag,
+                    last_modified=meta.last_modified,
+                    detail=f"Download interrupted for {url}: {e}",
+                )
+            raise RuntimeError(f"Download interrupted for {url}: {e}") from e
+
+    tmp.replace(parquet_path)  # atomic rename on typical filesystems
+    _write_meta(
+        ReleaseMeta(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            downloaded_at=_now_utc_iso(),
+            checked_at=time.time(),
+            bytes=n_bytes,
+        ),
+        meta_path,
+    )
+    return ReleaseCacheResult(path=parquet_path, status="downloaded", etag=etag, last_modified=last_modified)
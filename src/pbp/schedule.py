@@ -1,11 +1,37 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import nflreadpy as nfl
 
 
+# Schedule scores drive elimination, so keep the TTL short enough to pick up
+# finals during a playoff weekend.
+DEFAULT_SCHEDULE_TTL_S = 15 * 60
+# After a failed download the stale copy is served this long before trying again.
+SCHEDULE_RETRY_AFTER_FAILURE_S = 60
+DEFAULT_CACHE_DIR = Path("data/processed")
+
+# nflverse gameday/gametime are US/Eastern wall-clock values.
+_SCHEDULE_TZ = "America/New_York"
+
+_INDEX_COLUMNS = [
+    "game_id",
+    "event_id",
+    "week",
+    "kickoff_utc",
+    "home_team",
+    "away_team",
+    "home_score",
+    "away_score",
+]
+
+
 def _to_pandas(df) -> pd.DataFrame:
     """
     nflreadpy returns Polars DataFrames; convert safely to pandas.
@@ -24,6 +50,8 @@ def _to_pandas(df) -> pd.DataFrame:
 def load_schedules(season: int) -> pd.DataFrame:
     """
     Load schedules for a given season via nflreadpy (nflverse repos).
+
+    This always hits nflreadpy; most callers want get_schedule_index() instead.
     """
     sched_pl = nfl.load_schedules(seasons=season)
     sched = _to_pandas(sched_pl)
@@ -41,58 +69,271 @@ def load_schedules(season: int) -> pd.DataFrame:
     return sched
 
 
-def resolve_game_ids_for_week(season: int, week: int) -> List[str]:
+@dataclass(frozen=True)
+class ScheduledGame:
+    game_id: str
+    event_id: Optional[str]
+    week: Optional[int]
+    kickoff_utc: Optional[str]  # e.g. 2024-01-13T21:30:00Z
+    home_team: Optional[str]
+    away_team: Optional[str]
+    home_score: Optional[int]
+    away_score: Optional[int]
+
+    @property
+    def has_result(self) -> bool:
+        return self.home_score is not None and self.away_score is not None
+
+
+@dataclass(frozen=True)
+class ScheduleIndex:
     """
-    Return nflfastR-style game_id strings for a given season+week.
+    One season's schedule, reduced to the fields the app needs and indexed for
+    O(1) lookups by game_id and week.
     """
-    sched = load_schedules(season)
-    if sched.empty:
-        return []
 
-    if "week" not in sched.columns or "game_id" not in sched.columns:
-        return []
+    season: int
+    built_at: float
+    games: Dict[str, ScheduledGame] = field(default_factory=dict)
+    by_week: Dict[int, Tuple[str, ...]] = field(default_factory=dict)
 
-    sub = sched.loc[sched["week"] == int(week)].copy()
-    if sub.empty:
-        return []
+    def game(self, game_id: str) -> Optional[ScheduledGame]:
+        return self.games.get(str(game_id).strip())
 
-    return sorted({str(x) for x in sub["game_id"].dropna().astype(str).tolist()})
+    def event_id(self, game_id: str) -> Optional[str]:
+        g = self.game(game_id)
+        return g.event_id if g is not None else None
 
+    def game_ids_for_week(self, week: int) -> List[str]:
+        return list(self.by_week.get(int(week), ()))
 
-def game_id_to_event_id_map(season: int) -> Dict[str, str]:
+    def event_id_map(self) -> Dict[str, str]:
+        return {gid: g.event_id for gid, g in self.games.items() if g.event_id}
+
+    @classmethod
+    def from_frame(cls, season: int, df: pd.DataFrame, *, built_at: float | None = None) -> "ScheduleIndex":
+        """
+        Build from a slim frame with _INDEX_COLUMNS (see _slim_schedule).
+        """
+        built_at = time.time() if built_at is None else built_at
+        if df is None or df.empty:
+            return cls(season=season, built_at=built_at)
+
+        df = df.loc[df["game_id"].notna()]
+
+        def _opt_str(s: pd.Series) -> List[Optional[str]]:
+            s = s.astype("string").str.strip()
+            return [None if pd.isna(v) or v == "" else str(v) for v in s]
+
+        def _opt_int(s: pd.Series) -> List[Optional[int]]:
+            s = pd.to_numeric(s, errors="coerce").astype("Int64")
+            return [None if pd.isna(v) else int(v) for v in s]
+
+        games = {
+            g.game_id: g
+            for g in map(
+                ScheduledGame,
+                df["game_id"].astype(str).str.strip().tolist(),
+                _opt_str(df["event_id"]),
+                _opt_int(df["week"]),
+                _opt_str(df["kickoff_utc"]),
+                _opt_str(df["home_team"]),
+                _opt_str(df["away_team"]),
+                _opt_int(df["home_score"]),
+                _opt_int(df["away_score"]),
+            )
+            if g.game_id
+        }
+
+        weeks: Dict[int, List[str]] = {}
+        for g in games.values():
+            if g.week is not None:
+                weeks.setdefault(g.week, []).append(g.game_id)
+        by_week = {wk: tuple(sorted(gids)) for wk, gids in weeks.items()}
+
+        return cls(season=season, built_at=built_at, games=games, by_week=by_week)
+
+
+def _slim_schedule(sched: pd.DataFrame) -> pd.DataFrame:
     """
-    Build mapping from nflfastR-style game_id (e.g., 2023_19_CLE_HOU)
-    to the 10-digit NFL GameCenter event id used by the GTD endpoint.
+    Reduce a raw nflverse schedule to _INDEX_COLUMNS with vectorized conversions.
+    """
+    if sched is None or sched.empty or "game_id" not in sched.columns:
+        return pd.DataFrame(columns=_INDEX_COLUMNS)
 
-    In your schedule rows, this value is in 'old_game_id' (e.g., 2024011300).
+    n = len(sched)
+
+    def col(name: str) -> pd.Series:
+        if name in sched.columns:
+            return sched[name]
+        return pd.Series([pd.NA] * n, index=sched.index)
+
+    # old_game_id is the 10-digit GameCenter event id (e.g., 2024011300); it can
+    # arrive as float or string depending on the source.
+    oid = col("old_game_id")
+    oid_num = pd.to_numeric(oid, errors="coerce")
+    event_id = oid_num.astype("Int64").astype("string")
+    event_id = event_id.fillna(oid.astype("string").str.strip())
+
+    local = pd.to_datetime(
+        col("gameday").astype("string") + " " + col("gametime").astype("string").fillna("00:00"),
+        errors="coerce",
+    )
+    kickoff = (
+        local.dt.tz_localize(_SCHEDULE_TZ, ambiguous="NaT", nonexistent="NaT")
+        .dt.tz_convert("UTC")
+        .dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    )
+
+    return pd.DataFrame(
+        {
+            "game_id": col("game_id").astype("string").str.strip(),
+            "event_id": event_id,
+            "week": pd.to_numeric(col("week"), errors="coerce").astype("Int64"),
+            "kickoff_utc": kickoff.astype("string"),
+            "home_team": col("home_team").astype("string"),
+            "away_team": col("away_team").astype("string"),
+            "home_score": pd.to_numeric(col("home_score"), errors="coerce").astype("Int64"),
+            "away_score": pd.to_numeric(col("away_score"), errors="coerce").astype("Int64"),
+        }
+    )
+
+
+def _index_cache_path(season: int, cache_dir: Path) -> Path:
+    return cache_dir / f"schedule_index_{season}.csv"
+
+
+def _read_index_csv(path: Path, season: int) -> ScheduleIndex | None:
+    try:
+        df = pd.read_csv(path, dtype={"game_id": "string", "event_id": "string"})
+    except Exception:
+        return None
+    if not set(_INDEX_COLUMNS).issubset(df.columns):
+        return None
+    return ScheduleIndex.from_frame(season, df, built_at=path.stat().st_mtime)
+
+
+_INDEXES: Dict[int, ScheduleIndex] = {}
+_RETRY_AT: Dict[int, float] = {}  # season -> no download before this time
+_SEASON_LOCKS: Dict[int, threading.Lock] = {}
+_INDEX_LOCK = threading.Lock()  # guards the dicts above; never held during I/O
+_LOAD_COUNT = 0
+
+
+def schedule_load_count() -> int:
     """
-    sched = load_schedules(season)
-    if sched.empty:
-        return {}
+    Number of upstream schedule downloads made by get_schedule_index() in this process.
+    """
+    return _LOAD_COUNT
+
+
+def clear_schedule_index_cache() -> None:
+    with _INDEX_LOCK:
+        _INDEXES.clear()
+        _RETRY_AT.clear()
+
+
+def _memory_hit(season: int, now: float, ttl_s: float) -> ScheduleIndex | None:
+    # Caller holds _INDEX_LOCK.
+    mem = _INDEXES.get(season)
+    if mem is not None and ((now - mem.built_at) < ttl_s or now < _RETRY_AT.get(season, 0.0)):
+        return mem
+    return None
+
+
+def get_schedule_index(
+    season: int,
+    *,
+    ttl_s: float = DEFAULT_SCHEDULE_TTL_S,
+    cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    force: bool = False,
+) -> ScheduleIndex:
+    """
+    Memoized ScheduleIndex for `season`.
+
+    Lookup order: in-memory (younger than ttl_s) -> on-disk CSV in `cache_dir`
+    (younger than ttl_s) -> nflreadpy download. If the download fails, a stale
+    memory/disk copy is returned rather than raising, and served without another
+    download attempt for SCHEDULE_RETRY_AFTER_FAILURE_S.
+
+    Downloads hold a per-season lock, so concurrent callers for one season share
+    a download while memory hits and other seasons are not held up.
+    """
+    global _LOAD_COUNT
+    season = int(season)
+    path = _index_cache_path(season, cache_dir) if cache_dir is not None else None
+
+    if not force:
+        with _INDEX_LOCK:
+            hit = _memory_hit(season, time.time(), ttl_s)
+        if hit is not None:
+            return hit
+
+    with _INDEX_LOCK:
+        season_lock = _SEASON_LOCKS.setdefault(season, threading.Lock())
 
-    if "game_id" not in sched.columns or "old_game_id" not in sched.columns:
-        return {}
+    with season_lock:
+        now = time.time()
+        with _INDEX_LOCK:
+            mem = _INDEXES.get(season)
+            # Another caller may have loaded it while we waited.
+            hit = None if force else _memory_hit(season, now, ttl_s)
+        if hit is not None:
+            return hit
+
+        disk = _read_index_csv(path, season) if path is not None and path.exists() else None
+        if not force and disk is not None and (now - disk.built_at) < ttl_s:
+            with _INDEX_LOCK:
+                _INDEXES[season] = disk
+            return disk
 
-    out: Dict[str, str] = {}
-    for _, r in sched[["game_id", "old_game_id"]].dropna().iterrows():
-        gid = str(r["game_id"]).strip()
-        oid = r["old_game_id"]
         try:
-            event_id = str(int(oid))
+            slim = _slim_schedule(load_schedules(season))
         except Exception:
-            event_id = str(oid).strip()
+            stale = mem or disk
+            if stale is None:
+                raise
+            with _INDEX_LOCK:
+                _INDEXES[season] = stale
+                _RETRY_AT[season] = now + SCHEDULE_RETRY_AFTER_FAILURE_S
+            return stale
+        with _INDEX_LOCK:
+            _LOAD_COUNT += 1
+
+        idx = ScheduleIndex.from_frame(season, slim, built_at=now)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            slim.to_csv(tmp, index=False)
+            tmp.replace(path)
+        with _INDEX_LOCK:
+            _INDEXES[season] = idx
+            _RETRY_AT.pop(season, None)
+        return idx
+
+
+def resolve_game_ids_for_week(season: int, week: int) -> List[str]:
+    """
+    Return nflfastR-style game_id strings for a given season+week.
+    """
+    return get_schedule_index(season).game_ids_for_week(week)
 
-        if gid and event_id:
-            out[gid] = event_id
-    return out
+
+def game_id_to_event_id_map(season: int) -> Dict[str, str]:
+    """
+    Build mapping from nflfastR-style game_id (e.g., 2023_19_CLE_HOU)
+    to the 10-digit NFL GameCenter event id used by the GTD endpoint.
+
+    In your schedule rows, this value is in 'old_game_id' (e.g., 2024011300).
+    """
+    return get_schedule_index(season).event_id_map()
 
 
 def event_id_for_game_id(season: int, game_id: str) -> Optional[str]:
     """
     Convenience wrapper: return 10-digit event id for a single nflfastR game_id.
     """
-    m = game_id_to_event_id_map(season)
-    return m.get(str(game_id).strip())
+    return get_schedule_index(season).event_id(game_id)
 
 
 # Backwards-compatible aliases (so Step 2 file can call gsis_for_game_id)
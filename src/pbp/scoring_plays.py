@@ -16,6 +16,119 @@ class ScoringPlaysConfig:
     week_default: Optional[int] = None
 
 
+# Every pbp column derive_scoring_plays reads (flags + output schema).
+# Loaders project to this list so the ~370-column season release never
+# has to be materialized in full.
+PBP_SOURCE_COLUMNS: tuple[str, ...] = (
+    "season",
+    "week",
+    "game_id",
+    "game_date",
+    "posteam",
+    "defteam",
+    "qtr",
+    "time",
+    "drive",
+    "play_id",
+    "desc",
+    "touchdown",
+    "safety",
+    "field_goal_result",
+    "extra_point_result",
+    "two_point_conv_result",
+    "pass_touchdown",
+    "rush_touchdown",
+    "defensive_two_point_conv",
+    "play_type",
+    "pass",
+    "rush",
+    "qb_dropback",
+    "sack",
+    "interception",
+    "fumble_lost",
+    "return_team",
+    "passer_player_id",
+    "passer_player_name",
+    "receiver_player_id",
+    "receiver_player_name",
+    "rusher_player_id",
+    "rusher_player_name",
+    "kicker_player_id",
+    "kicker_player_name",
+)
+
+
+# Output schema of derive_scoring_plays, as pandas dtypes. The scoring-plays
+# store persists these types so readers never re-infer them.
+SCORING_PLAYS_DTYPES: dict[str, str] = {
+    "refreshed_at": "string",
+    "season": "Int64",
+    "week": "Int64",
+    "game_id": "string",
+    "game_date": "string",
+    "posteam": "string",
+    "defteam": "string",
+    "qtr": "Int64",
+    "time": "string",
+    "drive": "Int64",
+    "play_id": "Int64",
+    "desc": "string",
+    "touchdown": "Int64",
+    "field_goal_result": "string",
+    "extra_point_result": "string",
+    "two_point_conv_result": "string",
+    "safety": "Int64",
+    "is_td": "bool",
+    "is_fg": "bool",
+    "is_xp": "bool",
+    "is_2pt": "bool",
+    "is_safety": "bool",
+    "pass_touchdown": "bool",
+    "rush_touchdown": "bool",
+    "is_td_off": "bool",
+    "is_td_def": "bool",
+    "defensive_two_point_conv": "Int64",
+    "is_def_two_pt": "bool",
+    "play_type": "string",
+    "pass": "Int64",
+    "rush": "Int64",
+    "qb_dropback": "Int64",
+    "sack": "Int64",
+    "interception": "Int64",
+    "fumble_lost": "Int64",
+    "return_team": "string",
+    "passer_player_id": "string",
+    "passer_player_name": "string",
+    "receiver_player_id": "string",
+    "receiver_player_name": "string",
+    "rusher_player_id": "string",
+    "rusher_player_name": "string",
+    "kicker_player_id": "string",
+    "kicker_player_name": "string",
+}
+
+
+def coerce_scoring_plays(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast scoring plays (e.g. read back from CSV) to SCORING_PLAYS_DTYPES.
+    Missing schema columns are added as NA/False; extra columns are kept as strings.
+    """
+    n = len(df)
+    out = {}
+    for name, dtype in SCORING_PLAYS_DTYPES.items():
+        src = col_or(df, name, [pd.NA] * n)
+        if dtype == "Int64":
+            out[name] = as_int(src).values
+        elif dtype == "bool":
+            out[name] = as_lgl(src).values
+        else:
+            out[name] = as_chr(src).values
+    for name in df.columns:
+        if name not in out:
+            out[name] = as_chr(df[name]).values
+    return pd.DataFrame(out, index=df.index)
+
+
 def derive_scoring_plays(pbp: pd.DataFrame, cfg: ScoringPlaysConfig | None = None) -> pd.DataFrame:
     """
     Derive scoring plays from a pbp-like dataframe.
@@ -111,7 +224,8 @@ def derive_scoring_plays(pbp: pd.DataFrame, cfg: ScoringPlaysConfig | None = Non
     out["is_td_def"] = is_td_def.fillna(False)
     out["is_scoring_play"] = is_scoring_play.fillna(False)
 
-    out = out.loc[out["is_scoring_play"].fillna(False)].copy()
+    # Positional index: schema defaults below are built from plain lists.
+    out = out.loc[out["is_scoring_play"].fillna(False)].reset_index(drop=True)
 
     # Helper to pull or default for schema
     def _c(name: str, default) -> pd.Series:
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .live_pbp import PendingGtdCache, fetch_live_pbp_for_game_ids
+from .nflreadpy_pbp import fetch_pbp_for_game_ids_via_nflreadpy
+from .schedule import ScheduleIndex, get_schedule_index
+from .scoring_plays import PBP_SOURCE_COLUMNS, SCORING_PLAYS_DTYPES
+from .utils import as_chr, as_int, as_lgl
+
+# Final scores decide the source, so accept at most a minute-old schedule
+# (the same freshness refresh.py uses for eliminations).
+ROUTE_SCHEDULE_TTL_S = 60
+
+SOURCE_GTD = "gtd"
+SOURCE_RELEASE = "release"
+
+# refresh_pbp(source=...): "hybrid" routes per game, the others force one source.
+SOURCE_MODES = ("hybrid", SOURCE_RELEASE, SOURCE_GTD)
+
+
+@dataclass(frozen=True)
+class GameSourceMetrics:
+    """
+    Where one game's pbp came from in a refresh and how long it took.
+    `fetch_ms` for release games is the shared release load time.
+    """
+
+    game_id: str
+    source: str  # "gtd" or "release"
+    reason: str  # why it was routed there (see route_game_sources)
+    status: str  # the source's status: "ok", "unchanged", "loaded", "not_found_in_release", ...
+    pbp_rows: int
+    fetch_ms: Optional[float]
+    detail: str = ""
+
+    @property
+    def loaded(self) -> bool:
+        """The fetch succeeded and the game has pbp ("unchanged" reports the last known rows)."""
+        return self.pbp_rows > 0 and self.status in ("ok", "unchanged", "loaded")
+
+    @property
+    def awaiting_release(self) -> bool:
+        """A final game the release does not have yet, served from GTD instead."""
+        return self.reason == "release_lag"
+
+
+def route_game_sources(
+    game_ids: Iterable[str],
+    index: ScheduleIndex | None,
+    *,
+    mode: str = "hybrid",
+) -> Dict[str, Tuple[str, str]]:
+    """
+    {game_id: (source, reason)}. In "hybrid" mode:
+
+    - final in the schedule -> release ("final")
+    - otherwise, with a GameCenter event id -> GTD ("live"; upcoming games
+      just come back as not loaded yet)
+    - not in the schedule / no event id -> release ("no_event_id"), since GTD
+      cannot be addressed without one
+
+    Finals the release does not carry yet are re-routed to GTD by
+    fetch_pbp_by_source.
+    """
+    if mode not in SOURCE_MODES:
+        raise ValueError(f"source must be one of {SOURCE_MODES}, got {mode!r}")
+
+    routes: Dict[str, Tuple[str, str]] = {}
+    for gid in dict.fromkeys(str(g).strip() for g in game_ids):
+        if not gid:
+            continue
+        if mode != "hybrid":
+            routes[gid] = (mode, "forced")
+            continue
+        game = index.game(gid) if index is not None else None
+        if game is not None and game.has_result:
+            routes[gid] = (SOURCE_RELEASE, "final")
+        elif game is not None and game.event_id:
+            routes[gid] = (SOURCE_GTD, "live")
+        else:
+            routes[gid] = (SOURCE_RELEASE, "no_event_id")
+    return routes
+
+
+def _week_from_game_id(game_id: pd.Series) -> pd.Series:
+    # nflfastR game ids: YYYY_WW_AWAY_HOME
+    return pd.to_numeric(game_id.str.split("_").str[1], errors="coerce").astype("Int64")
+
+
+def _iso_date(value: str) -> Optional[str]:
+    # Per value, so each keeps its own UTC offset (the local game date).
+    try:
+        return pd.Timestamp(value).strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+def normalize_pbp(pbp: pd.DataFrame, *, season: int) -> pd.DataFrame:
+    """
+    Project a pbp frame from either source onto PBP_SOURCE_COLUMNS (missing
+    columns as NA), typed as in SCORING_PLAYS_DTYPES, with the fields GTD
+    lacks filled in: season from the refresh, week from game_id, game_date as
+    YYYY-MM-DD.
+    """
+    if pbp is None or pbp.empty:
+        return pd.DataFrame(columns=list(PBP_SOURCE_COLUMNS))
+
+    src = pbp.reindex(columns=list(PBP_SOURCE_COLUMNS)).reset_index(drop=True)
+    out = pd.DataFrame(index=src.index)
+    for name in PBP_SOURCE_COLUMNS:
+        dtype = SCORING_PLAYS_DTYPES[name]
+        cast = as_int if dtype == "Int64" else as_lgl if dtype == "bool" else as_chr
+        out[name] = cast(src[name]).values
+
+    out["game_id"] = out["game_id"].str.strip()
+    out["season"] = out["season"].fillna(int(season))
+    out["week"] = out["week"].fillna(_week_from_game_id(out["game_id"]))
+
+    raw_date = out["game_date"].astype("string")
+    iso = raw_date.map({v: _iso_date(v) for v in raw_date.dropna().unique()}).astype("string")
+    out["game_date"] = iso.fillna(raw_date)
+    return out
+
+
+def _elapsed_ms(t0: float) -> float:
+    return round((time.perf_counter() - t0) * 1000.0, 1)
+
+
+def _fetch_gtd(
+    season: int,
+    game_ids: List[str],
+    reasons: Dict[str, str],
+    pending: PendingGtdCache | None,
+) -> Tuple[pd.DataFrame, List[GameSourceMetrics]]:
+    pbp, live = fetch_live_pbp_for_game_ids(season=season, game_ids=game_ids, pending=pending)
+    metrics = [
+        GameSourceMetrics(
+            game_id=m.game_id,
+            source=SOURCE_GTD,
+            reason=reasons[m.game_id],
+            status=m.status,
+            pbp_rows=m.pbp_rows,
+            fetch_ms=m.fetch_ms,
+            detail=m.detail,
+        )
+        for m in live
+    ]
+    return pbp, metrics
+
+
+def fetch_pbp_by_source(
+    *,
+    season: int,
+    game_ids: Iterable[str],
+    cache_dir: Path | None = None,
+    index: ScheduleIndex | None = None,
+    mode: str = "hybrid",
+    gtd_pending: PendingGtdCache | None = None,
+) -> Tuple[pd.DataFrame, List[GameSourceMetrics]]:
+    """
+    Load pbp for `game_ids`, each game from the source route_game_sources
+    picks: in-progress games from the live GTD feed (seconds behind), finished
+    games from the nflverse release (complete, but hours behind). The season
+    release is only scanned when some game is routed to it.
+
+    Both sources are normalized with normalize_pbp, so derive_scoring_plays sees
+    one schema. Metrics come back one per game in `game_ids` order. Without
+    `index`, the schedule index is loaded (at most ROUTE_SCHEDULE_TTL_S old); if
+    that fails every game goes to the release, as before.
+
+    If the release cannot be loaded at all, its games are reported with
+    status="error" and, in "hybrid" mode, final games fall back to GTD as when
+    the release lags; the GTD games are fetched either way.
+
+    `gtd_pending` is passed to fetch_live_pbp_for_game_ids: GTD cache updates
+    wait there until the caller has persisted the rows.
+    """
+    gids = list(dict.fromkeys(str(g).strip() for g in game_ids if str(g).strip()))
+    if not gids:
+        return pd.DataFrame(), []
+
+    if index is None and mode == "hybrid":
+        try:
+            index = get_schedule_index(season, ttl_s=ROUTE_SCHEDULE_TTL_S)
+        except Exception:
+            index = None
+    routes = route_game_sources(gids, index, mode=mode)
+
+    frames: List[pd.DataFrame] = []
+    by_game: Dict[str, GameSourceMetrics] = {}
+
+    release_ids = [g for g in gids if routes[g][0] == SOURCE_RELEASE]
+    gtd_reasons = {g: routes[g][1] for g in gids if routes[g][0] == SOURCE_GTD}
+
+    if release_ids:
+        t0 = time.perf_counter()
+        try:
+            pbp, release = fetch_pbp_for_game_ids_via_nflreadpy(
+                season=season, game_ids=release_ids, cache_dir=cache_dir
+            )
+        except Exception as e:
+            # No release (not published yet, or no cache and no network): report
+            # it per game and still fetch the live games below.
+            pbp, release, error = pd.DataFrame(), [], f"{type(e).__name__}: {e}"
+        else:
+            error = None
+        ms = _elapsed_ms(t0)
+        frames.append(normalize_pbp(pbp, season=season))
+        if error is not None:
+            for g in release_ids:
+                by_game[g] = GameSourceMetrics(
+                    game_id=g,
+                    source=SOURCE_RELEASE,
+                    reason=routes[g][1],
+                    status="error",
+                    pbp_rows=0,
+                    fetch_ms=ms,
+                    detail=error,
+                )
+                if mode == "hybrid" and routes[g][1] == "final":
+                    gtd_reasons[g] = "release_lag"
+        for m in release:
+            by_game[m.game_id] = GameSourceMetrics(
+                game_id=m.game_id,
+                source=SOURCE_RELEASE,
+                reason=routes[m.game_id][1],
+                status=m.status,
+                pbp_rows=m.pbp_rows,
+                fetch_ms=ms,
+                detail=m.detail,
+            )
+            # Just finished: the release has not caught up yet, keep following GTD.
+            if mode == "hybrid" and m.pbp_rows == 0 and routes[m.game_id][1] == "final":
+                gtd_reasons[m.game_id] = "release_lag"
+
+    if gtd_reasons:
+        pbp, live = _fetch_gtd(season, [g for g in gids if g in gtd_reasons], gtd_reasons, gtd_pending)
+        frames.append(normalize_pbp(pbp, season=season))
+        for m in live:
+            by_game[m.game_id] = m
+
+    frames = [f for f in frames if not f.empty]
+    pbp_all = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return pbp_all, [by_game[g] for g in gids if g in by_game]
+
+
+def source_metrics_to_dataframe(metrics: List[GameSourceMetrics], *, refreshed_at: str) -> pd.DataFrame:
+    columns = ["refreshed_at", "game_id", "source", "reason", "status", "pbp_rows", "fetch_ms", "detail"]
+    if not metrics:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(
+        [
+            {
+                "refreshed_at": refreshed_at,
+                "game_id": m.game_id,
+                "source": m.source,
+                "reason": m.reason,
+                "status": m.status,
+                "pbp_rows": m.pbp_rows,
+                "fetch_ms": m.fetch_ms,
+                "detail": m.detail,
+            }
+            for m in metrics
+        ],
+        columns=columns,
+    )
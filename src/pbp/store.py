@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .scoring_plays import coerce_scoring_plays
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+MANIFEST_NAME = "manifest.json"
+TOMBSTONES_NAME = "tombstones.csv"
+STORE_FORMAT = 1
+
+# Rewritten on every refresh without the play changing; left out of content hashes.
+_UNHASHED_COLS = ("refreshed_at",)
+
+
+@dataclass(frozen=True)
+class GamePartition:
+    game_id: str
+    file: str
+    rows: int
+    season: Optional[int]
+    week: Optional[int]
+    updated_at: str
+    # sha1 over the partition's rows, ignoring refreshed_at ("" in older manifests)
+    content_hash: str = ""
+
+
+@dataclass(frozen=True)
+class ManifestDiff:
+    changed_games: tuple[str, ...]
+    rows_before: int
+    rows_after: int
+
+
+def manifest_hash(games: Dict[str, GamePartition]) -> str:
+    """
+    Store-wide content hash: combines the per-game hashes (and row counts).
+    """
+    h = hashlib.sha1()
+    for gid in sorted(games):
+        p = games[gid]
+        h.update(f"{gid}:{p.rows}:{p.content_hash};".encode("utf-8"))
+    return h.hexdigest()
+
+
+def diff_manifests(before: Dict[str, GamePartition], after: Dict[str, GamePartition]) -> ManifestDiff:
+    """
+    Games added, removed, or whose row count or content hash differs. Compares
+    manifests only, so it costs O(games) and never opens a partition.
+    """
+    changed = []
+    for gid in sorted(set(before) | set(after)):
+        b, a = before.get(gid), after.get(gid)
+        if b is None or a is None or b.rows != a.rows or b.content_hash != a.content_hash:
+            changed.append(gid)
+    return ManifestDiff(
+        changed_games=tuple(changed),
+        rows_before=sum(p.rows for p in before.values()),
+        rows_after=sum(p.rows for p in after.values()),
+    )
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _read_ipc(path: Path) -> "pa.Table":
+    import pyarrow as pa
+
+    with pa.OSFile(str(path), "rb") as f:
+        return pa.ipc.open_file(f).read_all()
+
+
+def _write_ipc(table: "pa.Table", path: Path) -> None:
+    import pyarrow as pa
+
+    with pa.OSFile(str(path), "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _first_int(s: pd.Series) -> Optional[int]:
+    s = pd.to_numeric(s, errors="coerce").dropna()
+    return int(s.iloc[0]) if not s.empty else None
+
+
+class ScoringPlayStore:
+    """
+    Scoring plays persisted as typed Arrow IPC files, one partition per game_id,
+    plus a JSON manifest (rows/season/week/content hash per game). Readers load only the partitions
+    they need; the manifest answers "which games / how many rows" without
+    touching any data file.
+
+    The manifest is rewritten (atomically) after the partitions, so its mtime
+    is the store's data version (see version()).
+
+    Retracted plays are dropped from their partition; the tombstones log
+    (tombstones.csv) keeps a record of what was removed and why.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def version(self) -> int:
+        """
+        Cheap data-version token for cache keys: manifest mtime in ns, or 0.
+        """
+        try:
+            return self.manifest_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    # ---------- manifest ----------
+
+    def manifest(self) -> Dict[str, GamePartition]:
+        if not self.exists():
+            return {}
+        raw = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        return {gid: GamePartition(**p) for gid, p in raw.get("games", {}).items()}
+
+    def _write_manifest(self, games: Dict[str, GamePartition]) -> None:
+        payload = {
+            "format": STORE_FORMAT,
+            "updated_at": _now_utc_iso(),
+            "rows": sum(p.rows for p in games.values()),
+            "content_hash": manifest_hash(games),
+            "games": {gid: vars(games[gid]) for gid in sorted(games)},
+        }
+        # Compact JSON: with thousands of games, indent=2 falls off json's C encoder.
+        tmp = self.manifest_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.manifest_path)
+
+    def game_ids(self, *, season: int | None = None, week_max: int | None = None) -> List[str]:
+        """
+        Game ids in the store, optionally limited to a season and weeks <= week_max.
+        """
+        out = []
+        for gid, p in self.manifest().items():
+            if season is not None and p.season != int(season):
+                continue
+            if week_max is not None and (p.week is None or p.week > int(week_max)):
+                continue
+            out.append(gid)
+        return sorted(out)
+
+    # ---------- read ----------
+
+    def read(
+        self,
+        game_ids: Iterable[str] | None = None,
+        *,
+        season: int | None = None,
+        week_max: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Scoring plays for the requested games (all games when None), loading
+        only their partitions. Column types come from the stored Arrow schema.
+        """
+        manifest = self.manifest()
+        if game_ids is None:
+            wanted = self.game_ids(season=season, week_max=week_max)
+        else:
+            wanted = sorted({str(g) for g in game_ids} & set(manifest))
+            if season is not None or week_max is not None:
+                scoped = set(self.game_ids(season=season, week_max=week_max))
+                wanted = [g for g in wanted if g in scoped]
+
+        import pyarrow as pa
+
+        tables = [_read_ipc(self.root / manifest[g].file) for g in wanted]
+        tables = [t for t in tables if t.num_rows]
+        if not tables:
+            return pd.DataFrame()
+        # One arrow -> pandas conversion for the whole scope (pandas metadata
+        # restores the nullable dtypes).
+        return pa.concat_tables(tables, promote_options="default").combine_chunks().to_pandas()
+
+    # ---------- write ----------
+
+    def write_games(self, df: pd.DataFrame, *, game_ids: Iterable[str] | None = None) -> List[str]:
+        """
+        Replace the partitions of every game in `df` (plus any `game_ids` given
+        explicitly; such a game with no rows in `df` is removed from the store).
+        Returns the game ids written.
+        """
+        import pyarrow as pa
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        games = self.manifest()
+
+        slices: Dict[str, tuple[int, int]] = {}
+        if df is not None and not df.empty:
+            df = coerce_scoring_plays(df)
+            df = df.loc[df["game_id"].notna()]
+            df = df.sort_values(["game_id", "play_id"], kind="mergesort").reset_index(drop=True)
+            # Convert once, then write each game's contiguous slice.
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            row_hashes = pd.util.hash_pandas_object(
+                df.drop(columns=[c for c in _UNHASHED_COLS if c in df.columns]), index=False
+            ).to_numpy()
+            gids = df["game_id"].astype(str).to_numpy()
+            starts = [0] + [i for i in range(1, len(gids)) if gids[i] != gids[i - 1]]
+            for a, b in zip(starts, starts[1:] + [len(gids)]):
+                slices[gids[a]] = (a, b)
+        targets = sorted(set(slices) | {str(g) for g in (game_ids or [])})
+        now = _now_utc_iso()
+
+        for gid in targets:
+            if gid not in slices:
+                old = games.pop(gid, None)
+                if old is not None:
+                    (self.root / old.file).unlink(missing_ok=True)
+                continue
+
+            a, b = slices[gid]
+            fname = f"{gid}.arrow"
+            tmp = self.root / (fname + ".tmp")
+            _write_ipc(table.slice(a, b - a), tmp)
+            tmp.replace(self.root / fname)
+            games[gid] = GamePartition(
+                game_id=gid,
+                file=fname,
+                rows=b - a,
+                season=_first_int(df["season"].iloc[a:b]),
+                week=_first_int(df["week"].iloc[a:b]),
+                updated_at=now,
+                content_hash=hashlib.sha1(row_hashes[a:b].tobytes()).hexdigest(),
+            )
+
+        self._write_manifest(games)
+        return targets
+
+    def record_tombstones(self, tombstones: pd.DataFrame) -> None:
+        """
+        Append retracted plays (see upsert_game_snapshots) to the tombstones log.
+        """
+        if tombstones is None or tombstones.empty:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / TOMBSTONES_NAME
+        tombstones.to_csv(path, index=False, mode="a", header=not path.exists())
+
+    def import_csv(self, path: Path) -> int:
+        """
+        One-time migration from the legacy cumulative CSV. Returns rows imported.
+        """
+        try:
+            df = pd.read_csv(path)
+        except (FileNotFoundError, pd.errors.EmptyDataError):
+            df = pd.DataFrame()
+        self.write_games(df)
+        return int(len(df))
+
+    def export_csv(self, path: Path) -> None:
+        """
+        Write the whole store as the cumulative CSV older consumers read.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        self.read().to_csv(tmp, index=False)
+        tmp.replace(path)
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 import pandas as pd
 
+KEY_COLS = ["game_id", "play_id"]
+
+# Columns that change on every refresh without the play itself changing.
+_VOLATILE_COLS = {"refreshed_at"}
+
+# A retracted scoring play: the key plus enough context to audit it.
+TOMBSTONE_COLUMNS = ["retracted_at", "season", "week", "game_id", "play_id", "reason"]
+
 
 def upsert_latest_wins(old: pd.DataFrame | None, new_scoring: pd.DataFrame) -> pd.DataFrame:
     """
@@ -35,3 +45,184 @@ def upsert_latest_wins(old: pd.DataFrame | None, new_scoring: pd.DataFrame) -> p
     combined = combined.drop_duplicates(subset=["game_id", "play_id"], keep="last")
 
     return combined.reset_index(drop=True)
+
+
+def upsert_games(old: pd.DataFrame | None, new_scoring: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keyed, game-scoped variant of upsert_latest_wins.
+
+    Only the games present in `new_scoring` are touched: rows of other games in
+    `old` are ignored, so callers can pass just those games (e.g. from the
+    scoring-plays store) and the cost follows the batch, not the archive.
+    Returns the merged rows for the affected games, sorted by (game_id, play_id).
+
+    Same "latest wins" rule: per (game_id, play_id) the row with the greatest
+    refreshed_at survives, a missing refreshed_at counts as latest (as in the
+    sort), and on a tie the new row wins.
+    """
+    if new_scoring is None or new_scoring.empty:
+        return pd.DataFrame(columns=list(old.columns) if old is not None else KEY_COLS)
+
+    def _latest_per_key(df: pd.DataFrame) -> pd.DataFrame:
+        # Normalize key dtypes so stored (e.g. CSV-read) and fresh rows index alike.
+        df = df.assign(
+            game_id=df["game_id"].astype("string"),
+            play_id=pd.to_numeric(df["play_id"], errors="coerce").astype("Int64"),
+        )
+        df = df.sort_values([*KEY_COLS, "refreshed_at"], kind="mergesort")
+        return df.drop_duplicates(subset=KEY_COLS, keep="last").set_index(KEY_COLS)
+
+    gids = set(new_scoring["game_id"].astype(str))
+    if old is not None and not old.empty:
+        old = old.loc[old["game_id"].astype(str).isin(gids)]
+    if old is None or old.empty:
+        return _latest_per_key(new_scoring).sort_index(kind="mergesort").reset_index()[list(new_scoring.columns)]
+
+    # Align schemas
+    cols = list(new_scoring.columns) + [c for c in old.columns if c not in new_scoring.columns]
+    old_k = _latest_per_key(old.reindex(columns=cols))
+    new_k = _latest_per_key(new_scoring.reindex(columns=cols))
+
+    common = old_k.index.intersection(new_k.index)
+    if len(common):
+        o = old_k.loc[common, "refreshed_at"].astype("string").to_numpy()
+        n = new_k.loc[common, "refreshed_at"].astype("string").to_numpy()
+        o_na, n_na = pd.isna(o), pd.isna(n)
+        old_wins = (~o_na & ~n_na & (o.astype(str) > n.astype(str))) | (o_na & ~n_na)
+        new_k = new_k.drop(common[old_wins])
+
+    merged = pd.concat([old_k.drop(new_k.index, errors="ignore"), new_k])
+    return merged.sort_index(kind="mergesort").reset_index()[cols]
+
+
+def _canonical_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Render values so that a row read back from CSV (floats, inferred dtypes)
+    compares equal to the same row fresh from derive_scoring_plays (Int64, string).
+    """
+    out = pd.DataFrame(index=df.index)
+    for c in df.columns:
+        s = df[c]
+        if pd.api.types.is_bool_dtype(s) or pd.api.types.is_integer_dtype(s) or pd.api.types.is_string_dtype(s.dtype) and s.dtype != object:
+            # Already canonical (typed store / derive_scoring_plays output)
+            out[c] = s.astype("string")
+            continue
+        num = pd.to_numeric(s, errors="coerce")
+        is_num = num.notna() | s.isna()
+        if is_num.all() and num.notna().any():
+            integral = num.dropna().mod(1).eq(0).all()
+            out[c] = (num.astype("Int64") if integral else num).astype("string")
+        else:
+            out[c] = s.astype("string")
+    return out
+
+
+def _key_frame(df: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": df["game_id"].astype("string"),
+            "play_id": pd.to_numeric(df["play_id"], errors="coerce").astype("Int64"),
+        },
+        index=df.index,
+    )
+
+
+def changed_rows(old: pd.DataFrame | None, new_scoring: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rows of `new_scoring` that are inserts (key not in `old`) or updates (any
+    non-volatile column differs from the stored row). Keyed by (game_id, play_id).
+    """
+    if new_scoring is None or new_scoring.empty:
+        return pd.DataFrame(columns=list(new_scoring.columns) if new_scoring is not None else KEY_COLS)
+    if old is None or old.empty:
+        return new_scoring.copy()
+
+    cols = [c for c in new_scoring.columns if c not in _VOLATILE_COLS and c in old.columns]
+    new_only_cols = [c for c in new_scoring.columns if c not in _VOLATILE_COLS and c not in old.columns]
+
+    new_k = _key_frame(new_scoring)
+    old_k = _key_frame(old)
+
+    new_sig = pd.util.hash_pandas_object(_canonical_strings(new_scoring[cols]), index=False)
+    old_sig = pd.util.hash_pandas_object(_canonical_strings(old[cols]), index=False)
+
+    old_map = pd.Series(old_sig.values, index=pd.MultiIndex.from_frame(old_k))
+    old_map = old_map[~old_map.index.duplicated(keep="last")]
+    prev = old_map.reindex(pd.MultiIndex.from_frame(new_k))
+
+    differs = pd.Series(prev.isna().values | (prev.values != new_sig.values), index=new_scoring.index)
+    if new_only_cols:
+        # A column the stored row never had is a change only if it carries a value.
+        differs |= new_scoring[new_only_cols].notna().any(axis=1)
+
+    return new_scoring.loc[differs].copy()
+
+
+def upsert_game_snapshots(
+    old: pd.DataFrame | None,
+    new_scoring: pd.DataFrame,
+    *,
+    snapshot_game_ids: Iterable[str],
+    source_plays: pd.DataFrame | None = None,
+    retracted_at: str | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    upsert_games plus the rows it applied and retractions, for games whose
+    source snapshot is complete.
+
+    For every game in `snapshot_game_ids`, `new_scoring` is taken as that game's
+    full set of scoring plays: a stored play whose key it no longer contains
+    (overturned on review, or dropped from the feed) is retracted. Games not
+    listed (not loaded, unchanged, errored) only get inserts/updates.
+
+    `source_plays` (the pbp the batch was derived from, game_id/play_id) tells
+    the two retraction reasons apart: "not_scoring" if the play is still in the
+    feed, "vanished" if it is not.
+
+    Returns (merged, changed, tombstones): merged rows of every affected game
+    (a game with all plays retracted has none, so write it back with its id
+    listed explicitly), the inserted/updated rows (taken from the merged
+    result, so a batch row that lost to a newer stored row is not reported),
+    and one TOMBSTONE_COLUMNS row per retracted play.
+    """
+    snap = {str(g) for g in snapshot_game_ids}
+    new_gids = set(new_scoring["game_id"].astype(str)) if new_scoring is not None and not new_scoring.empty else set()
+    if old is not None and not old.empty:
+        old = old.loc[old["game_id"].astype(str).isin(new_gids | snap)]
+    else:
+        old = None
+
+    merged = upsert_games(old, new_scoring) if new_gids else pd.DataFrame()
+    if old is not None:
+        # Stored rows of snapshot games with no scoring plays left.
+        untouched = old.loc[~old["game_id"].astype(str).isin(new_gids)]
+        if not untouched.empty:
+            merged = pd.concat([merged, untouched], ignore_index=True) if not merged.empty else untouched
+
+    tombstones = pd.DataFrame(columns=TOMBSTONE_COLUMNS)
+    if old is not None and snap and not merged.empty:
+        keys = _key_frame(merged)
+        in_snap = keys["game_id"].isin(snap)
+        current = (
+            pd.MultiIndex.from_frame(_key_frame(new_scoring)) if new_gids else pd.MultiIndex.from_tuples([], names=KEY_COLS)
+        )
+        gone = in_snap & ~pd.MultiIndex.from_frame(keys).isin(current)
+        if gone.any():
+            dropped = merged.loc[gone.to_numpy()]
+            reason = pd.Series("vanished", index=dropped.index, dtype="string")
+            if source_plays is not None and not source_plays.empty:
+                fed = pd.MultiIndex.from_frame(_key_frame(source_plays))
+                reason[pd.MultiIndex.from_frame(_key_frame(dropped)).isin(fed)] = "not_scoring"
+            tombstones = pd.DataFrame(
+                {
+                    "retracted_at": retracted_at,
+                    "season": dropped.get("season"),
+                    "week": dropped.get("week"),
+                    "game_id": dropped["game_id"].astype("string"),
+                    "play_id": pd.to_numeric(dropped["play_id"], errors="coerce").astype("Int64"),
+                    "reason": reason,
+                }
+            ).reset_index(drop=True)
+            merged = merged.loc[~gone.to_numpy()].reset_index(drop=True)
+
+    return merged, changed_rows(old, merged), tombstones
@@ -1,65 +1,83 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Iterable, Set
 
 import pandas as pd
 
-from src.domain.teams import canonicalize_team_column
-from src.pbp.schedule import load_schedules
+from src.domain.teams import canonicalize_team_abbr
+from src.pbp.schedule import DEFAULT_SCHEDULE_TTL_S, get_schedule_index
 
 
-def compute_eliminated_teams(*, season: int, playoff_game_ids: Iterable[str]) -> Set[str]:
+def compute_eliminated_teams(
+    *,
+    season: int,
+    playoff_game_ids: Iterable[str],
+    schedule_ttl_s: float = DEFAULT_SCHEDULE_TTL_S,
+) -> Set[str]:
     """
     Returns the set of teams eliminated from the playoffs (i.e., teams that have lost
     a completed playoff game in `playoff_game_ids`).
 
-    Uses schedule results (home_score/away_score) from nflreadpy schedules.
+    Uses schedule results (home_score/away_score) from the memoized ScheduleIndex.
     """
     gids = {str(g).strip() for g in playoff_game_ids if str(g).strip()}
     if not gids:
         return set()
 
-    sched = load_schedules(season)
-    if sched is None or sched.empty:
-        return set()
-
-    # Filter to the configured playoff games only
-    if "game_id" not in sched.columns:
-        return set()
-
-    sub = sched.loc[sched["game_id"].astype(str).isin(gids)].copy()
-    if sub.empty:
-        return set()
-
-    # Need these columns to determine winner/loser
-    needed = {"home_team", "away_team", "home_score", "away_score"}
-    if not needed.issubset(sub.columns):
-        return set()
-
-    # Only completed games (scores present)
-    sub["home_score"] = pd.to_numeric(sub["home_score"], errors="coerce")
-    sub["away_score"] = pd.to_numeric(sub["away_score"], errors="coerce")
-    sub = sub.loc[sub["home_score"].notna() & sub["away_score"].notna()].copy()
-    if sub.empty:
-        return set()
-
-    # Canonicalize team abbreviations to match your scoreboard/draft conventions
-    sub = canonicalize_team_column(sub, "home_team")
-    sub = canonicalize_team_column(sub, "away_team")
+    index = get_schedule_index(season, ttl_s=schedule_ttl_s)
 
     eliminated: set[str] = set()
 
-    for _, r in sub.iterrows():
-        ht = str(r["home_team"])
-        at = str(r["away_team"])
-        hs = float(r["home_score"])
-        a_s = float(r["away_score"])
+    for gid in gids:
+        g = index.game(gid)
+        # Only completed games (scores present)
+        if g is None or not g.has_result:
+            continue
 
-        if hs == a_s:
+        if g.home_score == g.away_score:
             # Playoff ties shouldn't happen; ignore defensively.
             continue
 
-        loser = at if hs > a_s else ht
-        eliminated.add(loser)
+        # Canonicalize team abbreviations to match your scoreboard/draft conventions
+        loser = canonicalize_team_abbr(g.away_team if g.home_score > g.away_score else g.home_team)
+        if loser:
+            eliminated.add(loser)
 
     return eliminated
+
+
+def write_eliminated_teams(teams: Iterable[str], path: Path, *, season: int) -> None:
+    """
+    Persist eliminated teams (one row per team) so the app never has to touch the
+    schedule. Written atomically; an empty set still produces a header-only file.
+    """
+    computed_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    df = pd.DataFrame(
+        {"season": season, "team": sorted(set(teams)), "computed_at": computed_at},
+        columns=["season", "team", "computed_at"],
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    df.to_csv(tmp, index=False)
+    tmp.replace(path)
+
+
+def read_eliminated_teams(path: Path) -> Set[str] | None:
+    """
+    Read the artifact written by write_eliminated_teams. Returns None when it
+    does not exist (or cannot be read), so callers can tell "none eliminated"
+    from "not computed yet".
+    """
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_csv(path, dtype={"team": "string"})
+    except pd.errors.EmptyDataError:
+        return set()
+    except Exception:
+        return None
+    if "team" not in df.columns:
+        return None
+    return set(df["team"].dropna().astype(str).tolist())
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import argparse
+import json
 import os
+import signal
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 
-from src.pbp.live_pbp import fetch_live_pbp_for_game_ids, metrics_to_dataframe
+from src.gameset import GameSet, load_game_ids
 from src.pbp.refresh_pbp import refresh_pbp
+from src.pbp.schedule import ScheduledGame, ScheduleIndex, get_schedule_index
+from src.pbp.sources import SOURCE_GTD, SOURCE_RELEASE, source_metrics_to_dataframe
+from src.playoffs import compute_eliminated_teams, write_eliminated_teams
+from src.snapshot import SnapshotSources, materialize_snapshot, read_snapshot
+
+# Eliminations come from schedule scores; during a refresh, accept at most a
+# minute-old schedule so a just-finished game shows up.
+ELIMINATED_SCHEDULE_TTL_S = 60
+
+# Single-flight refresh: how long a caller waits on an in-flight refresh, how
+# recent a finished one must be to be handed out instead of refetching, and
+# how often waiters check.
+SINGLE_FLIGHT_WAIT_S = 45.0
+SINGLE_FLIGHT_REUSE_S = 15.0
+SINGLE_FLIGHT_POLL_S = 0.25
 
 
 @dataclass(frozen=True)
@@ -25,6 +44,10 @@ class RefreshResult:
     eligible_games: int = 0
     changed: bool = False
     new_rows: int = 0
+    # True when this caller got another caller's result (single-flight)
+    coalesced: bool = False
+    # Requested games frozen in the per-game state after this run; refreshes skip them
+    frozen_game_ids: tuple[str, ...] = ()
 
 
 class RefreshInProgress(RuntimeError):
@@ -89,22 +112,23 @@ def _atomic_write_csv(df: pd.DataFrame, path: Path) -> None:
     tmp.replace(path)  # atomic rename on typical filesystems
 
 
+STATE_COLUMNS = [
+    "season",
+    "game_id",
+    "first_seen_at",
+    "last_attempt_at",
+    "last_success_at",
+    "last_max_play_id",
+    "last_new_pbp_at",
+    "no_new_pbp_streak",
+    "is_frozen",
+    "freeze_reason",
+]
+
+
 def _read_state(state_path: Path) -> pd.DataFrame:
     if not state_path.exists():
-        return pd.DataFrame(
-            columns=[
-                "season",
-                "game_id",
-                "first_seen_at",
-                "last_attempt_at",
-                "last_success_at",
-                "last_max_play_id",
-                "last_new_pbp_at",
-                "no_new_pbp_streak",
-                "is_frozen",
-                "freeze_reason",
-            ]
-        )
+        return pd.DataFrame(columns=STATE_COLUMNS)
     return pd.read_csv(state_path, dtype={"game_id": "string"})
 
 
@@ -137,28 +161,195 @@ def _parse_utc_iso(ts: str | None) -> float | None:
         return None
 
 
-def _should_freeze_inactive(last_new_pbp_at: str | None, inactive_seconds: int) -> bool:
-    last_ts = _parse_utc_iso(last_new_pbp_at)
+def _seconds_since(ts: str | None) -> float | None:
+    last_ts = _parse_utc_iso(ts)
     if last_ts is None:
-        return False
-    return (time.time() - last_ts) >= inactive_seconds
+        return None
+    return time.time() - last_ts
+
+
+def _should_freeze_inactive(last_new_pbp_at: str | None, inactive_seconds: int) -> bool:
+    age = _seconds_since(last_new_pbp_at)
+    return age is not None and age >= inactive_seconds
 
 
 def _select_games_to_refresh(
     playoff_game_ids: list[str],
     state_df: pd.DataFrame,
+    *,
+    inactive_seconds: int,
 ) -> list[str]:
+    """
+    Requested games that are not frozen. A game frozen as "inactive" is let
+    through again once its last attempt is inactive_seconds old, so a live game
+    that went quiet (weather delay, feed outage) thaws when new pbp appears.
+    """
     if state_df.empty:
         return playoff_game_ids
 
-    frozen = set(
-        state_df.loc[state_df["is_frozen"].fillna(False).astype(bool), "game_id"]
-        .astype("string")
-        .tolist()
-    )
+    frozen = set()
+    for r in state_df.loc[state_df["is_frozen"].fillna(False).astype(bool)].to_dict("records"):
+        if r.get("freeze_reason") == "inactive":
+            age = _seconds_since(None if pd.isna(r.get("last_attempt_at")) else str(r["last_attempt_at"]))
+            if age is None or age >= inactive_seconds:
+                continue
+        frozen.add(str(r["game_id"]))
     return [gid for gid in playoff_game_ids if gid not in frozen]
 
 
+def _final_game_ids(season: int, game_ids: list[str]) -> set[str]:
+    """
+    Games with a final score in the schedule. Best effort: empty on a schedule
+    failure, so nothing gets frozen as final by mistake.
+    """
+    try:
+        index = get_schedule_index(season, ttl_s=ELIMINATED_SCHEDULE_TTL_S)
+    except Exception:
+        return set()
+    return {gid for gid in game_ids if (g := index.game(gid)) is not None and g.has_result}
+
+
+def _update_state(
+    state_df: pd.DataFrame,
+    *,
+    season: int,
+    attempted: list[str],
+    fetched: set[str],
+    awaiting_release: set[str],
+    max_play_ids: dict[str, int],
+    changed_games: Iterable[str],
+    final_games: set[str],
+    inactive_seconds: int,
+    now: str,
+) -> pd.DataFrame:
+    """
+    Per-game refresh state after one attempt at `attempted`:
+
+    - a game "succeeds" when its fetch succeeded with pbp (it is in `fetched`,
+      which includes GTD polls that came back unchanged)
+    - new pbp = max play_id advanced (max_play_ids only has games parsed this
+      run) or the game's stored scoring plays changed; it resets
+      no_new_pbp_streak, otherwise the streak grows
+    - freeze "final": the schedule has a final score and a successful fetch
+      brought nothing new (the closing plays are already stored)
+    - freeze "inactive": no new pbp for inactive_seconds; a re-check (see
+      _select_games_to_refresh) that brings new pbp thaws the game
+    - games in awaiting_release (final, but served from GTD because the release
+      lacks them) never freeze, so they are refreshed until the release rows
+      replace the GTD-derived plays
+
+    Rows for games not attempted are kept as they are.
+    """
+    rows = {str(r["game_id"]): r for r in state_df.reindex(columns=STATE_COLUMNS).to_dict("records")}
+    changed = {str(g) for g in changed_games}
+
+    for gid in attempted:
+        prev = rows.get(gid) or {"season": season, "game_id": gid, "first_seen_at": now, "no_new_pbp_streak": 0}
+        row = {**prev, "last_attempt_at": now}
+        last_max = _to_int_or_none(prev.get("last_max_play_id"))
+        streak = _to_int_or_none(prev.get("no_new_pbp_streak")) or 0
+
+        loaded = gid in fetched
+        if loaded:
+            row["last_success_at"] = now
+            mx = max_play_ids.get(gid)
+            if gid in changed or (mx is not None and (last_max is None or mx > last_max)):
+                if mx is not None:
+                    row["last_max_play_id"] = max(mx, last_max) if last_max is not None else mx
+                row["last_new_pbp_at"] = now
+                streak = 0
+            else:
+                streak += 1
+        else:
+            streak += 1
+        row["no_new_pbp_streak"] = streak
+
+        last_new_at = row.get("last_new_pbp_at")
+        if gid in awaiting_release:
+            row["is_frozen"], row["freeze_reason"] = False, None
+        elif loaded and gid in final_games and streak > 0:
+            row["is_frozen"], row["freeze_reason"] = True, "final"
+        elif _should_freeze_inactive(None if pd.isna(last_new_at) else str(last_new_at), inactive_seconds):
+            row["is_frozen"], row["freeze_reason"] = True, "inactive"
+        else:
+            row["is_frozen"], row["freeze_reason"] = False, None
+        rows[gid] = row
+
+    out = pd.DataFrame(list(rows.values()), columns=STATE_COLUMNS)
+    out["is_frozen"] = out["is_frozen"].fillna(False).astype(bool)
+    for c in ["season", "last_max_play_id", "no_new_pbp_streak"]:
+        out[c] = pd.to_numeric(out[c], errors="coerce").astype("Int64")
+    return out.sort_values("game_id").reset_index(drop=True)
+
+
+def _write_eliminated(season: int, playoff_game_ids: list[str], path: Path) -> None:
+    """
+    Best-effort: a schedule hiccup must not fail an otherwise good refresh, and
+    the previous artifact stays in place.
+    """
+    try:
+        eliminated = compute_eliminated_teams(
+            season=season,
+            playoff_game_ids=playoff_game_ids,
+            schedule_ttl_s=ELIMINATED_SCHEDULE_TTL_S,
+        )
+    except Exception:
+        return
+    write_eliminated_teams(eliminated, path, season=season)
+
+
+def _write_snapshot(sources: SnapshotSources, *, only_if_stale: bool = False) -> None:
+    """
+    Best-effort like _write_eliminated: on failure the app sees a snapshot that
+    no longer matches its inputs and computes the scoreboard itself.
+    """
+    try:
+        if only_if_stale:
+            snap = read_snapshot(sources.snapshot_path)
+            if snap is not None and snap.is_current(sources):
+                return
+        materialize_snapshot(sources)
+    except Exception:
+        return
+
+
+def game_metrics_path(metrics_out_path: Path) -> Path:
+    # pbp_metrics_latest_2024.csv -> pbp_metrics_latest_2024_games.csv
+    return metrics_out_path.with_name(metrics_out_path.stem + "_games.csv")
+
+
+def _request_key(season: int, playoff_game_ids: list[str]) -> str:
+    return f"{int(season)}:" + ",".join(sorted(playoff_game_ids))
+
+
+def _shared_result_path(lock_path: Path) -> Path:
+    # .refresh.lock -> refresh_result.json
+    return lock_path.with_name(lock_path.stem.lstrip(".") + "_result.json")
+
+
+def _read_shared_result(path: Path, *, key: str, completed_after: float) -> RefreshResult | None:
+    """
+    The last published result for `key`, if it completed after `completed_after`.
+    """
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if raw.get("key") != key or float(raw.get("completed_at", 0)) <= completed_after:
+        return None
+    try:
+        return RefreshResult(**raw["result"])
+    except (KeyError, TypeError):
+        return None
+
+
+def _write_shared_result(path: Path, result: RefreshResult, *, key: str) -> None:
+    payload = {"key": key, "completed_at": time.time(), "result": asdict(result)}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    tmp.replace(path)
+
+
 def refresh_playoff_games(
     *,
     season: int,
@@ -170,95 +361,440 @@ def refresh_playoff_games(
     metrics_out_path: Path,
     state_path: Path,
     lock_path: Path,
-    inactive_seconds: int = 60 * 60,  # 1 hour (unused in daily mode)
+    inactive_seconds: int = 60 * 60,  # freeze a game after this long without new pbp
+    eliminated_out_path: Path | None = None,
+    snapshot_sources: SnapshotSources | None = None,
+    wait_timeout_s: float = SINGLE_FLIGHT_WAIT_S,
+    reuse_within_s: float = SINGLE_FLIGHT_REUSE_S,
 ) -> RefreshResult:
     """
-    Daily mode refresh (nflreadpy / nflverse PBP):
+    Single-flight entry point (one refresh at a time across sessions and processes):
 
-    - Loads nflfastR-style PBP via src.pbp.refresh_pbp.refresh_pbp (which now uses nflreadpy)
-    - Derives scoring plays and upserts into cumulative scoring_plays output
-    - "changed" is determined by output row count changing (not by max_play_id advance)
+    - A result for the same season/games published within `reuse_within_s` is
+      returned as-is (coalesced=True) without fetching.
+    - If another caller holds the lock, wait up to `wait_timeout_s` for it to
+      finish and return its result. If it exits without publishing one (it
+      failed), take the lock and refresh. RefreshInProgress is raised only when
+      the wait times out.
 
-    Note: state/freeze logic is not meaningful for this daily model; it is retained only
-    to preserve the call signature used by the Streamlit app.
+    Results are shared through a small JSON file next to the lock.
     """
-    import time
-    from datetime import datetime, timezone
-
-    import pandas as pd
-
-    from src.pbp.refresh_pbp import refresh_pbp
-    from src.pbp.refresh_pbp import RefreshResult as PbpRefreshResult  # for type clarity
-    from src.refresh import RefreshInProgress  # if your file defines it here; otherwise remove
-
     playoff_game_ids = [str(x).strip() for x in playoff_game_ids if str(x).strip()]
-    games_requested = len(playoff_game_ids)
+    key = _request_key(season, playoff_game_ids)
+    result_path = _shared_result_path(lock_path)
 
-    t0 = time.time()
+    requested_at = time.time()
+    recent = _read_shared_result(result_path, key=key, completed_after=requested_at - reuse_within_s)
+    if recent is not None:
+        return replace(recent, coalesced=True)
 
-    # --- Locking (keep existing behavior) ---
-    try:
-        lock = FileLock(lock_path, stale_seconds=60 * 5)
-        lock.acquire()
-    except Exception:
-        raise RefreshInProgress()
+    deadline = requested_at + wait_timeout_s
+    lock = FileLock(lock_path, stale_seconds=60 * 5)
+    while True:
+        try:
+            lock.acquire()
+            break
+        except RefreshInProgress:
+            pass
+        # Someone else is refreshing: wait for their result (or for the lock to free up).
+        shared = _read_shared_result(result_path, key=key, completed_after=requested_at)
+        if shared is not None:
+            return replace(shared, coalesced=True)
+        if time.time() >= deadline:
+            raise RefreshInProgress(
+                "Refresh already in progress. Wait ~10 seconds then hit refresh on your browser"
+            )
+        time.sleep(SINGLE_FLIGHT_POLL_S)
 
     try:
-        # Count rows before
-        old_rows_out = 0
-        if cumulative_out_path.exists():
-            try:
-                old_df = pd.read_csv(cumulative_out_path)
-                old_rows_out = int(len(old_df))
-            except Exception:
-                old_rows_out = 0
+        # A leader may have published between our first check and acquiring the lock.
+        shared = _read_shared_result(result_path, key=key, completed_after=requested_at)
+        if shared is not None:
+            return replace(shared, coalesced=True)
 
-        # Run the scoring refresh engine (nflreadpy-backed)
-        pbp_result = refresh_pbp(
+        result = _refresh_playoff_games_locked(
             season=season,
-            week=None,
-            game_ids=playoff_game_ids,
-            out_path=cumulative_out_path,
-            metrics_out_path=None,
+            playoff_game_ids=playoff_game_ids,
+            cumulative_out_path=cumulative_out_path,
+            metrics_out_path=metrics_out_path,
+            state_path=state_path,
+            inactive_seconds=inactive_seconds,
+            eliminated_out_path=eliminated_out_path,
+            snapshot_sources=snapshot_sources,
         )
+        _write_shared_result(result_path, result, key=key)
+        return result
+    finally:
+        lock.release()
 
-        # Determine changed/new_rows based on output row count delta
-        rows_out = int(pbp_result.rows_out)
-        changed = rows_out != old_rows_out
-        new_rows = max(0, rows_out - old_rows_out)
-
-        dt = time.time() - t0
-
-        # Write a lightweight metrics row (keeps your app artifacts intact)
-        metrics_out_path.parent.mkdir(parents=True, exist_ok=True)
-        pd.DataFrame(
-            [
-                {
-                    "refreshed_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-                    "season": season,
-                    "games_requested": games_requested,
-                    "rows_in": int(pbp_result.rows_in),
-                    "rows_scoring": int(pbp_result.rows_scoring),
-                    "rows_out": rows_out,
-                    "changed": bool(changed),
-                    "elapsed_seconds": round(dt, 3),
-                }
-            ]
-        ).to_csv(metrics_out_path, index=False)
 
+def _refresh_playoff_games_locked(
+    *,
+    season: int,
+    playoff_game_ids: list[str],
+    cumulative_out_path: Path,
+    metrics_out_path: Path,
+    state_path: Path,
+    inactive_seconds: int,
+    eliminated_out_path: Path | None = None,
+    snapshot_sources: SnapshotSources | None = None,
+) -> RefreshResult:
+    """
+    Refresh run while holding the refresh lock:
+
+    - Skips games frozen in the per-game state (state_path), except "inactive"
+      ones due for their once-per-inactive_seconds re-check; when every
+      requested game is skipped nothing is fetched at all
+    - Loads nflfastR-style PBP for the rest via src.pbp.refresh_pbp.refresh_pbp,
+      each game from its source (live GTD while in progress, the nflverse
+      release once final; see src.pbp.sources)
+    - Derives scoring plays and upserts into cumulative scoring_plays output
+    - "changed" means some game's row count or content hash differs between the
+      store manifests before and after the run (not by max_play_id advance)
+    - Updates the per-game state and freezes games that are final or have had no
+      new pbp for inactive_seconds (see _update_state)
+    - If eliminated_out_path is given, eliminated teams are recomputed from the schedule
+      and written there, so the app only has to read a small artifact
+    - If snapshot_sources is given, the scoreboard snapshot (src/snapshot.py) is
+      rebuilt last, after everything it is built from has been written
+    - Writes a run-level metrics row to metrics_out_path and, per refreshed game,
+      its source, routing reason, status and fetch latency to
+      game_metrics_path(metrics_out_path)
+    """
+    from src.pbp.refresh_pbp import refresh_pbp
+
+    games_requested = len(playoff_game_ids)
+
+    t0 = time.time()
+
+    state_df = _read_state(state_path)
+    eligible = _select_games_to_refresh(playoff_game_ids, state_df, inactive_seconds=inactive_seconds)
+    if not eligible:
+        if snapshot_sources is not None:
+            _write_snapshot(snapshot_sources, only_if_stale=True)
         return RefreshResult(
             ok=True,
-            message=f"Refresh complete: processed {games_requested} games in {dt:.1f}s.",
+            message=f"All {games_requested} games are frozen; nothing to refresh.",
             games_requested=games_requested,
-            games_refreshed=games_requested,
-            games_frozen=0,
-            eligible_games=games_requested,
-            changed=changed,
-            new_rows=new_rows,
+            games_refreshed=0,
+            games_frozen=games_requested,
+            eligible_games=0,
+            frozen_game_ids=tuple(playoff_game_ids),
+        )
+
+    # Run the scoring refresh engine (nflreadpy-backed)
+    pbp_result = refresh_pbp(
+        season=season,
+        week=None,
+        game_ids=eligible,
+        out_path=cumulative_out_path,
+        metrics_out_path=None,
+    )
+
+    # changed/new_rows come from the store manifests (per-game row counts and
+    # content hashes), so in-place corrections count and no data file is read.
+    rows_out = int(pbp_result.rows_out)
+    changed = bool(pbp_result.changed_games)
+    new_rows = max(0, rows_out - int(pbp_result.rows_before))
+
+    state_df = _update_state(
+        state_df,
+        season=season,
+        attempted=eligible,
+        fetched={m.game_id for m in pbp_result.game_sources if m.loaded},
+        awaiting_release={m.game_id for m in pbp_result.game_sources if m.awaiting_release},
+        max_play_ids=pbp_result.max_play_ids,
+        changed_games=pbp_result.changed_games,
+        final_games=_final_game_ids(season, eligible),
+        inactive_seconds=inactive_seconds,
+        now=_now_utc_iso(),
+    )
+    _atomic_write_csv(state_df, state_path)
+    frozen = set(state_df.loc[state_df["is_frozen"], "game_id"].astype(str))
+    frozen_game_ids = tuple(gid for gid in playoff_game_ids if gid in frozen)
+    games_frozen = len(frozen_game_ids)
+
+    if eliminated_out_path is not None:
+        _write_eliminated(season, playoff_game_ids, eliminated_out_path)
+    if snapshot_sources is not None:
+        _write_snapshot(snapshot_sources)
+
+    dt = time.time() - t0
+
+    # Write a lightweight metrics row (keeps your app artifacts intact)
+    refreshed_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    sources = [m.source for m in pbp_result.game_sources]
+    metrics_out_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(
+        [
+            {
+                "refreshed_at": refreshed_at,
+                "season": season,
+                "games_requested": games_requested,
+                "games_refreshed": len(eligible),
+                "games_frozen": games_frozen,
+                "games_gtd": sources.count(SOURCE_GTD),
+                "games_release": sources.count(SOURCE_RELEASE),
+                "rows_in": int(pbp_result.rows_in),
+                "rows_scoring": int(pbp_result.rows_scoring),
+                "rows_out": rows_out,
+                "changed": bool(changed),
+                "elapsed_seconds": round(dt, 3),
+            }
+        ]
+    ).to_csv(metrics_out_path, index=False)
+    _atomic_write_csv(
+        source_metrics_to_dataframe(list(pbp_result.game_sources), refreshed_at=refreshed_at),
+        game_metrics_path(metrics_out_path),
+    )
+
+    return RefreshResult(
+        ok=True,
+        message=f"Refresh complete: processed {len(eligible)} of {games_requested} games in {dt:.1f}s.",
+        games_requested=games_requested,
+        games_refreshed=len(eligible),
+        games_frozen=games_frozen,
+        eligible_games=len(eligible),
+        changed=changed,
+        new_rows=new_rows,
+        frozen_game_ids=frozen_game_ids,
+    )
+
+
+# -------------------------
+# Background refresher (python -m src.refresh --daemon)
+# -------------------------
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """
+    Per-game polling intervals for the refresher daemon, by game phase.
+    """
+
+    live_s: float = 60.0  # in progress (or within lead_s of kickoff)
+    upcoming_s: float = 30 * 60.0  # scheduled, or kickoff unknown
+    lead_s: float = 15 * 60.0
+    # Kickoff + this with still no final score: stop treating the game as live.
+    max_game_s: float = 5 * 60 * 60.0
+    # Final scores come from the schedule, so keep it fresher than the app's TTL.
+    schedule_ttl_s: float = 5 * 60.0
+    # Upper bound on one sleep, so config/schedule changes are picked up.
+    max_sleep_s: float = 60.0
+
+
+def _kickoff_ts(game: ScheduledGame | None) -> float | None:
+    return _parse_utc_iso(game.kickoff_utc) if game is not None else None
+
+
+def game_phase(game: ScheduledGame | None, now: float, policy: PollPolicy = PollPolicy()) -> str:
+    """
+    "final", "live", "upcoming" or "unknown" (not in the schedule / no kickoff,
+    or past max_game_s without a final score).
+    """
+    if game is not None and game.has_result:
+        return "final"
+    kickoff = _kickoff_ts(game)
+    if kickoff is None or now >= kickoff + policy.max_game_s:
+        return "unknown"
+    if now >= kickoff - policy.lead_s:
+        return "live"
+    return "upcoming"
+
+
+def plan_polls(
+    game_ids: Iterable[str],
+    index: ScheduleIndex | None,
+    *,
+    now: float,
+    last_polled: Dict[str, float],
+    finals_done: set[str],
+    policy: PollPolicy = PollPolicy(),
+) -> Tuple[List[str], float, Dict[str, Tuple[str, float | None]]]:
+    """
+    Which games to refresh now, and when the next one falls due.
+
+    Live games are due every live_s, upcoming/unknown games every upcoming_s.
+    A final game is due every cycle until a refresh has stored its closing
+    plays, and never again after that; the caller records it in `finals_done`.
+
+    Returns (due game ids, wake-up time, {game_id: (phase, next poll or None)}).
+    """
+    due: List[str] = []
+    plan: Dict[str, Tuple[str, float | None]] = {}
+    for gid in sorted({str(g) for g in game_ids}):
+        game = index.game(gid) if index is not None else None
+        phase = game_phase(game, now, policy)
+        if phase == "final":
+            if gid not in finals_done:
+                due.append(gid)
+            plan[gid] = (phase, None)
+            continue
+
+        interval = policy.live_s if phase == "live" else policy.upcoming_s
+        last = last_polled.get(gid)
+        next_at = now if last is None else last + interval
+        if next_at <= now:
+            due.append(gid)
+            next_at = now + interval
+        if phase == "upcoming":
+            # Wake up when the game enters the live window, even mid-interval.
+            next_at = min(next_at, _kickoff_ts(game) - policy.lead_s)
+        plan[gid] = (phase, next_at)
+
+    pending = [t for _, t in plan.values() if t is not None]
+    wake_at = min([now + policy.max_sleep_s, *pending])
+    return due, wake_at, plan
+
+
+def refresher_heartbeat_path(processed_dir: Path) -> Path:
+    return processed_dir / "refresher_heartbeat.json"
+
+
+def read_refresher_heartbeat(path: Path, *, max_age_s: float = 3 * PollPolicy.max_sleep_s) -> dict | None:
+    """
+    The daemon's last heartbeat, or None if there is none or it is older than max_age_s.
+    """
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if time.time() - float(raw.get("updated_at_ts", 0)) > max_age_s:
+        return None
+    return raw
+
+
+def _write_heartbeat(path: Path, payload: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def run_refresher(
+    *,
+    season: int,
+    playoff_game_ids_path: Path,
+    processed_dir: Path,
+    policy: PollPolicy = PollPolicy(),
+    max_cycles: int | None = None,
+) -> None:
+    """
+    Long-running refresher: polls each playoff game at the rate its phase calls
+    for (see plan_polls) through refresh_playoff_games, so it shares the lock
+    and single-flight result with any manual refresh. Writes a heartbeat every
+    cycle; the app hides its refresh button while the heartbeat is fresh.
+
+    The playoff game list and the schedule are re-read every cycle.
+    """
+    cumulative_out_path = processed_dir / "scoring_plays.csv"
+    heartbeat_path = refresher_heartbeat_path(processed_dir)
+    gs = GameSet(mode="playoffs", season=season, playoff_game_ids_path=playoff_game_ids_path)
+    snapshot_sources = replace(
+        SnapshotSources.default(season=season, processed_dir=processed_dir, config_dir=playoff_game_ids_path.parent),
+        playoff_game_ids_path=playoff_game_ids_path,
+    )
+
+    last_polled: Dict[str, float] = {}
+    finals_done: set[str] = set()
+    last_result: Optional[dict] = None
+    cycles = 0
+
+    def beat(plan: Dict[str, Tuple[str, float | None]], last: Optional[dict]) -> None:
+        _write_heartbeat(
+            heartbeat_path,
+            {
+                "pid": os.getpid(),
+                "season": season,
+                "updated_at": _now_utc_iso(),
+                "updated_at_ts": time.time(),
+                "games": {gid: {"phase": phase, "next_poll_at": at} for gid, (phase, at) in plan.items()},
+                "last_refresh": last,
+            },
         )
+
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            cycles += 1
+            now = time.time()
+            game_ids = load_game_ids(pd.DataFrame(), gs)
+            try:
+                index = get_schedule_index(season, ttl_s=policy.schedule_ttl_s, cache_dir=processed_dir)
+            except Exception:
+                index = None
+            due, wake_at, plan = plan_polls(
+                game_ids, index, now=now, last_polled=last_polled, finals_done=finals_done, policy=policy
+            )
+
+            if due:
+                # Fresh heartbeat before a refresh that may take a while.
+                beat(plan, last_result)
+                try:
+                    result = refresh_playoff_games(
+                        season=season,
+                        playoff_game_ids=due,
+                        cumulative_out_path=cumulative_out_path,
+                        metrics_out_path=processed_dir / f"pbp_metrics_latest_{season}.csv",
+                        state_path=processed_dir / f"game_refresh_state_{season}.csv",
+                        lock_path=processed_dir / ".refresh.lock",
+                        eliminated_out_path=processed_dir / f"eliminated_teams_{season}.csv",
+                        snapshot_sources=snapshot_sources,
+                    )
+                    last_result = {"at": _now_utc_iso(), "games": due, **asdict(result)}
+                    for gid in due:
+                        last_polled[gid] = now
+                        # Done once the refresh froze it: its closing plays loaded
+                        # and stored. A final whose fetch failed stays due.
+                        if plan[gid][0] == "final" and gid in result.frozen_game_ids:
+                            finals_done.add(gid)
+                except Exception as e:
+                    # Leave last_polled alone so the games stay due next cycle.
+                    last_result = {"at": _now_utc_iso(), "games": due, "ok": False, "message": str(e)}
+
+            beat(plan, last_result)
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            time.sleep(max(1.0, wake_at - time.time()))
     finally:
         try:
-            lock.release()
-        except Exception:
+            heartbeat_path.unlink()
+        except OSError:
             pass
 
+
+def main(argv: list[str] | None = None) -> int:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    p = argparse.ArgumentParser()
+    p.add_argument("--daemon", action="store_true", help="run the background refresher")
+    p.add_argument("--season", type=int, default=int(os.getenv("BBB_SEASON", "0") or "0"))
+    p.add_argument("--processed_dir", type=str, default="data/processed")
+    p.add_argument("--playoff_game_ids", type=str, default="")
+    p.add_argument("--live_s", type=float, default=PollPolicy.live_s)
+    p.add_argument("--upcoming_s", type=float, default=PollPolicy.upcoming_s)
+    args = p.parse_args(argv)
+
+    if not args.season:
+        raise SystemExit("season must be provided via --season or BBB_SEASON")
+    if not args.daemon:
+        raise SystemExit("nothing to do: pass --daemon to run the background refresher")
+
+    ids_path = Path(args.playoff_game_ids or f"data/config/playoff_game_ids_{args.season}.csv")
+    # Let `kill` unwind through run_refresher so the heartbeat is removed.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        run_refresher(
+            season=args.season,
+            playoff_game_ids_path=ids_path,
+            processed_dir=Path(args.processed_dir),
+            policy=PollPolicy(live_s=args.live_s, upcoming_s=args.upcoming_s),
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
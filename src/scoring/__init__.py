@@ -1,2 +1,2 @@
 from .io import load_player_positions
-from .engine import ScoreRules, score_team_position_totals, score_events
+from .engine import ScoreRules, ScoringResult, build_scoring_result, score_team_position_totals, score_events
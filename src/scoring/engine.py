@@ -1,11 +1,16 @@
 # src/scoring/engine.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Hashable, Iterable
 
 import pandas as pd
 
+from src.domain.teams import canonicalize_team_column
+
 from .io import normalize_position, clean_id
 
 POS_K = "K"
@@ -172,6 +177,147 @@ def _build_events(
     return ev[keep].sort_values(["game_date", "qtr", "time", "play_id"], ascending=[False, False, False, False]).reset_index(drop=True)
 
 
+def _totals_from_events(ev: pd.DataFrame) -> pd.DataFrame:
+    if ev.empty:
+        return pd.DataFrame(columns=["team", "position", "pts"])
+
+    out = (
+        ev.groupby(["team", "position"], as_index=False)["pts"]
+        .sum()
+        .sort_values(["team", "position"])
+        .reset_index(drop=True)
+    )
+
+    # Stabilize grid
+    teams = sorted([t for t in out["team"].dropna().astype(str).unique().tolist() if t])
+    if not teams:
+        return pd.DataFrame(columns=["team", "position", "pts"])
+
+    idx = pd.MultiIndex.from_product([teams, POSITION_BUCKETS], names=["team", "position"])
+    out = out.set_index(["team", "position"]).reindex(idx, fill_value=0).reset_index()
+    return out.sort_values(["team", "position"]).reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class ScoringResult:
+    """
+    One pass of the engine: the canonical event table plus everything derived
+    from it. Build via build_scoring_result (memoized) rather than directly;
+    results are shared between callers, so treat the frames as read-only.
+
+    - events: one row per scoring credit, newest first (raw team abbreviations)
+    - totals: team x position grid of points
+    - feed: events with canonical team abbreviations, for display
+    """
+
+    fingerprint: str
+    events: pd.DataFrame
+    totals: pd.DataFrame
+    feed: pd.DataFrame
+
+    def owner_totals(self, draft_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Points per owner, via draft picks (owner_id, owner, team, position).
+        Owners without points get 0.
+        """
+        cols = ["owner_id", "owner", "pts"]
+        if draft_df is None or draft_df.empty:
+            return pd.DataFrame(columns=cols)
+
+        picks = canonicalize_team_column(draft_df[["owner_id", "owner", "team", "position"]], "team")
+        totals = canonicalize_team_column(self.totals, "team")
+        merged = picks.merge(totals, on=["team", "position"], how="left")
+        merged["pts"] = pd.to_numeric(merged["pts"], errors="coerce").fillna(0)
+        return (
+            merged.groupby(["owner_id", "owner"], as_index=False)["pts"]
+            .sum()
+            .sort_values("owner_id")
+            .reset_index(drop=True)[cols]
+        )
+
+
+_RESULT_CACHE_SIZE = 8
+_RESULT_CACHE: "OrderedDict[str, ScoringResult]" = OrderedDict()
+_RESULT_LOCK = threading.Lock()
+
+
+def frame_version(df: pd.DataFrame) -> str:
+    """
+    Content hash of a dataframe, for callers that have no cheaper version token
+    (such as a file mtime) to pass to build_scoring_result.
+    """
+    if df is None or df.empty:
+        return "empty"
+    h = hashlib.sha1(",".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+def scoring_fingerprint(
+    *,
+    scoring_version: Hashable,
+    positions_version: Hashable,
+    rules: ScoreRules,
+    season: int,
+    week_max: int | None,
+    game_ids: Iterable[str] | None,
+) -> str:
+    scope_ids = None if game_ids is None else sorted({str(g) for g in game_ids})
+    key = repr((scoring_version, positions_version, sorted(asdict(rules).items()), int(season), week_max, scope_ids))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def build_scoring_result(
+    scoring_plays: pd.DataFrame,
+    rosters: pd.DataFrame,
+    *,
+    season: int,
+    week_max: int | None = None,
+    game_ids: Iterable[str] | None = None,
+    rules: ScoreRules = ScoreRules(),
+    scoring_version: Hashable | None = None,
+    positions_version: Hashable | None = None,
+) -> ScoringResult:
+    """
+    Build the canonical event table once and derive totals/feed from it.
+
+    Memoized on (scoring version, positions version, rules, scope). Pass cheap
+    version tokens (e.g. file mtimes) when you have them; otherwise the frames
+    are content-hashed.
+    """
+    if game_ids is not None:
+        game_ids = list(game_ids)
+
+    fp = scoring_fingerprint(
+        scoring_version=scoring_version if scoring_version is not None else frame_version(scoring_plays),
+        positions_version=positions_version if positions_version is not None else frame_version(rosters),
+        rules=rules,
+        season=season,
+        week_max=week_max,
+        game_ids=game_ids,
+    )
+
+    with _RESULT_LOCK:
+        hit = _RESULT_CACHE.get(fp)
+        if hit is not None:
+            _RESULT_CACHE.move_to_end(fp)
+            return hit
+
+    ev = _build_events(scoring_plays, rosters, season=season, week_max=week_max, game_ids=game_ids, rules=rules)
+    result = ScoringResult(
+        fingerprint=fp,
+        events=ev,
+        totals=_totals_from_events(ev),
+        feed=canonicalize_team_column(ev, "team"),
+    )
+
+    with _RESULT_LOCK:
+        _RESULT_CACHE[fp] = result
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
 def score_events(
     scoring_plays: pd.DataFrame,
     rosters: pd.DataFrame,
@@ -181,7 +327,13 @@ def score_events(
     game_ids: Iterable[str] | None = None,
     rules: ScoreRules = ScoreRules(),
 ) -> pd.DataFrame:
-    return _build_events(scoring_plays, rosters, season=season, week_max=week_max, game_ids=game_ids, rules=rules)
+    """
+    ScoringResult.events, as a copy the caller may modify (the memoized frame
+    is shared).
+    """
+    return build_scoring_result(
+        scoring_plays, rosters, season=season, week_max=week_max, game_ids=game_ids, rules=rules
+    ).events.copy()
 
 
 def score_team_position_totals(
@@ -193,22 +345,9 @@ def score_team_position_totals(
     game_ids: Iterable[str] | None = None,
     rules: ScoreRules = ScoreRules(),
 ) -> pd.DataFrame:
-    ev = _build_events(scoring_plays, rosters, season=season, week_max=week_max, game_ids=game_ids, rules=rules)
-    if ev.empty:
-        return pd.DataFrame(columns=["team", "position", "pts"])
-
-    out = (
-        ev.groupby(["team", "position"], as_index=False)["pts"]
-        .sum()
-        .sort_values(["team", "position"])
-        .reset_index(drop=True)
-    )
-
-    # Stabilize grid
-    teams = sorted([t for t in out["team"].dropna().astype(str).unique().tolist() if t])
-    if not teams:
-        return pd.DataFrame(columns=["team", "position", "pts"])
-
-    idx = pd.MultiIndex.from_product([teams, POSITION_BUCKETS], names=["team", "position"])
-    out = out.set_index(["team", "position"]).reindex(idx, fill_value=0).reset_index()
-    return out.sort_values(["team", "position"]).reset_index(drop=True)
+    """
+    ScoringResult.totals, as a copy the caller may modify.
+    """
+    return build_scoring_result(
+        scoring_plays, rosters, season=season, week_max=week_max, game_ids=game_ids, rules=rules
+    ).totals.copy()
@@ -0,0 +1,305 @@
+# src/scoring/incremental.py
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Callable, Iterable
+
+import pandas as pd
+
+from src.domain.teams import canonicalize_team_column
+
+from .engine import (
+    POSITION_BUCKETS,
+    ScoreRules,
+    ScoringResult,
+    _build_events,
+    _totals_from_events,
+    frame_version,
+)
+
+EVENT_COLUMNS = ["game_id", "play_id", "game_date", "qtr", "time", "team", "position", "pts", "reason", "desc"]
+UNIT_COLUMNS = ["team", "position", "pts", "n_events"]
+_UNIT_KEYS = ["team", "position"]
+_EVENT_SORT = ["game_date", "qtr", "time", "play_id"]
+
+
+def rules_key(rules: ScoreRules) -> str:
+    return hashlib.sha1(repr(sorted(asdict(rules).items())).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class IncrementalScoringState:
+    """
+    Season-wide engine output kept across refreshes:
+
+    - events: one row per scoring credit, keyed by (game_id, play_id), newest first
+    - units: per-(team, position) running pts and event counts
+
+    `plays_version` is the scoring-plays store version the state reflects; a
+    state that does not match the store it is applied against must be rebuilt.
+    """
+
+    season: int
+    rules_key: str
+    positions_version: str
+    plays_version: int
+    events: pd.DataFrame
+    units: pd.DataFrame
+
+    def matches(self, *, season: int, rules: ScoreRules, positions_version: str, plays_version: int) -> bool:
+        return (
+            self.season == int(season)
+            and self.rules_key == rules_key(rules)
+            and self.positions_version == str(positions_version)
+            and self.plays_version == int(plays_version)
+        )
+
+    @property
+    def totals(self) -> pd.DataFrame:
+        """
+        Same team x position grid as a full recompute (_totals_from_events).
+        """
+        u = self.units.loc[self.units["n_events"] > 0]
+        teams = sorted(t for t in u["team"].astype(str).unique().tolist() if t)
+        if not teams:
+            return pd.DataFrame(columns=["team", "position", "pts"])
+        idx = pd.MultiIndex.from_product([teams, POSITION_BUCKETS], names=_UNIT_KEYS)
+        out = u.set_index(_UNIT_KEYS)["pts"].reindex(idx, fill_value=0).astype("int64").reset_index()
+        return out.sort_values(_UNIT_KEYS).reset_index(drop=True)
+
+    def to_result(self, *, game_ids: Iterable[str] | None = None) -> ScoringResult:
+        """
+        ScoringResult for a game scope. When the state holds no games outside
+        the scope, the persisted unit totals are used as-is.
+        """
+        ev = self.events
+        if game_ids is not None:
+            gids = {str(g) for g in game_ids}
+            in_scope = ev["game_id"].isin(gids)
+            if not in_scope.all():
+                ev = ev.loc[in_scope].reset_index(drop=True)
+                totals = _totals_from_events(ev)
+            else:
+                totals = self.totals
+        else:
+            totals = self.totals
+
+        scope = None if game_ids is None else sorted({str(g) for g in game_ids})
+        fp = hashlib.sha1(
+            repr(("incremental", self.season, self.rules_key, self.positions_version, self.plays_version, scope)).encode("utf-8")
+        ).hexdigest()
+        return ScoringResult(
+            fingerprint=fp,
+            events=ev,
+            totals=totals,
+            feed=canonicalize_team_column(ev, "team"),
+        )
+
+
+def _event_keys(df: pd.DataFrame) -> pd.MultiIndex:
+    return pd.MultiIndex.from_arrays(
+        [
+            df["game_id"].astype(str).to_numpy(),
+            pd.to_numeric(df["play_id"], errors="coerce").astype("Int64").to_numpy(),
+        ],
+        names=["game_id", "play_id"],
+    )
+
+
+def _unit_counts(ev: pd.DataFrame) -> pd.DataFrame:
+    if ev.empty:
+        return pd.DataFrame(columns=["pts", "n_events"], index=pd.MultiIndex.from_tuples([], names=_UNIT_KEYS))
+    return ev.groupby(_UNIT_KEYS)["pts"].agg(pts="sum", n_events="size")
+
+
+def _sort_events(ev: pd.DataFrame) -> pd.DataFrame:
+    return ev.sort_values(_EVENT_SORT, ascending=False, kind="mergesort").reset_index(drop=True)
+
+
+def build_scoring_state(
+    scoring_plays: pd.DataFrame,
+    rosters: pd.DataFrame,
+    *,
+    season: int,
+    rules: ScoreRules = ScoreRules(),
+    positions_version: str | None = None,
+    plays_version: int = 0,
+) -> IncrementalScoringState:
+    """
+    Full recompute into an incremental state (first run, or after the rules,
+    rosters or scoring plays drifted from what the state reflects).
+    """
+    ev = _build_events(scoring_plays, rosters, season=season, rules=rules)[EVENT_COLUMNS]
+    units = _unit_counts(ev).reset_index()
+    return IncrementalScoringState(
+        season=int(season),
+        rules_key=rules_key(rules),
+        positions_version=str(positions_version if positions_version is not None else frame_version(rosters)),
+        plays_version=int(plays_version),
+        events=_sort_events(ev),
+        units=units.reindex(columns=UNIT_COLUMNS),
+    )
+
+
+def apply_play_changes(
+    state: IncrementalScoringState,
+    changed_plays: pd.DataFrame,
+    rosters: pd.DataFrame,
+    *,
+    rules: ScoreRules = ScoreRules(),
+    plays_version: int | None = None,
+    retracted: pd.DataFrame | None = None,
+) -> IncrementalScoringState:
+    """
+    Apply the inserted/updated scoring plays of one upsert (see
+    upsert_game_snapshots). Events previously credited for those
+    (game_id, play_id) keys are retracted from the unit totals, then the plays
+    are re-scored and their new events added. Only the changed plays are scored.
+
+    `retracted` holds the keys of plays removed from the store (tombstones from
+    upsert_game_snapshots); their events are retracted and nothing is added.
+    """
+    if plays_version is not None:
+        state = replace(state, plays_version=int(plays_version))
+    has_changes = changed_plays is not None and not changed_plays.empty
+    has_retractions = retracted is not None and not retracted.empty
+    if not has_changes and not has_retractions:
+        return state
+
+    touched = pd.concat(
+        [df[["game_id", "play_id"]] for df in (changed_plays, retracted) if df is not None and not df.empty],
+        ignore_index=True,
+    )
+    stale = _event_keys(state.events).isin(_event_keys(touched))
+    removed = state.events.loc[stale]
+    kept = state.events.loc[~stale]
+
+    if has_changes:
+        added = _build_events(changed_plays, rosters, season=state.season, rules=rules)[EVENT_COLUMNS]
+    else:
+        added = state.events.iloc[0:0]
+
+    units = state.units.set_index(_UNIT_KEYS)[["pts", "n_events"]]
+    units = units.add(_unit_counts(added), fill_value=0).sub(_unit_counts(removed), fill_value=0)
+    units = units.loc[units["n_events"] > 0].astype("int64").sort_index().reset_index()
+
+    parts = [df for df in (kept, added) if not df.empty]
+    events = pd.concat(parts, ignore_index=True) if parts else state.events.iloc[0:0]
+
+    return replace(state, events=_sort_events(events), units=units.reindex(columns=UNIT_COLUMNS))
+
+
+def state_paths(processed_dir: Path, season: int) -> tuple[Path, Path, Path]:
+    """
+    (events CSV, unit totals CSV, meta JSON) for a season's persisted state.
+    """
+    return (
+        processed_dir / f"scoring_events_{season}.csv",
+        processed_dir / f"scoring_totals_{season}.csv",
+        processed_dir / f"scoring_state_{season}.meta.json",
+    )
+
+
+def _write_atomic_csv(df: pd.DataFrame, path: Path) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    df.to_csv(tmp, index=False)
+    tmp.replace(path)
+
+
+def save_scoring_state(state: IncrementalScoringState, processed_dir: Path) -> None:
+    """
+    Persist the state. The meta file is written last, so a partial write leaves
+    a meta that no longer matches and the next update rebuilds.
+    """
+    events_path, totals_path, meta_path = state_paths(processed_dir, state.season)
+    processed_dir.mkdir(parents=True, exist_ok=True)
+    _write_atomic_csv(state.events, events_path)
+    _write_atomic_csv(state.units, totals_path)
+    meta = {
+        "season": state.season,
+        "rules_key": state.rules_key,
+        "positions_version": state.positions_version,
+        "plays_version": state.plays_version,
+        "n_events": int(len(state.events)),
+    }
+    tmp = meta_path.with_suffix(meta_path.suffix + ".tmp")
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    tmp.replace(meta_path)
+
+
+def load_scoring_state(processed_dir: Path, season: int) -> IncrementalScoringState | None:
+    """
+    Read a persisted state, or None if it is missing or unreadable.
+    """
+    events_path, totals_path, meta_path = state_paths(processed_dir, season)
+    if not (events_path.exists() and totals_path.exists() and meta_path.exists()):
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        ev = pd.read_csv(events_path, dtype={"game_id": str, "team": str, "position": str, "reason": str}, keep_default_na=False)
+        units = pd.read_csv(totals_path, dtype={"team": str, "position": str}, keep_default_na=False)
+    except Exception:
+        return None
+    if len(ev) != int(meta.get("n_events", -1)) or not set(EVENT_COLUMNS).issubset(ev.columns):
+        return None
+
+    ev = ev[EVENT_COLUMNS].copy()
+    for c in ["play_id", "qtr"]:
+        ev[c] = pd.to_numeric(ev[c], errors="coerce").astype("Int64")
+    for c in ["game_date", "time", "desc"]:
+        ev[c] = ev[c].astype(str)
+    ev["pts"] = pd.to_numeric(ev["pts"], errors="coerce").fillna(0).astype("int64")
+    units = units.reindex(columns=UNIT_COLUMNS)
+    units[["pts", "n_events"]] = units[["pts", "n_events"]].apply(pd.to_numeric, errors="coerce").fillna(0).astype("int64")
+
+    return IncrementalScoringState(
+        season=int(meta["season"]),
+        rules_key=str(meta["rules_key"]),
+        positions_version=str(meta["positions_version"]),
+        plays_version=int(meta["plays_version"]),
+        events=ev,
+        units=units,
+    )
+
+
+def update_scoring_state(
+    *,
+    processed_dir: Path,
+    season: int,
+    load_plays: Callable[[], pd.DataFrame],
+    changed: pd.DataFrame,
+    rosters: pd.DataFrame,
+    plays_version_before: int,
+    plays_version_after: int,
+    positions_version: str | None = None,
+    rules: ScoreRules = ScoreRules(),
+    retracted: pd.DataFrame | None = None,
+) -> IncrementalScoringState:
+    """
+    Refresh-time entry point: apply `changed` (and `retracted` keys) to the
+    persisted state when it reflects `plays_version_before`; otherwise rebuild
+    from `load_plays()` (only called on rebuild, so callers can defer reading
+    the full season).
+    """
+    positions_version = str(positions_version if positions_version is not None else frame_version(rosters))
+    state = load_scoring_state(processed_dir, season)
+    if state is not None and state.matches(
+        season=season, rules=rules, positions_version=positions_version, plays_version=plays_version_before
+    ):
+        state = apply_play_changes(
+            state, changed, rosters, rules=rules, plays_version=plays_version_after, retracted=retracted
+        )
+    else:
+        state = build_scoring_state(
+            load_plays(),
+            rosters,
+            season=season,
+            rules=rules,
+            positions_version=positions_version,
+            plays_version=plays_version_after,
+        )
+    save_scoring_state(state, processed_dir)
+    return state
@@ -0,0 +1,247 @@
+# src/snapshot.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+import pandas as pd
+
+from src.pbp.store import ScoringPlayStore
+from src.playoffs import read_eliminated_teams
+from src.scoreboard import build_scoreboard_dataset
+from src.scoring import ScoreRules, build_scoring_result, load_player_positions
+from src.scoring.incremental import load_scoring_state
+
+SNAPSHOT_FORMAT = 1
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@dataclass(frozen=True)
+class SnapshotSources:
+    """
+    Files a scoreboard snapshot is built from. `versions()` is cheap (stat
+    calls only), so the app can check a snapshot is current on every rerun.
+    """
+
+    season: int
+    draft_picks_path: Path
+    playoff_game_ids_path: Path
+    store_dir: Path
+    positions_path: Path
+    eliminated_path: Path
+    snapshot_path: Path
+
+    @classmethod
+    def default(cls, *, season: int, processed_dir: Path, config_dir: Path) -> "SnapshotSources":
+        """
+        The app's layout under data/config and data/processed.
+        """
+        return cls(
+            season=int(season),
+            draft_picks_path=config_dir / f"draft_picks_{season}.csv",
+            playoff_game_ids_path=config_dir / f"playoff_game_ids_{season}.csv",
+            store_dir=processed_dir / "scoring_plays_store",
+            positions_path=processed_dir / f"player_positions_{season}.csv",
+            eliminated_path=processed_dir / f"eliminated_teams_{season}.csv",
+            snapshot_path=processed_dir / f"scoreboard_snapshot_{season}.arrow",
+        )
+
+    def versions(self) -> Dict[str, int]:
+        return {
+            "draft_picks": _mtime_ns(self.draft_picks_path),
+            "playoff_game_ids": _mtime_ns(self.playoff_game_ids_path),
+            "scoring_plays": ScoringPlayStore(self.store_dir).version(),
+            "positions": _mtime_ns(self.positions_path),
+            "eliminated": _mtime_ns(self.eliminated_path),
+        }
+
+
+@dataclass(frozen=True)
+class ScoreboardSnapshot:
+    """
+    Everything the app renders, materialized at refresh time: the scoreboard
+    grid (build_scoreboard_dataset), owner totals, event feed rows (owner
+    already joined) and eliminated teams. `inputs` are the SnapshotSources versions it was built from.
+    """
+
+    season: int
+    built_at: str
+    inputs: Dict[str, int]
+    scoreboard: pd.DataFrame
+    owner_totals: pd.DataFrame
+    feed: pd.DataFrame
+    eliminated: FrozenSet[str]
+
+    @property
+    def version(self) -> str:
+        """
+        Token for render caches: snapshots built from the same inputs are identical.
+        """
+        return f"snapshot:{self.season}:" + ",".join(f"{k}={v}" for k, v in sorted(self.inputs.items()))
+
+    def is_current(self, sources: SnapshotSources) -> bool:
+        return self.season == sources.season and self.inputs == sources.versions()
+
+
+def _read_playoff_game_ids(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    df = pd.read_csv(path)
+    if "game_id" not in df.columns:
+        return []
+    return sorted({g for g in df["game_id"].dropna().astype(str).str.strip() if g})
+
+
+def _attach_owners(feed: pd.DataFrame, draft_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Feed rows with the drafting owner joined on (team, position), as
+    section_event_feed does when it is given the draft.
+    """
+    feed = feed.reset_index(drop=True)
+    if {"team", "position"}.issubset(feed.columns) and {"team", "position", "owner"}.issubset(draft_df.columns):
+        owners = draft_df[["team", "position", "owner"]].drop_duplicates()
+        feed = feed.merge(owners, on=["team", "position"], how="left")
+    return feed
+
+
+def build_snapshot(sources: SnapshotSources) -> Optional[ScoreboardSnapshot]:
+    """
+    Build the snapshot from the files in `sources`, or None when the app would
+    render something other than a scored scoreboard (no draft, no playoff
+    game_ids, no positions or scoring plays); the app handles those cases itself.
+
+    Scores come from the incremental scoring state when it matches the store,
+    otherwise from one engine pass over the in-scope partitions.
+    """
+    inputs = sources.versions()
+    game_ids = _read_playoff_game_ids(sources.playoff_game_ids_path)
+    store = ScoringPlayStore(sources.store_dir)
+    if not (sources.draft_picks_path.exists() and sources.positions_path.exists() and game_ids and store.exists()):
+        return None
+
+    draft_df = pd.read_csv(sources.draft_picks_path)
+    if draft_df.empty:
+        return None
+
+    positions_version = str(inputs["positions"])
+    state = load_scoring_state(sources.store_dir.parent, sources.season)
+    if state is not None and state.matches(
+        season=sources.season,
+        rules=ScoreRules(),
+        positions_version=positions_version,
+        plays_version=inputs["scoring_plays"],
+    ):
+        result = state.to_result(game_ids=game_ids)
+    else:
+        from src.app_io import normalize_scoring_df  # app_io pulls in streamlit
+
+        plays = normalize_scoring_df(store.read(game_ids))
+        if plays.empty:
+            return None
+        result = build_scoring_result(
+            plays,
+            load_player_positions(sources.positions_path),
+            season=sources.season,
+            game_ids=game_ids,
+            scoring_version=inputs["scoring_plays"],
+            positions_version=positions_version,
+        )
+
+    scoreboard = build_scoreboard_dataset(draft_df, result.totals, season=sources.season, validate=True)
+    owner_totals = (
+        scoreboard.groupby(["owner_id", "owner"], as_index=False)["pts"].sum().sort_values("owner_id").reset_index(drop=True)
+    )
+    return ScoreboardSnapshot(
+        season=sources.season,
+        built_at=_now_utc_iso(),
+        inputs=inputs,
+        scoreboard=scoreboard,
+        owner_totals=owner_totals,
+        feed=_attach_owners(result.feed, draft_df),
+        eliminated=frozenset(read_eliminated_teams(sources.eliminated_path) or set()),
+    )
+
+
+_FRAMES = ("scoreboard", "owner_totals", "feed")
+_HEADER_KEY = b"bbb_snapshot"
+
+
+def write_snapshot(snap: ScoreboardSnapshot, path: Path) -> None:
+    """
+    One file holding an Arrow IPC stream per frame (see _FRAMES), in order.
+    The first stream's schema metadata carries the JSON header (format,
+    season, inputs, eliminated teams).
+    """
+    import pyarrow as pa
+
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "season": snap.season,
+        "built_at": snap.built_at,
+        "inputs": snap.inputs,
+        "eliminated": sorted(snap.eliminated),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with pa.OSFile(str(tmp), "wb") as f:
+        for i, name in enumerate(_FRAMES):
+            table = pa.Table.from_pandas(getattr(snap, name), preserve_index=False)
+            if i == 0:
+                table = table.replace_schema_metadata(
+                    {**(table.schema.metadata or {}), _HEADER_KEY: json.dumps(header).encode("utf-8")}
+                )
+            with pa.ipc.new_stream(f, table.schema) as writer:
+                writer.write_table(table)
+    tmp.replace(path)
+
+
+def read_snapshot(path: Path) -> Optional[ScoreboardSnapshot]:
+    """
+    The snapshot at `path`, or None if it is missing, unreadable or from
+    another format version.
+    """
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(str(path), "r") as f:
+            tables = [pa.ipc.open_stream(f).read_all() for _ in _FRAMES]
+        header = json.loads(tables[0].schema.metadata[_HEADER_KEY])
+        if header.get("format") != SNAPSHOT_FORMAT:
+            return None
+        frames = dict(zip(_FRAMES, (t.to_pandas() for t in tables)))
+        return ScoreboardSnapshot(
+            season=int(header["season"]),
+            built_at=str(header["built_at"]),
+            inputs={k: int(v) for k, v in header["inputs"].items()},
+            eliminated=frozenset(header.get("eliminated", [])),
+            **frames,
+        )
+    except (OSError, ValueError, KeyError, TypeError, pa.ArrowException):
+        return None
+
+
+def materialize_snapshot(sources: SnapshotSources) -> Optional[ScoreboardSnapshot]:
+    """
+    Refresh-time entry point: build and write the snapshot. When there is
+    nothing to snapshot, a previous snapshot is removed so the app cannot
+    render it.
+    """
+    snap = build_snapshot(sources)
+    if snap is None:
+        sources.snapshot_path.unlink(missing_ok=True)
+        return None
+    write_snapshot(snap, sources.snapshot_path)
+    return snap
@@ -0,0 +1,281 @@
+# src/view_models.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+FEED_COLUMNS = ["Game Date", "Game", "Time", "Play Description", "Score 1", "Score 2"]
+_PLAY_COLUMNS = ["Game Date", "Game", "Time", "Play Description"]
+FEED_PAGE_SIZE = 50
+ALL = "(All)"
+
+
+@dataclass(frozen=True)
+class GridView:
+    """
+    Scoreboard grid ready to render: owners in owner_id order, and
+    (round, owner) arrays where [r, o] is round r + 1 for owners[o].
+    `present` is False where an owner has no pick in that round.
+    """
+
+    owner_ids: np.ndarray
+    owner_names: Tuple[str, ...]
+    present: np.ndarray
+    slot: np.ndarray
+    unit: np.ndarray
+    pts: np.ndarray
+    eliminated: np.ndarray
+    totals: np.ndarray
+
+    @property
+    def n_rounds(self) -> int:
+        return int(self.present.shape[0])
+
+
+def build_grid_view(scoreboard: pd.DataFrame, eliminated_teams: frozenset[str] | set[str] = frozenset()) -> GridView:
+    """
+    Scatter the scoreboard dataset (one row per owner x round) into dense
+    arrays. A duplicated (owner_id, round) keeps its last row.
+    """
+    owners = scoreboard[["owner_id", "owner"]].drop_duplicates("owner_id").sort_values("owner_id")
+    owner_ids = owners["owner_id"].astype("int64").to_numpy()
+    n_rounds = int(scoreboard["round"].max())
+
+    col = pd.Index(owner_ids).get_indexer(scoreboard["owner_id"].astype("int64"))
+    row = scoreboard["round"].astype("int64").to_numpy() - 1
+    ok = (row >= 0) & (col >= 0)
+    row, col = row[ok], col[ok]
+    sb = scoreboard.loc[ok]
+
+    shape = (n_rounds, len(owner_ids))
+    present = np.zeros(shape, dtype=bool)
+    slot = np.zeros(shape, dtype="int64")
+    unit = np.full(shape, "", dtype=object)
+    pts = np.zeros(shape, dtype="float64")
+    eliminated = np.zeros(shape, dtype=bool)
+
+    team = sb["team"].fillna("").astype(str).str.strip() if "team" in sb.columns else pd.Series("", index=sb.index)
+    present[row, col] = True
+    slot[row, col] = pd.to_numeric(sb["slot"], errors="coerce").fillna(0).astype("int64").to_numpy()
+    unit[row, col] = sb["unit"].fillna("").astype(str).to_numpy()
+    pts[row, col] = pd.to_numeric(sb["pts"], errors="coerce").fillna(0.0).to_numpy(dtype="float64")
+    eliminated[row, col] = (team.ne("") & team.isin(list(eliminated_teams))).to_numpy()
+
+    totals = np.bincount(col, weights=pts[row, col], minlength=len(owner_ids))
+
+    return GridView(
+        owner_ids=owner_ids,
+        owner_names=tuple(owners["owner"].astype(str).tolist()),
+        present=present,
+        slot=slot,
+        unit=unit,
+        pts=pts,
+        eliminated=eliminated,
+        totals=totals,
+    )
+
+
+FEED_INDEX_COLUMNS = ("owner", "team", "position")
+
+
+@dataclass(frozen=True)
+class FeedView:
+    """
+    Event feed prepared once per data version:
+
+    - credits: one row per scoring credit with the play-level display fields,
+      grouped by play (newest first) and, within a play, ordered by (team,
+      position, owner), the order credits are listed in
+    - credit_play / credit_score: per credit, its play's rank (0 = newest) and
+      its unit score text
+    - index: for owner / team / position, value -> (credit positions, offsets
+      in those positions where a new play starts)
+
+    Filter options are sorted.
+    """
+
+    credits: pd.DataFrame
+    credit_play: np.ndarray
+    credit_score: np.ndarray
+    index: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]]
+    drafters: Tuple[str, ...]
+    teams: Tuple[str, ...]
+    positions: Tuple[str, ...]
+
+    @property
+    def empty(self) -> bool:
+        return len(self.credit_play) == 0
+
+
+@dataclass(frozen=True)
+class FeedPage:
+    rows: pd.DataFrame
+    page: int
+    n_pages: int
+    total_plays: int
+
+
+def _options(df: pd.DataFrame, col: str) -> Tuple[str, ...]:
+    if col not in df.columns:
+        return ()
+    return tuple(sorted(df[col].dropna().unique().tolist()))
+
+
+def _str_col(df: pd.DataFrame, col: str) -> pd.Series:
+    return df[col].astype(str) if col in df.columns else pd.Series("", index=df.index, dtype=object)
+
+
+def build_feed_view(events: pd.DataFrame, draft_df: pd.DataFrame | None = None) -> FeedView:
+    """
+    Join owners on (team, position) when `draft_df` has them (feed rows from a
+    scoreboard snapshot already carry `owner`) and derive every display field
+    with column operations.
+    """
+    view = events.reset_index(drop=True)
+    if (
+        draft_df is not None
+        and {"team", "position"}.issubset(view.columns)
+        and {"team", "position", "owner"}.issubset(draft_df.columns)
+    ):
+        owners = draft_df[["team", "position", "owner"]].drop_duplicates()
+        view = view.merge(owners, on=["team", "position"], how="left")
+
+    out = pd.DataFrame(index=view.index)
+    for c in ["owner", "team", "position", "game_id", "play_id", "game_date"]:
+        if c in view.columns:
+            out[c] = view[c]
+
+    out["Play Description"] = view["desc"] if "desc" in view.columns else ""
+    out["Game Date"] = view["game_date"] if "game_date" in view.columns else ""
+
+    # Game column from game_id: YYYY_WW_AWAY_HOME
+    if "game_id" in view.columns:
+        # Derived once per distinct game_id, then broadcast
+        codes, gids = pd.factorize(view["game_id"].fillna("").astype(str))
+        parts = pd.Series(gids, dtype=object).str.split("_")
+        matchup = (parts.str[-2] + " vs " + parts.str[-1]).where(parts.str.len() >= 4, "")
+        out["Game"] = matchup.to_numpy(dtype=object)[codes]
+    else:
+        out["Game"] = ""
+
+    if {"qtr", "time"}.issubset(view.columns):
+        out["Time"] = "Q" + view["qtr"].astype(str) + " " + view["time"].astype(str)
+    else:
+        out["Time"] = ""
+
+    pts = pd.to_numeric(view["pts"], errors="coerce") if "pts" in view.columns else pd.Series(np.nan, index=view.index)
+    pts_display = np.trunc(pts).astype("Int64").astype(str).where(pts.notna(), "")
+    owner = view["owner"].fillna("").astype(str) if "owner" in view.columns else ""
+    out["UnitScore"] = _str_col(view, "team") + " " + _str_col(view, "position") + ": " + pts_display + " (" + owner + ")"
+
+    # Play key
+    if {"game_id", "play_id"}.issubset(view.columns):
+        out["_play_key"] = view["game_id"].astype(str) + "|" + view["play_id"].astype(str)
+    else:
+        out["_play_key"] = view.index.astype(str)
+
+    # Play order, newest first
+    firsts = [c for c in ["game_id", "play_id", "game_date"] if c in out.columns]
+    plays = out.groupby("_play_key")[firsts].first()
+    sort_cols = [c for c in ["game_date", "game_id", "play_id"] if c in plays.columns]
+    if sort_cols:
+        plays = plays.sort_values(sort_cols, ascending=False)
+    plays = plays.reset_index()
+
+    # Credits grouped by play, in listing order within each play
+    out["_play"] = pd.Index(plays["_play_key"]).get_indexer(out["_play_key"])
+    out = out.sort_values(["_play", *[c for c in ["team", "position", "owner"] if c in out.columns]])
+    credit_play = out["_play"].to_numpy()
+
+    index: Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]] = {}
+    for col in FEED_INDEX_COLUMNS:
+        if col not in out.columns:
+            continue
+        groups = pd.Series(np.arange(len(out))).groupby(out[col].to_numpy(), sort=False).indices
+        index[col] = {k: (pos, _play_starts(credit_play[pos])) for k, pos in groups.items()}
+
+    return FeedView(
+        credits=out[_PLAY_COLUMNS].reset_index(drop=True),
+        credit_play=credit_play,
+        credit_score=out["UnitScore"].to_numpy(dtype=object),
+        index=index,
+        drafters=_options(out, "owner"),
+        teams=_options(out, "team"),
+        positions=_options(out, "position"),
+    )
+
+
+def _play_starts(plays_of_credits: np.ndarray) -> np.ndarray:
+    if len(plays_of_credits) == 0:
+        return np.zeros(0, dtype="int64")
+    return np.flatnonzero(np.r_[True, plays_of_credits[1:] != plays_of_credits[:-1]])
+
+
+def _select(view: FeedView, filters: Dict[str, str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (credit positions, play start offsets) matching every active filter.
+    A single filter is a dictionary lookup; several are intersected.
+    """
+    active = []
+    for col, sel in filters.items():
+        if sel == ALL or col not in view.index:
+            continue
+        hit = view.index[col].get(sel)
+        if hit is None:
+            return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64")
+        active.append(hit)
+
+    if not active:
+        pos = np.arange(len(view.credit_play))
+        return pos, _play_starts(view.credit_play)
+    if len(active) == 1:
+        return active[0]
+    pos = active[0][0]
+    for other, _ in active[1:]:
+        pos = np.intersect1d(pos, other, assume_unique=True)
+    return pos, _play_starts(view.credit_play[pos])
+
+
+def feed_page(
+    view: FeedView,
+    *,
+    drafter: str = ALL,
+    team: str = ALL,
+    position: str = ALL,
+    page: int = 0,
+    page_size: int | None = FEED_PAGE_SIZE,
+) -> FeedPage:
+    """
+    One page (0-based) of the feed: one row per play (FEED_COLUMNS), newest
+    first, for the credits matching the filters. A play lists up to two
+    matching credits as Score 1 / Score 2. `page_size=None` returns every play.
+
+    Only the rows on the page are materialized.
+    """
+    pos, starts = _select(view, {"owner": drafter, "team": team, "position": position})
+    total = len(starts)
+    size = total if page_size is None else int(page_size)
+    n_pages = max(1, -(-total // size)) if size else 1
+    page = min(max(int(page), 0), n_pages - 1)
+
+    lo, hi = page * size, min(total, (page + 1) * size)
+    first = starts[lo:hi]
+    end = np.r_[starts[lo + 1 : hi + 1], len(pos)][: len(first)]
+    has_second = first + 1 < end
+
+    # Play-level fields come from the play's first matching credit
+    rows = view.credits.iloc[pos[first]].copy()
+    rows.index = pd.RangeIndex(lo, hi)
+    rows["Score 1"] = view.credit_score[pos[first]]
+    rows["Score 2"] = np.where(has_second, view.credit_score[pos[np.minimum(first + 1, len(pos) - 1)]], "") if len(pos) else ""
+    return FeedPage(rows=rows[FEED_COLUMNS], page=page, n_pages=n_pages, total_plays=total)
+
+
+def filter_feed(view: FeedView, *, drafter: str = ALL, team: str = ALL, position: str = ALL) -> pd.DataFrame:
+    """
+    Every matching play, newest first (feed_page without pagination).
+    """
+    return feed_page(view, drafter=drafter, team=team, position=position, page_size=None).rows
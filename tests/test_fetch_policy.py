@@ -0,0 +1,171 @@
+"""
+GTD fetch policy (src/pbp/live_pbp.py) against a local stub HTTP server:
+timeouts, retries with backoff, and the per-host circuit breaker. The server
+picks its behaviour from the event id in the path.
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from src.pbp import live_pbp as lp
+
+POLICY = lp.FetchPolicy(
+    connect_timeout_s=0.2,
+    read_timeout_s=0.2,
+    retries=2,
+    backoff_base_s=0.05,
+    backoff_max_s=0.2,
+    breaker_threshold=3,
+    breaker_cooldown_s=0.3,
+)
+SLOW_S = 0.6
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        eid = self.path.strip("/")
+        server.hits[eid] += 1
+        if eid.startswith("flaky") and server.hits[eid] <= 2:
+            return self._send(503, b"busy")
+        if eid.startswith("slow"):
+            time.sleep(SLOW_S)
+        if eid.startswith("missing"):
+            return self._send(404, b"")
+        if eid.startswith("down") and server.down:
+            return self._send(500, b"boom")
+        drives = {"1": {"driveNum": 1, "plays": {"5": {"playId": 5, "desc": "x"}}}}
+        self._send(200, json.dumps({eid: {"gameDate": "2025-01-12", "drives": drives}}).encode())
+
+    def _send(self, code, body):
+        try:
+            self.send_response(code)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # the client timed out and hung up
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    srv.hits, srv.down = defaultdict(int), True
+    srv.host = f"127.0.0.1:{srv.server_address[1]}"
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    monkeypatch.setattr(lp, "_GTD_URL", f"http://{srv.host}/{{eid}}")
+    lp._BREAKER.clear()
+    with requests.Session() as session:
+        srv.session = session
+        yield srv
+    lp._BREAKER.clear()
+    srv.shutdown()
+    srv.server_close()
+
+
+def _fetch(stub, eid, **kwargs):
+    kwargs.setdefault("policy", POLICY)
+    kwargs.setdefault("breaker", lp.CircuitBreaker())
+    return lp.fetch_gtd_response(eid, session=stub.session, **kwargs)
+
+
+def test_ok_and_not_found_take_one_request(stub):
+    assert "ok1" in _fetch(stub, "ok1").payload
+    assert _fetch(stub, "missing1").payload == {}
+    assert stub.hits["ok1"] == 1 and stub.hits["missing1"] == 1
+
+
+def test_transient_errors_are_retried_with_backoff(stub):
+    breaker = lp.CircuitBreaker()
+    t = time.perf_counter()
+    resp = _fetch(stub, "flaky1", breaker=breaker)
+    elapsed = time.perf_counter() - t
+
+    assert "flaky1" in resp.payload and stub.hits["flaky1"] == 3
+    assert elapsed < 0.05 + 0.1 + 0.2
+    assert not breaker.is_open(stub.host)
+
+
+def test_no_retries_surfaces_the_error(stub):
+    with pytest.raises(RuntimeError, match="503"):
+        _fetch(stub, "flaky2", retries=0, breaker=None)
+    assert stub.hits["flaky2"] == 1
+
+
+def test_read_timeouts_are_retried_then_raised(stub):
+    t = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        _fetch(stub, "slow1", breaker=None)
+    elapsed = time.perf_counter() - t
+
+    assert stub.hits["slow1"] == 3
+    assert 3 * 0.2 <= elapsed < 3 * 0.2 + 0.2 + 0.3
+
+
+def test_connection_refused_fails_fast(stub, monkeypatch):
+    monkeypatch.setattr(lp, "_GTD_URL", "http://127.0.0.1:9/{eid}")
+    t = time.perf_counter()
+    with pytest.raises(RuntimeError):
+        _fetch(stub, "x", breaker=None)
+    assert time.perf_counter() - t < 0.5
+
+
+def test_breaker_opens_then_recovers_through_a_half_open_trial(stub):
+    breaker = lp.CircuitBreaker()
+    with pytest.raises(RuntimeError):
+        _fetch(stub, "down1", breaker=breaker)
+    assert stub.hits["down1"] == 3 and breaker.is_open(stub.host)
+
+    # Open: fails fast without a request.
+    with pytest.raises(lp.CircuitOpenError):
+        _fetch(stub, "down2", breaker=breaker)
+    assert stub.hits["down2"] == 0
+
+    # After the cooldown one trial goes out; a failure reopens the circuit.
+    time.sleep(POLICY.breaker_cooldown_s + 0.05)
+    with pytest.raises(lp.CircuitOpenError):
+        _fetch(stub, "down3", breaker=breaker)
+    assert stub.hits["down3"] == 1
+
+    # A successful trial closes it.
+    time.sleep(POLICY.breaker_cooldown_s + 0.05)
+    stub.down = False
+    assert "down4" in _fetch(stub, "down4", breaker=breaker).payload
+    assert not breaker.is_open(stub.host)
+
+
+def test_batch_is_skipped_while_the_circuit_is_open(stub, monkeypatch):
+    game_ids = [f"2024_19_A{i}_H{i}" for i in range(6)]
+
+    def fetch_batch(n):
+        events = {g: f"slow_b{i}_{n}" for i, g in enumerate(game_ids)}
+        monkeypatch.setattr(lp, "game_id_to_event_id_map", lambda season: events)
+        t = time.perf_counter()
+        _, metrics = lp.fetch_live_pbp_for_game_ids(
+            season=2024, game_ids=game_ids, policy=POLICY, session=stub.session, conditional=False
+        )
+        return metrics, time.perf_counter() - t
+
+    first, _ = fetch_batch(0)
+    assert {m.status for m in first} == {"error"}
+
+    second, elapsed = fetch_batch(1)
+    assert all("Circuit open" in m.detail for m in second)
+    assert elapsed < 0.1
+    assert not any(stub.hits[f"slow_b{i}_1"] for i in range(6))
+
+
+def test_backoff_bounds_and_overrides():
+    policy = lp.FetchPolicy(backoff_base_s=0.25, backoff_max_s=2.0)
+
+    assert [policy.backoff_s(a, rand=lambda: 1.0) for a in (1, 2, 3, 4, 5)] == [0.25, 0.5, 1.0, 2.0, 2.0]
+    assert policy.backoff_s(3, rand=lambda: 0.0) == 0.0
+    assert lp.FetchPolicy().with_overrides(timeout_s=1.0, retries=0).timeout == (1.0, 1.0)
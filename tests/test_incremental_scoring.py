@@ -0,0 +1,190 @@
+"""
+Property checks for src/scoring/incremental.py: after any sequence of upserts
+(inserts, updates, re-sent rows, retractions), the incrementally maintained
+state equals a full recompute over the resulting scoring plays.
+"""
+import random
+
+import pandas as pd
+import pytest
+
+from src.pbp.upsert import upsert_game_snapshots
+from src.scoring.engine import _totals_from_events
+from src.scoring.incremental import (
+    EVENT_COLUMNS,
+    apply_play_changes,
+    build_scoring_state,
+    load_scoring_state,
+    update_scoring_state,
+)
+
+SEASON = 2024
+TEAMS = ["BUF", "KC", "LA", "LAR", "HOU", "BAL", "PHI", "WAS"]
+PLAYER_IDS = [f"00-{i:07d}" for i in range(40)]
+GAME_IDS = [f"2024_19_A{i}_H{i}" for i in range(5)]
+KINDS = ["pass", "rush", "fg", "xp", "def_td", "safety", "2pt_pass", "2pt_rush", "def_2pt", "none"]
+
+
+def _rosters(rng: random.Random) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player_id": PLAYER_IDS,
+            "position_bucket": [rng.choice(["QB", "RB", "WR", "TE", "K", "OTH"]) for _ in PLAYER_IDS],
+        }
+    )
+
+
+def _play(rng: random.Random, game_id: str, play_id: int, refreshed_at: str) -> dict:
+    kind = rng.choice(KINDS)
+    posteam, defteam = rng.sample(TEAMS, 2)
+
+    def pid():
+        return rng.choice(PLAYER_IDS + [None])
+
+    passing = kind in ("pass", "2pt_pass")
+    return {
+        "refreshed_at": refreshed_at,
+        # a few plays from another season, which the state must ignore
+        "season": rng.choice([SEASON, SEASON, SEASON, SEASON - 1]),
+        "week": 19,
+        "game_id": game_id,
+        "game_date": "2025-01-1" + game_id[-1],
+        "posteam": posteam,
+        "defteam": defteam,
+        "qtr": rng.randint(1, 4),
+        "time": f"{rng.randint(0, 14):02d}:{rng.randint(0, 59):02d}",
+        "play_id": play_id,
+        "desc": f"play {rng.randint(0, 5)}",
+        "play_type": "pass" if passing else "run",
+        "is_fg": kind == "fg",
+        "is_xp": kind == "xp",
+        "is_2pt": kind in ("2pt_pass", "2pt_rush"),
+        "is_safety": kind == "safety",
+        "is_td_off": kind in ("pass", "rush"),
+        "is_td_def": kind == "def_td",
+        "pass_touchdown": kind == "pass",
+        "rush_touchdown": kind == "rush",
+        "is_def_two_pt": kind == "def_2pt",
+        "defensive_two_point_conv": int(kind == "def_2pt"),
+        "passer_player_id": pid(),
+        "receiver_player_id": pid() if passing else None,
+        "rusher_player_id": pid(),
+        "kicker_player_id": pid(),
+    }
+
+
+def _batch(rng: random.Random, plays: pd.DataFrame, step: int) -> tuple[pd.DataFrame, list[str]]:
+    """
+    One refresh: a random set of games, each re-sent as a complete snapshot
+    with some plays changed, some new and some dropped (retracted).
+    """
+    refreshed_at = f"2025-01-12T12:{step:02d}:00"
+    games = rng.sample(GAME_IDS, rng.randint(1, 3))
+    rows = []
+    for gid in games:
+        stored = plays.loc[plays["game_id"] == gid] if not plays.empty else plays
+        for r in stored.to_dict("records"):
+            roll = rng.random()
+            if roll < 0.15:
+                continue  # dropped from the feed / overturned
+            if roll < 0.35:
+                rows.append(_play(rng, gid, int(r["play_id"]), refreshed_at))
+            else:
+                rows.append({**r, "refreshed_at": refreshed_at})  # re-sent unchanged
+        taken = set(stored["play_id"].astype(int)) if not stored.empty else set()
+        for play_id in rng.sample([p for p in range(1, 25) if p not in taken], rng.randint(0, 4)):
+            rows.append(_play(rng, gid, play_id, refreshed_at))
+    batch = pd.DataFrame(rows, columns=list(_play(rng, GAME_IDS[0], 0, "").keys()))
+    batch["play_id"] = batch["play_id"].astype("Int64")
+    return batch, games
+
+
+def _upsert(plays: pd.DataFrame, batch: pd.DataFrame, games: list[str], refreshed_at: str):
+    old = plays.loc[plays["game_id"].isin(games)] if not plays.empty else None
+    merged, changed, tombstones = upsert_game_snapshots(
+        old, batch, snapshot_game_ids=games, retracted_at=refreshed_at
+    )
+    rest = plays.loc[~plays["game_id"].isin(games)] if not plays.empty else plays
+    parts = [df for df in (rest, merged) if not df.empty]
+    plays = pd.concat(parts, ignore_index=True) if parts else rest
+    return plays, changed, tombstones
+
+
+def _sorted_events(ev: pd.DataFrame) -> pd.DataFrame:
+    out = ev[EVENT_COLUMNS].astype(str)
+    return out.sort_values(EVENT_COLUMNS).reset_index(drop=True)
+
+
+def _assert_same(state, full) -> None:
+    pd.testing.assert_frame_equal(_sorted_events(state.events), _sorted_events(full.events))
+    pd.testing.assert_frame_equal(state.totals, full.totals, check_dtype=False)
+    pd.testing.assert_frame_equal(state.totals, _totals_from_events(full.events), check_dtype=False)
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_apply_play_changes_matches_full_recompute(seed):
+    rng = random.Random(seed)
+    rosters = _rosters(rng)
+    plays = pd.DataFrame()
+    state = build_scoring_state(plays, rosters, season=SEASON, positions_version="p")
+
+    for step in range(8):
+        batch, games = _batch(rng, plays, step)
+        plays, changed, tombstones = _upsert(plays, batch, games, f"step-{step}")
+        state = apply_play_changes(state, changed, rosters, plays_version=step + 1, retracted=tombstones)
+
+        full = build_scoring_state(plays, rosters, season=SEASON, positions_version="p", plays_version=step + 1)
+        _assert_same(state, full)
+
+        scope = GAME_IDS[:2]
+        in_scope = full.events.loc[full.events["game_id"].isin(scope)]
+        pd.testing.assert_frame_equal(
+            state.to_result(game_ids=scope).totals, _totals_from_events(in_scope), check_dtype=False
+        )
+
+
+def test_unchanged_batch_is_a_no_op():
+    rng = random.Random(0)
+    rosters = _rosters(rng)
+    plays = pd.DataFrame([_play(rng, GAME_IDS[0], p, "t0") for p in range(1, 15)]).assign(season=SEASON)
+    state = build_scoring_state(plays, rosters, season=SEASON, positions_version="p")
+
+    _, changed, tombstones = _upsert(plays, plays.assign(refreshed_at="t1"), [GAME_IDS[0]], "t1")
+
+    assert changed.empty and tombstones.empty
+    assert apply_play_changes(state, changed, rosters, retracted=tombstones).events.equals(state.events)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_persisted_state_matches_full_recompute(seed, tmp_path):
+    """
+    update_scoring_state round-trips through CSV and rebuilds when a refresh
+    was missed (versions no longer line up).
+    """
+    rng = random.Random(seed)
+    rosters = _rosters(rng)
+    plays = pd.DataFrame()
+    version = 0
+
+    for step in range(8):
+        batch, games = _batch(rng, plays, step)
+        plays, changed, tombstones = _upsert(plays, batch, games, f"step-{step}")
+        before, version = version, version + 1
+        if rng.random() < 0.2:
+            continue  # missed update: the next one must rebuild from load_plays
+
+        update_scoring_state(
+            processed_dir=tmp_path,
+            season=SEASON,
+            load_plays=lambda: plays,
+            changed=changed,
+            retracted=tombstones,
+            rosters=rosters,
+            plays_version_before=before,
+            plays_version_after=version,
+            positions_version="p",
+        )
+        state = load_scoring_state(tmp_path, SEASON)
+
+        assert state is not None and state.plays_version == version
+        _assert_same(state, build_scoring_state(plays, rosters, season=SEASON, positions_version="p"))
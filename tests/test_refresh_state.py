@@ -0,0 +1,69 @@
+"""
+Per-game refresh state (src/refresh.py): freezing and thawing across refreshes.
+refresh_pbp is replaced by a stub that serves a fixed max play_id per game.
+"""
+import time
+
+import pandas as pd
+import pytest
+
+import src.pbp.refresh_pbp as refresh_pbp_module
+import src.refresh as rf
+from src.pbp.refresh_pbp import RefreshResult as PbpResult
+from src.pbp.sources import GameSourceMetrics
+
+INACTIVE_S = 2
+
+
+@pytest.fixture
+def feed(monkeypatch, tmp_path):
+    """
+    {game_id: max play_id served}; the game ids of each fetch are recorded
+    under "calls".
+    """
+    feed = {"calls": []}
+
+    def fake_refresh_pbp(*, game_ids, **_):
+        feed["calls"].append(list(game_ids))
+        max_play_ids = {g: feed[g] for g in game_ids}
+        sources = tuple(GameSourceMetrics(g, "gtd", "live", "ok", 10, 1.0) for g in game_ids)
+        return PbpResult(
+            rows_in=10, rows_scoring=1, rows_out=1, any_loaded=True, max_play_ids=max_play_ids, game_sources=sources
+        )
+
+    monkeypatch.setattr(refresh_pbp_module, "refresh_pbp", fake_refresh_pbp)
+    monkeypatch.setattr(rf, "_final_game_ids", lambda season, game_ids: set())
+    return feed
+
+
+def _refresh(tmp_path):
+    rf.refresh_playoff_games(
+        season=2024,
+        playoff_game_ids=["g1"],
+        cumulative_out_path=tmp_path / "scoring_plays.csv",
+        metrics_out_path=tmp_path / "metrics.csv",
+        state_path=tmp_path / "state.csv",
+        lock_path=tmp_path / ".refresh.lock",
+        inactive_seconds=INACTIVE_S,
+        reuse_within_s=0,
+    )
+    return pd.read_csv(tmp_path / "state.csv").set_index("game_id").loc["g1"]
+
+
+def test_inactive_game_is_rechecked_and_thaws_on_new_pbp(feed, tmp_path):
+    feed["g1"] = 10
+    assert not _refresh(tmp_path)["is_frozen"]
+
+    # Quiet for inactive_seconds: frozen, and skipped until a re-check is due.
+    time.sleep(INACTIVE_S + 0.1)
+    state = _refresh(tmp_path)
+    assert state["is_frozen"] and state["freeze_reason"] == "inactive"
+    _refresh(tmp_path)
+    assert feed["calls"] == [["g1"], ["g1"]]
+
+    # The re-check finds new pbp (play resumed): thawed.
+    time.sleep(INACTIVE_S + 0.1)
+    feed["g1"] = 25
+    state = _refresh(tmp_path)
+    assert len(feed["calls"]) == 3
+    assert not state["is_frozen"] and state["last_max_play_id"] == 25
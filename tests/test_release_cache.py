@@ -0,0 +1,103 @@
+"""
+Season release cache (src/pbp/release_cache.py) against a local file-served
+stand-in for the release host, selected through BBB_PBP_RELEASE_URL. The
+stand-in is http.server's static file handler, which answers If-Modified-Since
+with 304.
+"""
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.pbp.release_cache import ensure_season_pbp_cached, release_paths
+
+SEASON = 2024
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.headers.get("If-Modified-Since"))
+        super().do_GET()
+
+
+@pytest.fixture
+def release_host(monkeypatch, tmp_path):
+    root = tmp_path / "host"
+    root.mkdir()
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_Handler, directory=str(root)))
+    srv.requests, srv.root = [], root
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    monkeypatch.setenv(
+        "BBB_PBP_RELEASE_URL", f"http://127.0.0.1:{srv.server_address[1]}/play_by_play_{{season}}.parquet"
+    )
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _publish(host, body: bytes, mtime: float) -> None:
+    path = host.root / f"play_by_play_{SEASON}.parquet"
+    path.write_bytes(body)
+    os.utime(path, (mtime, mtime))
+
+
+def _ensure(cache_dir, **kwargs):
+    kwargs.setdefault("min_check_interval_s", 0)
+    return ensure_season_pbp_cached(SEASON, cache_dir=cache_dir, timeout_s=2.0, **kwargs)
+
+
+def test_download_then_conditional_checks(release_host, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _publish(release_host, b"v1", 1_700_000_000)
+
+    first = _ensure(cache_dir)
+    assert first.status == "downloaded" and first.path.read_bytes() == b"v1"
+    assert first.last_modified and len(release_host.requests) == 1
+
+    # Checked recently: trusted without a request.
+    assert _ensure(cache_dir, min_check_interval_s=300).status == "fresh"
+    assert len(release_host.requests) == 1
+
+    # Due for a check: conditional GET, 304, cached file kept.
+    again = _ensure(cache_dir)
+    assert again.status == "not_modified" and again.path.read_bytes() == b"v1"
+    assert release_host.requests[-1] == first.last_modified
+
+    # Upstream published a newer file: pulled again.
+    _publish(release_host, b"v2", 1_700_003_600)
+    updated = _ensure(cache_dir)
+    assert updated.status == "downloaded" and updated.path.read_bytes() == b"v2"
+    assert updated.last_modified != first.last_modified
+    parquet_path, meta_path = release_paths(SEASON, cache_dir)
+    assert meta_path.exists() and not parquet_path.with_suffix(".parquet.tmp").exists()
+
+
+def test_stale_copy_is_served_when_the_host_is_down(release_host, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _publish(release_host, b"v1", 1_700_000_000)
+    _ensure(cache_dir)
+    release_host.shutdown()
+    release_host.server_close()
+
+    stale = _ensure(cache_dir)
+
+    assert stale.status == "stale_fallback" and stale.path.read_bytes() == b"v1"
+    assert "Request failed" in stale.detail
+
+
+def test_no_cache_and_host_down_raises(release_host, tmp_path):
+    release_host.shutdown()
+    release_host.server_close()
+
+    with pytest.raises(RuntimeError, match="Request failed"):
+        _ensure(tmp_path / "cache")
+
+
+def test_missing_release_without_cache_raises(release_host, tmp_path):
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        _ensure(tmp_path / "cache")
@@ -0,0 +1,146 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.pbp import schedule
+
+SEASON = 2024
+
+
+def _raw_schedule() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "game_id": ["2024_19_DEN_BUF", "2024_19_PIT_BAL", "2024_20_WAS_DET"],
+            "old_game_id": [2025011200.0, 2025011101.0, None],
+            "week": [19, 19, 20],
+            "gameday": ["2025-01-12", "2025-01-11", "2025-01-18"],
+            "gametime": ["13:00", "20:00", "16:30"],
+            "home_team": ["BUF", "BAL", "DET"],
+            "away_team": ["DEN", "PIT", "WAS"],
+            "home_score": [31, 28, None],
+            "away_score": [7, 14, None],
+        }
+    )
+
+
+@pytest.fixture
+def loads(monkeypatch, tmp_path):
+    """
+    Counts calls to a stubbed nflreadpy schedule download; the default on-disk
+    cache (data/processed) resolves under tmp_path.
+    """
+    calls = []
+
+    def fake_load(season: int) -> pd.DataFrame:
+        calls.append(season)
+        return _raw_schedule()
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(schedule, "load_schedules", fake_load)
+    schedule.clear_schedule_index_cache()
+    yield calls
+    schedule.clear_schedule_index_cache()
+
+
+def test_lookups_share_one_download(loads):
+    before = schedule.schedule_load_count()
+
+    assert schedule.event_id_for_game_id(SEASON, "2024_19_DEN_BUF") == "2025011200"
+    assert schedule.gsis_for_game_id(SEASON, "2024_19_PIT_BAL") == "2025011101"
+    assert schedule.event_id_for_game_id(SEASON, "2024_20_WAS_DET") is None
+    assert schedule.game_id_to_event_id_map(SEASON) == {
+        "2024_19_DEN_BUF": "2025011200",
+        "2024_19_PIT_BAL": "2025011101",
+    }
+    assert schedule.resolve_game_ids_for_week(SEASON, 19) == ["2024_19_DEN_BUF", "2024_19_PIT_BAL"]
+
+    assert schedule.schedule_load_count() - before == 1
+    assert loads == [SEASON]
+
+
+def test_index_fields(loads):
+    idx = schedule.get_schedule_index(SEASON)
+    g = idx.game("2024_19_DEN_BUF")
+    assert (g.home_team, g.away_team, g.home_score, g.away_score) == ("BUF", "DEN", 31, 7)
+    assert g.kickoff_utc == "2025-01-12T18:00:00Z"
+    assert g.has_result
+    assert not idx.game("2024_20_WAS_DET").has_result
+
+
+def test_disk_copy_is_used_after_memory_is_cleared(loads, tmp_path):
+    schedule.get_schedule_index(SEASON)
+    assert (tmp_path / "data/processed" / f"schedule_index_{SEASON}.csv").exists()
+    before = schedule.schedule_load_count()
+
+    schedule.clear_schedule_index_cache()
+    idx = schedule.get_schedule_index(SEASON)
+
+    assert schedule.schedule_load_count() == before
+    assert idx.event_id("2024_19_DEN_BUF") == "2025011200"
+    assert len(loads) == 1
+
+
+def test_expired_index_is_downloaded_again(loads):
+    schedule.get_schedule_index(SEASON)
+    before = schedule.schedule_load_count()
+
+    schedule.get_schedule_index(SEASON, ttl_s=0)
+
+    assert schedule.schedule_load_count() == before + 1
+    assert len(loads) == 2
+
+
+def test_failed_download_falls_back_to_stale_copy(loads, monkeypatch):
+    first = schedule.get_schedule_index(SEASON)
+
+    def broken(season: int) -> pd.DataFrame:
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(schedule, "load_schedules", broken)
+    before = schedule.schedule_load_count()
+
+    assert schedule.get_schedule_index(SEASON, ttl_s=0) is first
+    assert schedule.schedule_load_count() == before
+
+
+def test_failed_download_is_not_retried_until_the_retry_time(loads, monkeypatch):
+    first = schedule.get_schedule_index(SEASON)
+    attempts = []
+
+    def broken(season: int) -> pd.DataFrame:
+        attempts.append(season)
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(schedule, "load_schedules", broken)
+    assert all(schedule.get_schedule_index(SEASON, ttl_s=0) is first for _ in range(5))
+    assert attempts == [SEASON]
+
+    clock = time.time() + schedule.SCHEDULE_RETRY_AFTER_FAILURE_S + 1
+    monkeypatch.setattr(schedule, "time", SimpleNamespace(time=lambda: clock))
+    assert schedule.get_schedule_index(SEASON, ttl_s=0) is first
+    assert attempts == [SEASON, SEASON]
+
+
+def test_download_does_not_block_other_seasons(loads, monkeypatch):
+    other = schedule.get_schedule_index(SEASON - 1)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_load(season: int) -> pd.DataFrame:
+        started.set()
+        release.wait(5)
+        return _raw_schedule()
+
+    monkeypatch.setattr(schedule, "load_schedules", slow_load)
+    downloader = threading.Thread(target=schedule.get_schedule_index, args=(SEASON,))
+    downloader.start()
+    try:
+        assert started.wait(5)
+        t = time.perf_counter()
+        assert schedule.get_schedule_index(SEASON - 1) is other
+        assert time.perf_counter() - t < 1.0
+    finally:
+        release.set()
+        downloader.join(5)
@@ -0,0 +1,109 @@
+"""
+Single-flight refresh (src/refresh.py) with several processes contending for
+the refresh lock. refresh_pbp is replaced by a slow stub that logs each call,
+so the tests count real refreshes.
+"""
+import multiprocessing as mp
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import src.pbp.refresh_pbp as refresh_pbp_module
+import src.refresh as rf
+from src.pbp.refresh_pbp import RefreshResult as PbpResult
+
+REFRESH_S = 0.5
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in mp.get_all_start_methods(), reason="needs the fork start method"
+)
+
+
+
+def _worker(root: str, results, delay_s: float, wait_timeout_s: float, fail_first: bool) -> None:
+    # Runs in a forked child, so patching the modules does not leak into the test process.
+    root_p = Path(root)
+
+    def slow_refresh_pbp(**_):
+        with open(root_p / "calls.log", "a") as f:
+            f.write(f"{os.getpid()}\n")
+        time.sleep(REFRESH_S)
+        if fail_first and not (root_p / "failed").exists():
+            (root_p / "failed").write_text("x")
+            raise RuntimeError("upstream down")
+        return PbpResult(rows_in=5, rows_scoring=2, rows_out=10, any_loaded=True, rows_before=8, changed_games=("g1",))
+
+    refresh_pbp_module.refresh_pbp = slow_refresh_pbp
+    rf._final_game_ids = lambda season, game_ids: set()
+
+    time.sleep(delay_s)
+    try:
+        r = rf.refresh_playoff_games(
+            season=2024,
+            playoff_game_ids=["g1", "g2"],
+            cumulative_out_path=root_p / "scoring_plays.csv",
+            metrics_out_path=root_p / "metrics.csv",
+            state_path=root_p / "state.csv",
+            lock_path=root_p / ".refresh.lock",
+            wait_timeout_s=wait_timeout_s,
+        )
+        results.put(("ok", r.coalesced, r.new_rows))
+    except Exception as e:
+        results.put((type(e).__name__, None, None))
+
+
+def _contend(root: Path, n: int, *, wait_timeout_s: float = 10.0, fail_first: bool = False) -> list[tuple]:
+    ctx = mp.get_context("fork")
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker, args=(str(root), results, 0.05 * i, wait_timeout_s, fail_first))
+        for i in range(n)
+    ]
+    for p in procs:
+        p.start()
+    out = [results.get(timeout=30) for _ in procs]
+    for p in procs:
+        p.join(timeout=30)
+    return sorted(out, key=repr)
+
+
+def _calls(root: Path) -> int:
+    path = root / "calls.log"
+    return len(path.read_text().splitlines()) if path.exists() else 0
+
+
+def test_concurrent_callers_share_one_refresh(tmp_path):
+    out = _contend(tmp_path, 6)
+
+    assert _calls(tmp_path) == 1
+    assert all(status == "ok" and new_rows == 2 for status, _, new_rows in out)
+    assert sum(1 for _, coalesced, _ in out if coalesced) == 5
+    assert not (tmp_path / ".refresh.lock").exists()
+
+
+def test_recent_result_is_reused_without_refetching(tmp_path):
+    _contend(tmp_path, 2)
+    calls = _calls(tmp_path)
+
+    out = _contend(tmp_path, 3)
+
+    assert _calls(tmp_path) == calls
+    assert all(status == "ok" and coalesced for status, coalesced, _ in out)
+
+
+def test_waiters_take_over_when_the_leader_fails(tmp_path):
+    out = _contend(tmp_path, 4, fail_first=True)
+
+    assert _calls(tmp_path) == 2
+    assert [status for status, _, _ in out].count("RuntimeError") == 1
+    assert [status for status, _, _ in out].count("ok") == 3
+
+
+def test_wait_is_bounded(tmp_path):
+    out = _contend(tmp_path, 3, wait_timeout_s=REFRESH_S / 5)
+
+    assert _calls(tmp_path) == 1
+    assert [status for status, _, _ in out].count("ok") == 1
+    assert [status for status, _, _ in out].count("RefreshInProgress") == 2
@@ -0,0 +1,71 @@
+"""
+src/pbp/sources.py: normalizing GTD and release frames to one schema, and
+routing games between the two sources.
+"""
+import warnings
+
+import pandas as pd
+import pytest
+
+from src.pbp import sources
+from src.pbp.live_pbp import LiveGameMetrics
+from src.pbp.schedule import ScheduledGame, ScheduleIndex
+from src.pbp.sources import normalize_pbp
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (["2025-01-12T23:30:00-05:00", "2025-01-13T01:00:00Z"], ["2025-01-12", "2025-01-13"]),
+        (["2025-01-12", "2025-01-13T01:00:00Z"], ["2025-01-12", "2025-01-13"]),
+        (["2025-01-12 20:00:00", "not a date"], ["2025-01-12", "not a date"]),
+    ],
+)
+def test_game_date_keeps_each_value_local_date(raw, expected):
+    pbp = pd.DataFrame({"game_id": ["2024_19_DEN_BUF"] * 2, "game_date": raw})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        out = normalize_pbp(pbp, season=2024)
+
+    assert out["game_date"].tolist() == expected
+    assert out["week"].tolist() == [19, 19]
+
+
+def test_release_failure_still_fetches_gtd(monkeypatch):
+    """
+    With the release unavailable, its games are reported as errors, finals fall
+    back to GTD, and the live games load as usual.
+    """
+    games = {
+        "2024_19_DEN_BUF": ScheduledGame("2024_19_DEN_BUF", "2025011200", 19, None, "BUF", "DEN", 31, 7),
+        "2024_20_WAS_DET": ScheduledGame("2024_20_WAS_DET", "2025011900", 20, None, "DET", "WAS", None, None),
+        "2024_20_HOU_KC": ScheduledGame("2024_20_HOU_KC", None, 20, None, "KC", "HOU", None, None),
+    }
+    index = ScheduleIndex(season=2024, built_at=0.0, games=games)
+    gtd_calls = []
+
+    def no_release(*, season, game_ids, cache_dir):
+        raise RuntimeError("no cached release and download failed")
+
+    def fake_gtd(*, season, game_ids, pending):
+        gtd_calls.append(list(game_ids))
+        pbp = pd.DataFrame({"game_id": game_ids, "play_id": [1] * len(game_ids), "game_date": "2025-01-19"})
+        live = [
+            LiveGameMetrics(g, games[g].event_id, 1, 1, False, "t", "ok", fetch_ms=1.0) for g in game_ids
+        ]
+        return pbp, live
+
+    monkeypatch.setattr(sources, "fetch_pbp_for_game_ids_via_nflreadpy", no_release)
+    monkeypatch.setattr(sources, "fetch_live_pbp_for_game_ids", fake_gtd)
+
+    pbp, metrics = sources.fetch_pbp_by_source(season=2024, game_ids=list(games), index=index)
+
+    assert gtd_calls == [["2024_19_DEN_BUF", "2024_20_WAS_DET"]]
+    assert sorted(pbp["game_id"]) == ["2024_19_DEN_BUF", "2024_20_WAS_DET"]
+    by_game = {m.game_id: m for m in metrics}
+    assert (by_game["2024_19_DEN_BUF"].reason, by_game["2024_19_DEN_BUF"].status) == ("release_lag", "ok")
+    assert by_game["2024_20_WAS_DET"].loaded
+    no_event = by_game["2024_20_HOU_KC"]
+    assert (no_event.source, no_event.status) == (sources.SOURCE_RELEASE, "error")
+    assert "download failed" in no_event.detail